@@ -0,0 +1,85 @@
+"""Time load_config on a generated config with thousands of feeds.
+
+Run from the project root:
+
+    python benchmarks/bench_config_load.py --feeds 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import yaml  # noqa: E402
+
+from daily_digest_bot import config as config_module  # noqa: E402
+
+
+def _generated_config(feeds: int) -> str:
+    lines = ["sections:"]
+    for section in range(4):
+        lines += [f"  - name: s{section}", f"    title: Section {section}", "    feeds:"]
+        for idx in range(section, feeds, 4):
+            lines += [
+                f"      - name: Feed {idx}",
+                f"        url: https://feed{idx}.example.com/rss.xml",
+                "        read_timeout: 10",
+            ]
+    lines.append("source_weights:")
+    lines += [f"  Feed {idx}: {1 + (idx % 7) / 10}" for idx in range(feeds)]
+    lines += [
+        "keywords: [election, budget, monsoon]",
+        "email:",
+        "  from_email: a@example.com",
+        "  to_email: b@example.com",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _median_ms(run: Callable[[], object], repeats: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 2)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.yaml"
+        path.write_text(_generated_config(args.feeds), encoding="utf-8")
+        text = path.read_text(encoding="utf-8")
+        results = {
+            "feeds": args.feeds,
+            "yaml_bytes": len(text.encode("utf-8")),
+            "libyaml": bool(getattr(yaml, "__with_libyaml__", False)),
+            "safe_loader_ms": _median_ms(
+                lambda: yaml.load(text, Loader=yaml.SafeLoader), args.repeats
+            ),
+            "uncached_load_ms": _median_ms(
+                lambda: config_module.load_config(str(path), use_cache=False), args.repeats
+            ),
+        }
+        config_module.load_config(str(path))
+        results["cached_load_ms"] = _median_ms(
+            lambda: config_module.load_config(str(path)), args.repeats
+        )
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
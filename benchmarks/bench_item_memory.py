@@ -0,0 +1,97 @@
+"""Measure per-item memory of NewsItem against the previous dataclass layout.
+
+Run from the project root:
+
+    python benchmarks/bench_item_memory.py --items 50000
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import gc
+import json
+import sys
+from pathlib import Path
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from daily_digest_bot.feeds import NewsItem  # noqa: E402
+
+SOURCES = ["BBC World", "Reuters World", "The Hindu National", "Indian Express India"]
+
+
+@dataclass
+class DataclassNewsItem:
+    """The pre-slots NewsItem layout, kept here as the comparison baseline."""
+
+    title: str
+    link: str
+    published_at: datetime
+    source: str
+    summary: str
+    date_missing: bool = False
+    score: float = field(default=0.0)
+
+
+def _source_name(idx: int) -> str:
+    # Built at runtime, like names parsed from config, so they are not
+    # already shared constants.
+    return "".join(SOURCES[idx % len(SOURCES)])
+
+
+def _build_dataclass(idx: int, base: datetime) -> DataclassNewsItem:
+    return DataclassNewsItem(
+        title=f"Story headline number {idx}",
+        link=f"https://example.com/news/{idx}",
+        published_at=base - timedelta(minutes=idx),
+        source=_source_name(idx),
+        summary=f"Summary text for story {idx}.",
+    )
+
+
+def _build_slotted(idx: int, base: datetime) -> NewsItem:
+    return NewsItem(
+        title=f"Story headline number {idx}",
+        link=f"https://example.com/news/{idx}",
+        published_at=base - timedelta(minutes=idx),
+        source=_source_name(idx),
+        raw_summary=f"Summary text for story {idx}.",
+    )
+
+
+def measure(build: Callable[[int, datetime], object], count: int) -> float:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    gc.collect()
+    tracemalloc.start()
+    items: List[object] = [build(idx, base) for idx in range(count)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    args = parser.parse_args()
+    before = measure(_build_dataclass, args.items)
+    after = measure(_build_slotted, args.items)
+    print(
+        json.dumps(
+            {
+                "items": args.items,
+                "bytes_per_item_dataclass": round(before, 1),
+                "bytes_per_item_slotted": round(after, 1),
+                "reduction_pct": round(100 * (before - after) / before, 1),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
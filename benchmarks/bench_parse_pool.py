@@ -0,0 +1,80 @@
+"""Compare in-process feed parsing with the process-pool parse stage.
+
+Run from the project root, either on saved feeds or a synthetic corpus:
+
+    python benchmarks/bench_parse_pool.py --corpus path/to/saved_feeds
+    python benchmarks/bench_parse_pool.py --feeds 64 --entries 200 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from corpus import load_corpus, synthetic_corpus  # noqa: E402
+from daily_digest_bot.config import FeedConfig  # noqa: E402
+from daily_digest_bot.feeds import (  # noqa: E402
+    _parse_buffered,
+    _parse_to_rows,
+    _rows_to_items,
+    open_parse_pool,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="Directory of saved .xml feeds")
+    parser.add_argument("--feeds", type=int, default=64)
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.feeds, args.entries)
+    if not corpus:
+        parser.error("corpus is empty")
+    configs = [FeedConfig(name=name, url=f"https://example.com/{name}") for name, _ in corpus]
+    now = datetime.now(timezone.utc)
+
+    start = time.perf_counter()
+    inline = [_parse_buffered(body, feed, now) for feed, (_, body) in zip(configs, corpus)]
+    inline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open_parse_pool(args.workers) as pool:
+        futures = [
+            pool.submit(_parse_to_rows, body, feed, now) for feed, (_, body) in zip(configs, corpus)
+        ]
+        pooled = [
+            _rows_to_items(future.result()[0], feed, now) for feed, future in zip(configs, futures)
+        ]
+    pooled_seconds = time.perf_counter() - start
+
+    assert [len(items) for items in pooled] == [len(items) for items in inline]
+    entries = sum(len(items) for items in inline)
+    print(
+        json.dumps(
+            {
+                "feeds": len(corpus),
+                "entries": entries,
+                "bytes": sum(len(body) for _, body in corpus),
+                "workers": args.workers,
+                "in_process_seconds": round(inline_seconds, 4),
+                "process_pool_seconds": round(pooled_seconds, 4),
+                "speedup": round(inline_seconds / pooled_seconds, 2) if pooled_seconds else None,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+"""Time the fetch, rank, canonical, dedupe and render stages on recorded feed fixtures.
+
+The fixtures in ``benchmarks/fixtures`` are expanded to each requested scale
+and served from a local HTTP server, so ``fetch_feeds`` runs its real session,
+parsing and item building without touching the network. Run from the project
+root:
+
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --scales 100 1000 --repeats 5 --output bench.json
+
+The report is JSON: one record per (scale, stage) with throughput, p50/p95
+latency and the tracemalloc peak of a separate traced run. Compare reports
+from two versions to spot regressions.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import gc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+from pathlib import Path
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Mapping, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from corpus import FIXTURE_DIR, fixture_corpus  # noqa: E402
+from daily_digest_bot.config import FeedConfig  # noqa: E402
+from daily_digest_bot.dedupe import collapse_duplicates, dedupe_items  # noqa: E402
+from daily_digest_bot.feeds import NewsItem, fetch_feeds  # noqa: E402
+from daily_digest_bot.keywords import KeywordMatcher  # noqa: E402
+from daily_digest_bot.ranker import rank_items  # noqa: E402
+from daily_digest_bot.render import render_email  # noqa: E402
+
+DEFAULT_SCALES = (100, 1_000, 10_000, 100_000)
+MAX_ENTRIES_PER_FEED = 500
+# The fixtures are dated 2 January 2024; rank against a fixed clock so the
+# recency scores, and therefore the dedupe input order, are reproducible.
+BENCH_NOW = datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)
+KEYWORDS = ["election", "budget", "monsoon", "court", "markets", "summit"]
+SOURCE_WEIGHTS = {"world_rss-2": 1.2, "india_rss-0": 1.1}
+
+
+class _FixtureServer:
+    """Serve ``{path: body}`` from a background ``ThreadingHTTPServer``."""
+
+    def __init__(self, documents: Mapping[str, bytes]) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                body = documents.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "_FixtureServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _layout(scale: int) -> Tuple[int, int]:
+    """Split ``scale`` items into ``(feeds, entries per feed)``."""
+    feeds = max(3, math.ceil(scale / MAX_ENTRIES_PER_FEED))
+    return feeds, math.ceil(scale / feeds)
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def _measure(
+    run: Callable[[], int], repeats: int, trace_memory: bool
+) -> Dict[str, object]:
+    """Time ``repeats`` calls of ``run`` (which returns items processed)."""
+    timings: List[float] = []
+    processed = 0
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        processed = run()
+        timings.append(time.perf_counter() - start)
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    p50 = statistics.median(timings)
+    return {
+        "items": processed,
+        "repeats": repeats,
+        "p50_seconds": round(p50, 6),
+        "p95_seconds": round(_percentile(timings, 95), 6),
+        "min_seconds": round(min(timings), 6),
+        "items_per_second": round(processed / p50, 1) if p50 else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _bench_scale(
+    scale: int, repeats: int, trace_memory: bool, workers: int, per_host_limit: int
+) -> Iterator[Dict[str, object]]:
+    feeds, entries = _layout(scale)
+    corpus = fixture_corpus(feeds, entries)
+    documents = {f"/{name}.xml": body for name, body in corpus}
+    matcher = KeywordMatcher(KEYWORDS)
+    with _FixtureServer(documents) as server:
+        configs = [
+            FeedConfig(name=name, url=f"{server.base_url}/{name}.xml") for name, _ in corpus
+        ]
+        items: List[NewsItem] = []
+
+        def fetch() -> int:
+            items[:] = fetch_feeds(configs, max_workers=workers, per_host_limit=per_host_limit)
+            return len(items)
+
+        stage = _measure(fetch, repeats, trace_memory)
+        stage["bytes"] = sum(len(body) for body in documents.values())
+        stage["feeds"] = feeds
+        yield {"scale": scale, "stage": "fetch_feeds", **stage}
+
+    ranked: List[NewsItem] = []
+
+    def rank() -> int:
+        ranked[:] = rank_items(items, SOURCE_WEIGHTS, matcher, now=BENCH_NOW)
+        return len(ranked)
+
+    yield {"scale": scale, "stage": "rank_items", **_measure(rank, repeats, trace_memory)}
+
+    unique: List[NewsItem] = []
+
+    def canonical() -> int:
+        unique[:] = collapse_duplicates(ranked)
+        return len(ranked)
+
+    stage = _measure(canonical, repeats, trace_memory)
+    stage["kept"] = len(unique)
+    yield {"scale": scale, "stage": "collapse_duplicates", **stage}
+
+    kept: List[NewsItem] = []
+
+    def dedupe() -> int:
+        kept[:] = dedupe_items(unique)
+        return len(unique)
+
+    stage = _measure(dedupe, repeats, trace_memory)
+    stage["kept"] = len(kept)
+    yield {"scale": scale, "stage": "dedupe_items", **stage}
+
+    def render() -> int:
+        render_email([("Benchmark", kept)], BENCH_NOW)
+        return len(kept)
+
+    yield {"scale": scale, "stage": "render_email", **_measure(render, repeats, trace_memory)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8, help="fetch_feeds max_workers")
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=8,
+        help="All fixtures share one local host, so this caps fetch concurrency",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the traced run used for peak memory"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here as well")
+    args = parser.parse_args()
+    if args.repeats < 1 or any(scale < 1 for scale in args.scales):
+        parser.error("--repeats and --scales must be positive")
+
+    results: List[Dict[str, object]] = []
+    for scale in args.scales:
+        for record in _bench_scale(
+            scale, args.repeats, not args.no_memory, args.workers, args.per_host_limit
+        ):
+            results.append(record)
+            print(
+                f"[info] {record['stage']} @ {scale}: p50 {record['p50_seconds']}s",
+                file=sys.stderr,
+            )
+
+    report = {
+        "benchmark": "pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixtures": sorted(path.name for path in FIXTURE_DIR.glob("*.xml")),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
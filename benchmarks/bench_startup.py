@@ -0,0 +1,125 @@
+"""Measure CLI startup: wall time and ``-X importtime`` cost per command.
+
+Run from the project root:
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --max-import-ms 80
+
+Each command is started ``--runs`` times in a fresh interpreter. The report
+gives the wall-clock p50/p95, the cumulative import time of
+``daily_digest_bot.main`` and the slowest modules by self time. With
+``--max-import-ms`` the script exits non-zero when the median import time of
+any command exceeds the budget, so it can guard startup in CI.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+COMMANDS: Dict[str, Sequence[str]] = {
+    "help": ("--help",),
+    "check_config": ("--check-config", "--config", str(ROOT / "config.yaml")),
+}
+ENTRY_MODULE = "daily_digest_bot.main"
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Return ``(module, self_us, cumulative_us)`` for every import line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _run_once(args: Sequence[str]) -> Tuple[float, List[Tuple[str, int, int]]]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "daily_digest_bot", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"{' '.join(args)} failed:\n{result.stdout}{result.stderr}")
+    return elapsed, _parse_importtime(result.stderr)
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(int(round(pct / 100 * len(ordered))) - 1, 0)]
+
+
+def _bench_command(args: Sequence[str], runs: int, top: int) -> Dict[str, object]:
+    walls: List[float] = []
+    entry_us: List[int] = []
+    self_times: Dict[str, List[int]] = {}
+    for _ in range(runs):
+        wall, rows = _run_once(args)
+        walls.append(wall)
+        entry_us.append(next((cum for name, _, cum in rows if name == ENTRY_MODULE), 0))
+        for name, self_us, _ in rows:
+            self_times.setdefault(name, []).append(self_us)
+    slowest = sorted(
+        ((name, statistics.median(values)) for name, values in self_times.items()),
+        key=lambda pair: pair[1],
+        reverse=True,
+    )[:top]
+    return {
+        "args": list(args),
+        "runs": runs,
+        "wall_p50_ms": round(statistics.median(walls) * 1000, 2),
+        "wall_p95_ms": round(_percentile(walls, 95) * 1000, 2),
+        "import_ms": round(statistics.median(entry_us) / 1000, 2),
+        "modules": len(self_times),
+        "slowest_modules": [
+            {"module": name, "self_ms": round(us / 1000, 2)} for name, us in slowest
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=None,
+        help=f"Fail when the median import time of {ENTRY_MODULE} exceeds this",
+    )
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    results = {
+        name: _bench_command(command, args.runs, args.top) for name, command in COMMANDS.items()
+    }
+    print(json.dumps({"benchmark": "startup", "results": results}, indent=2))
+    if args.max_import_ms is not None:
+        over = [name for name, result in results.items() if result["import_ms"] > args.max_import_ms]
+        if over:
+            print(
+                f"[error] import time over {args.max_import_ms} ms: {', '.join(over)}",
+                file=sys.stderr,
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Compare per-subscriber ranking: full re-scoring vs a shared ScoringBase.
+
+Run from the project root:
+
+    python benchmarks/bench_subscribers.py --subscribers 1000 --items 2000
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from corpus import WORDS, synthetic_corpus  # noqa: E402
+from daily_digest_bot.config import FeedConfig  # noqa: E402
+from daily_digest_bot.dedupe import select_top_k  # noqa: E402
+from daily_digest_bot.feeds import _parse_buffered  # noqa: E402
+from daily_digest_bot.keywords import KeywordMatcher  # noqa: E402
+from daily_digest_bot.ranker import ScoringBase, score_items  # noqa: E402
+
+NOW = datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument(
+        "--keyword-lists",
+        type=int,
+        default=50,
+        help="Distinct keyword lists shared among the subscribers",
+    )
+    args = parser.parse_args()
+
+    feeds = max(args.items // 200, 1)
+    items = [
+        item
+        for name, body in synthetic_corpus(feeds, args.items // feeds)
+        for item in _parse_buffered(body, FeedConfig(name=name, url=f"https://{name}"), NOW)
+    ]
+    rng = random.Random(7)
+    matchers = [KeywordMatcher(rng.sample(WORDS, 3)) for _ in range(args.keyword_lists)]
+    sources = sorted({item.source for item in items})
+    profiles = [
+        (
+            {source: rng.uniform(0.5, 1.5) for source in rng.sample(sources, min(3, len(sources)))},
+            rng.choice(matchers),
+        )
+        for _ in range(args.subscribers)
+    ]
+
+    start = time.perf_counter()
+    naive = []
+    for weights, matcher in profiles:
+        scored = score_items(items, weights, matcher, now=NOW, engine="batch")
+        naive.append(select_top_k(scored, args.limit))
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    base = ScoringBase(items, now=NOW)
+    keys = [None] * len(base)
+    shared = [
+        select_top_k(base.items, args.limit, scores=base.scores(weights, matcher), keys=keys)
+        for weights, matcher in profiles
+    ]
+    shared_seconds = time.perf_counter() - start
+
+    same = sum(
+        [i.link for i in a] == [i.link for i in b] for a, b in zip(naive, shared)
+    )
+    print(
+        json.dumps(
+            {
+                "subscribers": args.subscribers,
+                "items": len(items),
+                "keyword_lists": args.keyword_lists,
+                "full_rescore_seconds": round(naive_seconds, 4),
+                "shared_base_seconds": round(shared_seconds, 4),
+                "speedup": round(naive_seconds / shared_seconds, 2) if shared_seconds else None,
+                "identical_digests": same,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+"""Feed corpora shared by the benchmark scripts."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from pathlib import Path
+import random
+import re
+from typing import List, Sequence, Tuple
+
+WORDS = (
+    "election minister court ruling markets rally monsoon forecast budget trade "
+    "talks summit ceasefire border policy economy inflation vote protest storm"
+).split()
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_BLOCK_RE = re.compile(rb"<(item|entry)\b.*?</\1>", re.S)
+_TITLE_RE = re.compile(rb"<title>(.*?)</title>", re.S)
+_RSS_LINK_RE = re.compile(rb"<link>(.*?)</link>", re.S)
+_ATOM_LINK_RE = re.compile(rb'(<link\b[^>]*\bhref=")([^"]*)(")')
+_WORD_RE = re.compile(r"[a-z]{3,}")
+
+
+def synthetic_rss(feed_idx: int, entries: int, base: datetime | None = None) -> bytes:
+    """Build a deterministic RSS 2.0 document with ``entries`` items."""
+    base = base or datetime(2024, 1, 2, tzinfo=timezone.utc)
+    items = []
+    for n in range(entries):
+        words = [WORDS[(feed_idx * 7 + n * k) % len(WORDS)] for k in (1, 3, 5, 11)]
+        title = " ".join(words).capitalize() + f" {feed_idx}-{n}"
+        body = (
+            f"<p>{title}. Officials said on {words[0]} that {words[1]} would follow.</p>"
+            f"<p>Analysts expect {words[2]} and {words[3]} to dominate coverage.</p>"
+        )
+        published = format_datetime(base - timedelta(minutes=17 * n + feed_idx))
+        items.append(
+            "<item>"
+            f"<title>{title}</title>"
+            f"<link>https://news{feed_idx}.example.com/story/{n}?utm_source=rss</link>"
+            f"<description><![CDATA[{body}]]></description>"
+            f"<pubDate>{published}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        f"<title>Feed {feed_idx}</title>{''.join(items)}</channel></rss>"
+    ).encode("utf-8")
+
+
+def load_corpus(directory: Path) -> List[Tuple[str, bytes]]:
+    """Return ``(name, body)`` for every saved ``.xml`` feed in ``directory``."""
+    return [(path.stem, path.read_bytes()) for path in sorted(directory.glob("*.xml"))]
+
+
+def synthetic_corpus(feeds: int, entries: int) -> List[Tuple[str, bytes]]:
+    return [(f"feed{idx}", synthetic_rss(idx, entries)) for idx in range(feeds)]
+
+
+def _vocabulary(fixtures: Sequence[Tuple[str, bytes]]) -> List[str]:
+    """Headline words from the fixtures, widened with two-word compounds.
+
+    A few dozen recorded headlines share too few words to stand in for a
+    100k-item corpus: every title would overlap every other one. Compounds
+    give a vocabulary in the thousands, closer to real headline variety.
+    """
+    words = set(WORDS)
+    for _, body in fixtures:
+        for title in _TITLE_RE.findall(body):
+            text = title.decode("utf-8", "replace").replace("<![CDATA[", "").replace("]]>", "")
+            words.update(_WORD_RE.findall(text.lower()))
+    base = sorted(words)
+    return base + [a + b for a in base for b in base if a != b]
+
+
+def expand_fixture(
+    body: bytes,
+    feed_idx: int,
+    entries: int,
+    vocabulary: Sequence[str],
+    duplicate_ratio: float = 0.1,
+) -> bytes:
+    """Grow a recorded feed to ``entries`` items by cycling its own entries.
+
+    Each copy keeps the recorded markup, dates and description but gets a
+    fresh title drawn from ``vocabulary`` and a unique link. Roughly
+    ``duplicate_ratio`` of the copies reuse an earlier title with one word
+    changed so the dedupe stage has near-duplicates to collapse.
+    """
+    blocks = [match.group(0) for match in _BLOCK_RE.finditer(body)]
+    if not blocks:
+        raise ValueError("fixture has no <item> or <entry> elements")
+    head = body[: body.index(blocks[0])]
+    tail = body[body.rindex(blocks[-1]) + len(blocks[-1]) :]
+    rng = random.Random(feed_idx)
+    titles: List[str] = []
+    copies = []
+    for n in range(entries):
+        if titles and rng.random() < duplicate_ratio:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        else:
+            words = rng.sample(vocabulary, 7)
+        title = " ".join(words).capitalize()
+        titles.append(title)
+        suffix = f"/b{feed_idx}-{n}".encode("ascii")
+        block = blocks[n % len(blocks)]
+        block = _TITLE_RE.sub(
+            b"<title>" + escape(title).encode("utf-8") + b"</title>", block, count=1
+        )
+        block = _RSS_LINK_RE.sub(
+            lambda m: b"<link>" + _unique_link(m.group(1).strip(), suffix) + b"</link>",
+            block,
+            count=1,
+        )
+        block = _ATOM_LINK_RE.sub(
+            lambda m: m.group(1) + _unique_link(m.group(2), suffix) + m.group(3),
+            block,
+            count=1,
+        )
+        copies.append(block)
+    return head + b"".join(copies) + tail
+
+
+def _unique_link(link: bytes, suffix: bytes) -> bytes:
+    # A path segment rather than a fragment, so canonical-URL dedupe keeps
+    # the copies apart.
+    path, sep, query = link.partition(b"?")
+    return path.rstrip(b"/") + suffix + sep + query
+
+
+def fixture_corpus(
+    feeds: int, entries: int, directory: Path = FIXTURE_DIR
+) -> List[Tuple[str, bytes]]:
+    """Expand the recorded fixtures into ``feeds`` feeds of ``entries`` items."""
+    fixtures = load_corpus(directory)
+    if not fixtures:
+        raise ValueError(f"no .xml fixtures in {directory}")
+    vocabulary = _vocabulary(fixtures)
+    corpus = []
+    for idx in range(feeds):
+        name, body = fixtures[idx % len(fixtures)]
+        corpus.append((f"{name}-{idx}", expand_fixture(body, idx, entries, vocabulary)))
+    return corpus
@@ -1,11 +1,22 @@
 __all__ = [
     "config",
     "feeds",
+    "cache",
+    "streaming",
+    "session",
+    "metrics",
+    "keywords",
     "ranker",
     "dedupe",
+    "history",
+    "health",
+    "polling",
+    "archive",
     "render",
     "emailer",
     "main",
+    "schedule",
+    "daemon",
 ]
 
 __version__ = "0.1.0"
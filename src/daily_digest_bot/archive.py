@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timezone
+import json
+import mmap
+from pathlib import Path
+import struct
+import threading
+from typing import Dict, Iterator, List, Mapping, Optional, Union
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+SEGMENT_MAGIC = b"DDARCH01"
+RECORD_MAGIC = b"REC1"
+# magic, compressed metadata length, compressed body length
+_RECORD = struct.Struct("<4sII")
+COMPRESSION_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Index row pointing at one recorded response inside a segment."""
+
+    url: str
+    name: str
+    fetched_at: float
+    status: int
+    offset: int
+    raw_bytes: int
+    stored_bytes: int
+
+
+@dataclass(frozen=True)
+class ArchivedResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    fetched_at: datetime
+
+
+def _segment_date(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%d")
+
+
+class FeedArchive:
+    """Append-only store of raw feed responses, one segment per UTC day.
+
+    ``<directory>/<date>.seg`` starts with ``SEGMENT_MAGIC``; every record is
+    a ``_RECORD`` header followed by the zlib-compressed JSON metadata (URL,
+    feed name, fetch time, status, headers) and the zlib-compressed body.
+    ``<date>.idx`` lists one JSON line per record with its offset, so readers
+    never scan the segment. A record whose index line is missing (the writer
+    died in between) is recovered by ``ArchiveReader`` scanning the segment.
+    Records are written with a single ``write`` per record under a lock.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        url: str,
+        name: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        fetched_at: datetime,
+    ) -> ArchiveEntry:
+        meta = zlib.compress(
+            json.dumps(
+                {
+                    "url": url,
+                    "name": name,
+                    "fetched_at": fetched_at.timestamp(),
+                    "status": status,
+                    "headers": dict(headers),
+                }
+            ).encode("utf-8"),
+            COMPRESSION_LEVEL,
+        )
+        payload = zlib.compress(body, COMPRESSION_LEVEL)
+        record = _RECORD.pack(RECORD_MAGIC, len(meta), len(payload)) + meta + payload
+        stem = _segment_date(fetched_at)
+        segment = self.directory / f"{stem}.seg"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with segment.open("ab") as handle:
+                if handle.tell() == 0:
+                    handle.write(SEGMENT_MAGIC)
+                offset = handle.tell()
+                handle.write(record)
+            entry = ArchiveEntry(
+                url=url,
+                name=name,
+                fetched_at=fetched_at.timestamp(),
+                status=status,
+                offset=offset,
+                raw_bytes=len(body),
+                stored_bytes=len(record),
+            )
+            with (self.directory / f"{stem}.idx").open("a", encoding="utf-8") as index:
+                index.write(json.dumps(asdict(entry)) + "\n")
+            self.recorded += 1
+        return entry
+
+
+def parse_replay_time(value: str) -> datetime:
+    """``YYYY-MM-DD`` means the end of that UTC day; a full ISO time is used as is."""
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(
+                f"--replay expects YYYY-MM-DD or an ISO timestamp, got {value!r}"
+            ) from None
+        return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return datetime.combine(day, time.max, tzinfo=timezone.utc)
+
+
+class ArchiveReader:
+    """Memory-mapped read access to the responses recorded up to ``until``.
+
+    Only the segment of ``until``'s UTC date is opened. For every URL the
+    latest response fetched at or before ``until`` is served. ``now`` is the
+    newest of those fetch times, the moment the replayed run pretends to be.
+    """
+
+    def __init__(self, directory: Path, until: Union[datetime, str]) -> None:
+        if isinstance(until, str):
+            until = parse_replay_time(until)
+        self.until = until
+        self.date = _segment_date(until)
+        path = directory / f"{self.date}.seg"
+        if not path.exists() or path.stat().st_size <= len(SEGMENT_MAGIC):
+            recorded = ", ".join(archive_segments(directory)) or "none"
+            raise ValueError(
+                f"No archived responses for {self.date} in {directory} (recorded: {recorded})"
+            )
+        self._file = path.open("rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a feed archive segment")
+        entries = self._read_index(directory / f"{self.date}.idx")
+        cutoff = until.timestamp()
+        self._latest: Dict[str, ArchiveEntry] = {}
+        for entry in entries:
+            if entry.fetched_at > cutoff:
+                continue
+            current = self._latest.get(entry.url)
+            if current is None or entry.fetched_at >= current.fetched_at:
+                self._latest[entry.url] = entry
+        if not self._latest:
+            self.close()
+            raise ValueError(f"No archived responses at or before {until.isoformat()}")
+        self.now = datetime.fromtimestamp(
+            max(entry.fetched_at for entry in self._latest.values()), timezone.utc
+        )
+
+    def _read_index(self, index_path: Path) -> List[ArchiveEntry]:
+        entries: List[ArchiveEntry] = []
+        if index_path.exists():
+            with index_path.open(encoding="utf-8", errors="replace") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(ArchiveEntry(**json.loads(line)))
+                    except (TypeError, ValueError):
+                        # A partly written line from an interrupted writer;
+                        # anything after it is untrusted.
+                        break
+        # Records past the last good index line (an interrupted write, or no
+        # index at all) are recovered by scanning the tail.
+        indexed_end = max(
+            (entry.offset + entry.stored_bytes for entry in entries), default=len(SEGMENT_MAGIC)
+        )
+        entries.extend(self._scan(indexed_end))
+        return entries
+
+    def _scan(self, offset: int) -> Iterator[ArchiveEntry]:
+        size = len(self._map)
+        while offset + _RECORD.size <= size:
+            magic, meta_len, body_len = _RECORD.unpack_from(self._map, offset)
+            end = offset + _RECORD.size + meta_len + body_len
+            if magic != RECORD_MAGIC or end > size:
+                return
+            meta = self._meta(offset, meta_len)
+            body_start = offset + _RECORD.size + meta_len
+            yield ArchiveEntry(
+                url=meta["url"],
+                name=meta.get("name", ""),
+                fetched_at=meta["fetched_at"],
+                status=meta["status"],
+                offset=offset,
+                raw_bytes=len(zlib.decompress(self._map[body_start:end])),
+                stored_bytes=end - offset,
+            )
+            offset = end
+
+    def _meta(self, offset: int, meta_len: int) -> dict:
+        start = offset + _RECORD.size
+        return json.loads(zlib.decompress(self._map[start : start + meta_len]))
+
+    def urls(self) -> List[str]:
+        return sorted(self._latest)
+
+    def response(self, url: str) -> Optional[ArchivedResponse]:
+        entry = self._latest.get(url)
+        if entry is None:
+            return None
+        magic, meta_len, body_len = _RECORD.unpack_from(self._map, entry.offset)
+        if magic != RECORD_MAGIC:
+            raise ValueError(f"Corrupt archive record for {url} at offset {entry.offset}")
+        meta = self._meta(entry.offset, meta_len)
+        start = entry.offset + _RECORD.size + meta_len
+        return ArchivedResponse(
+            url=url,
+            status=entry.status,
+            headers=meta.get("headers") or {},
+            body=zlib.decompress(self._map[start : start + body_len]),
+            fetched_at=datetime.fromtimestamp(entry.fetched_at, timezone.utc),
+        )
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+class ArchiveSession:
+    """Stand-in for ``requests.Session`` that answers from an ``ArchiveReader``.
+
+    URLs missing from the archive raise ``requests.ConnectionError``, so
+    ``fetch_feeds`` treats them like an unreachable feed.
+    """
+
+    def __init__(self, reader: ArchiveReader) -> None:
+        self.reader = reader
+
+    def get(self, url: str, timeout: object = None, headers: object = None, stream: bool = False):
+        archived = self.reader.response(url)
+        if archived is None:
+            raise requests.ConnectionError(f"{url} is not in the archive for {self.reader.date}")
+        response = requests.Response()
+        response.url = url
+        response.status_code = archived.status
+        response.headers = CaseInsensitiveDict(archived.headers)
+        response._content = archived.body
+        # Marks the body as already read, so iter_content() slices it.
+        response._content_consumed = True
+        return response
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+def archive_segments(directory: Path) -> List[str]:
+    """Dates with a recorded segment, oldest first."""
+    if not directory.exists():
+        return []
+    return sorted(path.stem for path in directory.glob("*.seg"))
+
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import threading
+from typing import Any, Dict, List, Optional
+
+from daily_digest_bot.feeds import NewsItem
+
+CACHE_VERSION = 3
+
+
+@dataclass
+class CacheEntry:
+    etag: str = ""
+    last_modified: str = ""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _item_to_record(item: NewsItem) -> Dict[str, Any]:
+    return {
+        "title": item.title,
+        "link": item.link,
+        "published_ts": None if item.date_missing else item.published_ts,
+        "raw_summary": item.raw_summary,
+    }
+
+
+def _record_to_item(record: Dict[str, Any], source: str, now: datetime) -> NewsItem:
+    published = record.get("published_ts")
+    return NewsItem(
+        title=record.get("title", ""),
+        link=record.get("link", ""),
+        published_at=now if published is None else datetime.fromtimestamp(published, timezone.utc),
+        source=source,
+        date_missing=published is None,
+        raw_summary=record.get("raw_summary", ""),
+    )
+
+
+class FeedCache:
+    """On-disk HTTP validator cache keyed by feed URL.
+
+    Stores the ``ETag`` / ``Last-Modified`` validators of the last successful
+    response together with the entries parsed from it, so a ``304 Not
+    Modified`` can be answered without downloading or re-parsing the feed,
+    or the feed not requested at all when the poll planner defers it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"[warn] Ignoring unreadable feed cache {self.path}: {exc}")
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        for url, raw in (data.get("feeds") or {}).items():
+            self._entries[url] = CacheEntry(
+                etag=raw.get("etag", ""),
+                last_modified=raw.get("last_modified", ""),
+                items=list(raw.get("items") or []),
+            )
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def validators(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def cached_items(self, url: str, source: str, now: datetime) -> Optional[List[NewsItem]]:
+        """Return the entries stored for ``url`` and count a hit, if present."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self.hits += 1
+            records = list(entry.items)
+        return [_record_to_item(record, source, now) for record in records]
+
+    def store(
+        self, url: str, etag: str, last_modified: str, items: List[NewsItem]
+    ) -> None:
+        records = [_item_to_record(item) for item in items]
+        with self._lock:
+            self.misses += 1
+            self._entries[url] = CacheEntry(
+                etag=etag, last_modified=last_modified, items=records
+            )
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {
+                "version": CACHE_VERSION,
+                "feeds": {
+                    url: {
+                        "etag": entry.etag,
+                        "last_modified": entry.last_modified,
+                        "items": entry.items,
+                    }
+                    for url, entry in self._entries.items()
+                },
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import hashlib
+import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+from daily_digest_bot.schedule import CronSchedule
 
 
 @dataclass(frozen=True)
 class FeedConfig:
     name: str
     url: str
+    connect_timeout: float = 5.0
+    read_timeout: float = 12.0
+    max_items: Optional[int] = None
+    max_age_hours: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -20,16 +26,154 @@ class EmailConfig:
     subject_prefix: str
     smtp_host: str = "smtp.gmail.com"
     smtp_port: int = 465
+    # Bulk delivery (``emailer.BulkSender``); rate_per_second 0 is unlimited.
+    connections: int = 1
+    batch_size: int = 50
+    rate_per_second: float = 0.0
+    max_retries: int = 3
+
+
+@dataclass(frozen=True)
+class FetchConfig:
+    max_workers: int = 8
+    per_host_limit: int = 2
+    cache_dir: str = ".cache"
+    http_cache: bool = True
+    retries: int = 2
+    backoff_factor: float = 0.5
+    backoff_jitter: float = 0.3
+    # Longest wait honoured from a 429/503 ``Retry-After`` header.
+    max_retry_after: float = 10.0
+    parser: str = "feedparser"
+    parse_workers: int = 0
+    # Seconds after which the run renders with the feeds that have arrived;
+    # 0 waits for every feed.
+    deadline_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class HistoryConfig:
+    enabled: bool = True
+    path: str = ".cache/seen.sqlite3"
+    ttl_hours: float = 72.0
+    mode: str = "drop"
+    penalty: float = 0.3
+
+
+@dataclass(frozen=True)
+class DedupeConfig:
+    """Exact-duplicate keys collapsed before the fuzzy title comparison."""
+
+    canonical_urls: bool = True
+    exact_titles: bool = True
+
+
+@dataclass(frozen=True)
+class HealthConfig:
+    """Per-feed health tracking, circuit breaker and adaptive timeouts."""
+
+    enabled: bool = True
+    path: str = ".cache/feed_health.json"
+    # Consecutive failures that open a feed's circuit.
+    failure_threshold: int = 3
+    # First skip period once open; doubles with every failed probe.
+    backoff_minutes: float = 30.0
+    max_backoff_hours: float = 24.0
+    adaptive_timeouts: bool = True
+    # Read timeout = p95 latency * multiplier, within
+    # [min_read_timeout, the feed's read_timeout].
+    timeout_multiplier: float = 3.0
+    min_read_timeout: float = 2.0
+
+
+@dataclass(frozen=True)
+class PollingConfig:
+    """Skip requests to feeds that are unlikely to have published anything."""
+
+    enabled: bool = True
+    path: str = ".cache/poll_plan.json"
+    # Fetch when the chance of at least one new entry since the last fetch
+    # reaches this value.
+    fetch_probability: float = 0.5
+    # Always fetch a feed last fetched longer ago than this.
+    max_staleness_hours: float = 6.0
+
+
+@dataclass(frozen=True)
+class ArchiveConfig:
+    """Where ``--record`` stores raw responses and ``--replay`` reads them."""
+
+    path: str = "archive"
+    # Record every run, as if ``--record`` were always given.
+    record: bool = False
+
+
+@dataclass(frozen=True)
+class DaemonConfig:
+    schedules: List[str] = field(default_factory=lambda: ["0 8 * * *"])
+    timezone: str = "Asia/Kolkata"
+    poll_seconds: float = 30.0
+
+
+@dataclass(frozen=True)
+class SectionConfig:
+    """One digest section with its own feeds, story limit and ranking inputs.
+
+    ``keywords`` and ``source_weights`` are already resolved against the
+    top-level defaults when the config is loaded.
+    """
+
+    name: str
+    title: str
+    feeds: List[FeedConfig]
+    limit: int = 5
+    keywords: List[str] = field(default_factory=list)
+    keyword_weights: Dict[str, float] = field(default_factory=dict)
+    source_weights: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SubscriberConfig:
+    """A recipient with personal ranking preferences.
+
+    ``keywords`` of ``None`` keeps each section's keywords. ``source_weights``
+    only lists overrides on top of the section's weights. ``limits`` maps
+    section names to story counts, and an empty ``sections`` list means
+    every section.
+    """
+
+    email: str
+    name: str = ""
+    keywords: Optional[List[str]] = None
+    keyword_weights: Dict[str, float] = field(default_factory=dict)
+    source_weights: Dict[str, float] = field(default_factory=dict)
+    limits: Dict[str, int] = field(default_factory=dict)
+    sections: List[str] = field(default_factory=list)
+
+
+LEGACY_SECTIONS = (
+    ("world", "World Top Stories", "world_feeds"),
+    ("india", "India Top Stories", "india_feeds"),
+)
 
 
 @dataclass(frozen=True)
 class AppConfig:
-    world_feeds: List[FeedConfig]
-    india_feeds: List[FeedConfig]
+    sections: List[SectionConfig]
     source_weights: Dict[str, float]
     keywords: List[str]
     email: EmailConfig
     output_dir: str = "out"
+    fetch: FetchConfig = FetchConfig()
+    history: HistoryConfig = HistoryConfig()
+    dedupe: DedupeConfig = DedupeConfig()
+    health: HealthConfig = HealthConfig()
+    polling: PollingConfig = PollingConfig()
+    archive: ArchiveConfig = ArchiveConfig()
+    keyword_weights: Dict[str, float] = field(default_factory=dict)
+    keyword_whole_word: bool = False
+    daemon: DaemonConfig = DaemonConfig()
+    subscribers: List[SubscriberConfig] = field(default_factory=list)
 
 
 def _parse_feeds(raw: Any, label: str) -> List[FeedConfig]:
@@ -45,10 +189,172 @@ def _parse_feeds(raw: Any, label: str) -> List[FeedConfig]:
         url = str(item.get("url", "")).strip()
         if not name or not url:
             raise ValueError(f"{label}[{idx}] requires name and url")
-        feeds.append(FeedConfig(name=name, url=url))
+        connect_timeout = float(item.get("connect_timeout", FeedConfig.connect_timeout))
+        read_timeout = float(item.get("read_timeout", FeedConfig.read_timeout))
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError(f"{label}[{idx}] timeouts must be positive")
+        max_items = item.get("max_items")
+        max_age_hours = item.get("max_age_hours")
+        if max_items is not None and int(max_items) < 1:
+            raise ValueError(f"{label}[{idx}].max_items must be at least 1")
+        if max_age_hours is not None and float(max_age_hours) <= 0:
+            raise ValueError(f"{label}[{idx}].max_age_hours must be positive")
+        feeds.append(
+            FeedConfig(
+                name=name,
+                url=url,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                max_items=None if max_items is None else int(max_items),
+                max_age_hours=None if max_age_hours is None else float(max_age_hours),
+            )
+        )
     return feeds
 
 
+def _parse_keywords(raw: Any, label: str) -> Tuple[List[str], Dict[str, float]]:
+    """Parse a keyword list whose entries are strings or ``{term, weight}``."""
+    if raw is None:
+        return [], {}
+    if not isinstance(raw, list):
+        raise ValueError(f"{label} must be a list")
+    keywords: List[str] = []
+    weights: Dict[str, float] = {}
+    for idx, item in enumerate(raw):
+        if isinstance(item, dict):
+            term = str(item.get("term", "")).strip()
+            if not term:
+                raise ValueError(f"{label}[{idx}] requires term")
+            weights[term] = float(item.get("weight", 1.0))
+        else:
+            term = str(item).strip()
+            if not term:
+                continue
+        keywords.append(term)
+    return keywords, weights
+
+
+def _parse_source_weights(raw: Any, label: str) -> Dict[str, float]:
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise ValueError(f"{label} must be a mapping")
+    return {str(k): float(v) for k, v in raw.items()}
+
+
+def _parse_sections(
+    data: Dict[str, Any],
+    keywords: List[str],
+    keyword_weights: Dict[str, float],
+    source_weights: Dict[str, float],
+) -> List[SectionConfig]:
+    raw = data.get("sections")
+    if raw is None:
+        return [
+            SectionConfig(
+                name=name,
+                title=title,
+                feeds=_parse_feeds(data.get(key), key),
+                keywords=keywords,
+                keyword_weights=keyword_weights,
+                source_weights=source_weights,
+            )
+            for name, title, key in LEGACY_SECTIONS
+        ]
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("sections must be a non-empty list")
+    sections: List[SectionConfig] = []
+    seen_names = set()
+    for idx, item in enumerate(raw):
+        label = f"sections[{idx}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{label} must be a mapping")
+        name = str(item.get("name", "")).strip()
+        if not name:
+            raise ValueError(f"{label} requires name")
+        if name in seen_names:
+            raise ValueError(f"{label} duplicates section name {name!r}")
+        seen_names.add(name)
+        title = str(item.get("title", "")).strip() or f"{name.title()} Top Stories"
+        limit = int(item.get("limit", SectionConfig.limit))
+        if limit < 0:
+            raise ValueError(f"{label}.limit must not be negative")
+        if "keywords" in item:
+            section_keywords, section_weights = _parse_keywords(
+                item.get("keywords"), f"{label}.keywords"
+            )
+        else:
+            section_keywords, section_weights = keywords, keyword_weights
+        sections.append(
+            SectionConfig(
+                name=name,
+                title=title,
+                feeds=_parse_feeds(item.get("feeds"), f"{label}.feeds"),
+                limit=limit,
+                keywords=section_keywords,
+                keyword_weights=section_weights,
+                source_weights={
+                    **source_weights,
+                    **_parse_source_weights(
+                        item.get("source_weights"), f"{label}.source_weights"
+                    ),
+                },
+            )
+        )
+    return sections
+
+
+def _parse_subscribers(raw: Any, sections: List[SectionConfig]) -> List[SubscriberConfig]:
+    if raw is None:
+        return []
+    if not isinstance(raw, list):
+        raise ValueError("subscribers must be a list")
+    section_names = {section.name for section in sections}
+    subscribers: List[SubscriberConfig] = []
+    seen_emails = set()
+    for idx, item in enumerate(raw):
+        label = f"subscribers[{idx}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{label} must be a mapping")
+        email = str(item.get("email", "")).strip()
+        if not email:
+            raise ValueError(f"{label} requires email")
+        if email.lower() in seen_emails:
+            raise ValueError(f"{label} duplicates subscriber {email!r}")
+        seen_emails.add(email.lower())
+        keywords: Optional[List[str]] = None
+        keyword_weights: Dict[str, float] = {}
+        if "keywords" in item:
+            keywords, keyword_weights = _parse_keywords(item.get("keywords"), f"{label}.keywords")
+        raw_limits = item.get("limits") or {}
+        if not isinstance(raw_limits, dict):
+            raise ValueError(f"{label}.limits must be a mapping of section to count")
+        limits = {str(name): int(count) for name, count in raw_limits.items()}
+        raw_sections = item.get("sections") or []
+        if not isinstance(raw_sections, list):
+            raise ValueError(f"{label}.sections must be a list of section names")
+        chosen = [str(name).strip() for name in raw_sections]
+        for name in [*limits, *chosen]:
+            if name not in section_names:
+                raise ValueError(f"{label} refers to unknown section {name!r}")
+        if any(count < 0 for count in limits.values()):
+            raise ValueError(f"{label}.limits must not be negative")
+        subscribers.append(
+            SubscriberConfig(
+                email=email,
+                name=str(item.get("name", "")).strip(),
+                keywords=keywords,
+                keyword_weights=keyword_weights,
+                source_weights=_parse_source_weights(
+                    item.get("source_weights"), f"{label}.source_weights"
+                ),
+                limits=limits,
+                sections=chosen,
+            )
+        )
+    return subscribers
+
+
 def _parse_email(raw: Any) -> EmailConfig:
     if not isinstance(raw, dict):
         raise ValueError("email must be a mapping")
@@ -59,33 +365,309 @@ def _parse_email(raw: Any) -> EmailConfig:
     smtp_port = int(raw.get("smtp_port", 465))
     if not from_email or not to_email:
         raise ValueError("email.from_email and email.to_email are required")
+    connections = int(raw.get("connections", EmailConfig.connections))
+    batch_size = int(raw.get("batch_size", EmailConfig.batch_size))
+    rate_per_second = float(raw.get("rate_per_second", EmailConfig.rate_per_second))
+    max_retries = int(raw.get("max_retries", EmailConfig.max_retries))
+    if connections < 1 or batch_size < 1:
+        raise ValueError("email.connections and email.batch_size must be at least 1")
+    if rate_per_second < 0 or max_retries < 0:
+        raise ValueError("email.rate_per_second and email.max_retries must be non-negative")
     return EmailConfig(
         from_email=from_email,
         to_email=to_email,
         subject_prefix=subject_prefix,
         smtp_host=smtp_host,
         smtp_port=smtp_port,
+        connections=connections,
+        batch_size=batch_size,
+        rate_per_second=rate_per_second,
+        max_retries=max_retries,
+    )
+
+
+def _parse_fetch(raw: Any) -> FetchConfig:
+    if raw is None:
+        return FetchConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("fetch must be a mapping")
+    max_workers = int(raw.get("max_workers", FetchConfig.max_workers))
+    per_host_limit = int(raw.get("per_host_limit", FetchConfig.per_host_limit))
+    if max_workers < 1:
+        raise ValueError("fetch.max_workers must be at least 1")
+    if per_host_limit < 1:
+        raise ValueError("fetch.per_host_limit must be at least 1")
+    cache_dir = str(raw.get("cache_dir", FetchConfig.cache_dir)).strip() or FetchConfig.cache_dir
+    http_cache = bool(raw.get("http_cache", FetchConfig.http_cache))
+    retries = int(raw.get("retries", FetchConfig.retries))
+    backoff_factor = float(raw.get("backoff_factor", FetchConfig.backoff_factor))
+    backoff_jitter = float(raw.get("backoff_jitter", FetchConfig.backoff_jitter))
+    max_retry_after = float(raw.get("max_retry_after", FetchConfig.max_retry_after))
+    parser = str(raw.get("parser", FetchConfig.parser)).strip().lower()
+    if retries < 0:
+        raise ValueError("fetch.retries must not be negative")
+    if parser not in ("feedparser", "stream"):
+        raise ValueError("fetch.parser must be 'feedparser' or 'stream'")
+    parse_workers = int(raw.get("parse_workers", FetchConfig.parse_workers))
+    if parse_workers < 0:
+        raise ValueError("fetch.parse_workers must not be negative")
+    if backoff_factor < 0 or backoff_jitter < 0:
+        raise ValueError("fetch.backoff_factor and fetch.backoff_jitter must not be negative")
+    if max_retry_after < 0:
+        raise ValueError("fetch.max_retry_after must not be negative")
+    deadline_seconds = float(raw.get("deadline_seconds", FetchConfig.deadline_seconds))
+    if deadline_seconds < 0:
+        raise ValueError("fetch.deadline_seconds must not be negative")
+    return FetchConfig(
+        max_workers=max_workers,
+        per_host_limit=per_host_limit,
+        cache_dir=cache_dir,
+        http_cache=http_cache,
+        retries=retries,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        max_retry_after=max_retry_after,
+        parser=parser,
+        parse_workers=parse_workers,
+        deadline_seconds=deadline_seconds,
+    )
+
+
+def _parse_history(raw: Any) -> HistoryConfig:
+    if raw is None:
+        return HistoryConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("history must be a mapping")
+    enabled = bool(raw.get("enabled", HistoryConfig.enabled))
+    path = str(raw.get("path", HistoryConfig.path)).strip() or HistoryConfig.path
+    ttl_hours = float(raw.get("ttl_hours", HistoryConfig.ttl_hours))
+    mode = str(raw.get("mode", HistoryConfig.mode)).strip().lower()
+    penalty = float(raw.get("penalty", HistoryConfig.penalty))
+    if ttl_hours <= 0:
+        raise ValueError("history.ttl_hours must be positive")
+    if mode not in ("drop", "penalize"):
+        raise ValueError("history.mode must be 'drop' or 'penalize'")
+    if not 0 <= penalty <= 1:
+        raise ValueError("history.penalty must be between 0 and 1")
+    return HistoryConfig(
+        enabled=enabled, path=path, ttl_hours=ttl_hours, mode=mode, penalty=penalty
     )
 
 
-def load_config(path: str) -> AppConfig:
+def _parse_dedupe(raw: Any) -> DedupeConfig:
+    if raw is None:
+        return DedupeConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("dedupe must be a mapping")
+    return DedupeConfig(
+        canonical_urls=bool(raw.get("canonical_urls", DedupeConfig.canonical_urls)),
+        exact_titles=bool(raw.get("exact_titles", DedupeConfig.exact_titles)),
+    )
+
+
+def _parse_health(raw: Any) -> HealthConfig:
+    if raw is None:
+        return HealthConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("health must be a mapping")
+    enabled = bool(raw.get("enabled", HealthConfig.enabled))
+    path = str(raw.get("path", HealthConfig.path)).strip() or HealthConfig.path
+    failure_threshold = int(raw.get("failure_threshold", HealthConfig.failure_threshold))
+    backoff_minutes = float(raw.get("backoff_minutes", HealthConfig.backoff_minutes))
+    max_backoff_hours = float(raw.get("max_backoff_hours", HealthConfig.max_backoff_hours))
+    adaptive_timeouts = bool(raw.get("adaptive_timeouts", HealthConfig.adaptive_timeouts))
+    timeout_multiplier = float(raw.get("timeout_multiplier", HealthConfig.timeout_multiplier))
+    min_read_timeout = float(raw.get("min_read_timeout", HealthConfig.min_read_timeout))
+    if failure_threshold < 1:
+        raise ValueError("health.failure_threshold must be at least 1")
+    if backoff_minutes <= 0 or max_backoff_hours <= 0:
+        raise ValueError("health.backoff_minutes and health.max_backoff_hours must be positive")
+    if timeout_multiplier < 1:
+        raise ValueError("health.timeout_multiplier must be at least 1")
+    if min_read_timeout <= 0:
+        raise ValueError("health.min_read_timeout must be positive")
+    return HealthConfig(
+        enabled=enabled,
+        path=path,
+        failure_threshold=failure_threshold,
+        backoff_minutes=backoff_minutes,
+        max_backoff_hours=max_backoff_hours,
+        adaptive_timeouts=adaptive_timeouts,
+        timeout_multiplier=timeout_multiplier,
+        min_read_timeout=min_read_timeout,
+    )
+
+
+def _parse_polling(raw: Any) -> PollingConfig:
+    if raw is None:
+        return PollingConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("polling must be a mapping")
+    enabled = bool(raw.get("enabled", PollingConfig.enabled))
+    path = str(raw.get("path", PollingConfig.path)).strip() or PollingConfig.path
+    fetch_probability = float(raw.get("fetch_probability", PollingConfig.fetch_probability))
+    max_staleness_hours = float(
+        raw.get("max_staleness_hours", PollingConfig.max_staleness_hours)
+    )
+    if not 0 < fetch_probability <= 1:
+        raise ValueError("polling.fetch_probability must be greater than 0 and at most 1")
+    if max_staleness_hours <= 0:
+        raise ValueError("polling.max_staleness_hours must be positive")
+    return PollingConfig(
+        enabled=enabled,
+        path=path,
+        fetch_probability=fetch_probability,
+        max_staleness_hours=max_staleness_hours,
+    )
+
+
+def _parse_archive(raw: Any) -> ArchiveConfig:
+    if raw is None:
+        return ArchiveConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("archive must be a mapping")
+    path = str(raw.get("path", ArchiveConfig.path)).strip() or ArchiveConfig.path
+    return ArchiveConfig(path=path, record=bool(raw.get("record", ArchiveConfig.record)))
+
+
+def _parse_daemon(raw: Any) -> DaemonConfig:
+    if raw is None:
+        return DaemonConfig()
+    if not isinstance(raw, dict):
+        raise ValueError("daemon must be a mapping")
+    schedules = raw.get("schedules", DaemonConfig().schedules)
+    if isinstance(schedules, str):
+        schedules = [schedules]
+    if not isinstance(schedules, list) or not schedules:
+        raise ValueError("daemon.schedules must be a non-empty list of cron expressions")
+    schedules = [str(expression).strip() for expression in schedules]
+    for expression in schedules:
+        CronSchedule.parse(expression)
+    timezone = str(raw.get("timezone", DaemonConfig.timezone)).strip()
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise ValueError(f"daemon.timezone is not a known timezone: {timezone}") from exc
+    poll_seconds = float(raw.get("poll_seconds", DaemonConfig.poll_seconds))
+    if poll_seconds <= 0:
+        raise ValueError("daemon.poll_seconds must be positive")
+    return DaemonConfig(schedules=schedules, timezone=timezone, poll_seconds=poll_seconds)
+
+
+CONFIG_CACHE_VERSION = 2
+
+
+def _config_cache_path(config_path: Path) -> Path:
+    return config_path.parent / ".cache" / f"{config_path.name}.json"
+
+
+def _config_cache_key(raw: bytes) -> Dict[str, Any]:
+    # A content hash, not mtime and size: copies made with ``cp -p`` or
+    # ``rsync -t`` keep the mtime, and a same-size edit must not be missed.
+    return {"version": CONFIG_CACHE_VERSION, "sha256": hashlib.sha256(raw).hexdigest()}
+
+
+def _read_config_cache(cache_path: Path, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        print(f"[warn] Ignoring unreadable config cache {cache_path}: {exc}")
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        return None
+    data = payload.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_config_cache(cache_path: Path, key: Dict[str, Any], data: Dict[str, Any]) -> None:
+    try:
+        encoded = json.dumps({"key": key, "data": data})
+    except (TypeError, ValueError):
+        return
+    # YAML allows values JSON cannot round-trip (dates, non-string keys);
+    # such configs are simply parsed every time.
+    if json.loads(encoded)["data"] != data:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        tmp_path.write_text(encoded, encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError as exc:
+        print(f"[warn] Could not write config cache {cache_path}: {exc}")
+
+
+def load_config(
+    path: str, use_cache: bool = True, cache_path: Optional[Path] = None
+) -> AppConfig:
+    """Load and validate ``path``.
+
+    The parsed YAML mapping is cached as JSON in ``.cache/<name>.json`` next
+    to the YAML, keyed by a sha256 of the file's bytes, so large generated
+    configs skip YAML parsing until the file changes. Validation runs on
+    every load, cached or not, and the cache holds only plain data.
+    """
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Config not found: {config_path}")
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-    world_feeds = _parse_feeds(data.get("world_feeds"), "world_feeds")
-    india_feeds = _parse_feeds(data.get("india_feeds"), "india_feeds")
-    source_weights = {
-        str(k): float(v) for k, v in (data.get("source_weights") or {}).items()
-    }
-    keywords = [str(k).strip() for k in (data.get("keywords") or []) if str(k).strip()]
+    raw = config_path.read_bytes()
+    if not use_cache:
+        return _build_config(_parse_config(raw))
+    cache_path = cache_path or _config_cache_path(config_path)
+    key = _config_cache_key(raw)
+    data = _read_config_cache(cache_path, key)
+    if data is None:
+        data = _parse_config(raw)
+        _write_config_cache(cache_path, key, data)
+    return _build_config(data)
+
+
+def _parse_config(raw: bytes) -> Dict[str, Any]:
+    import yaml
+
+    # libyaml's C loader is several times faster on large feed lists.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(raw.decode("utf-8"), Loader=loader) or {}
+    if not isinstance(data, dict):
+        raise ValueError("Config must be a mapping")
+    return data
+
+
+def _build_config(data: Dict[str, Any]) -> AppConfig:
+    source_weights = _parse_source_weights(data.get("source_weights"), "source_weights")
+    keywords, keyword_weights = _parse_keywords(data.get("keywords"), "keywords")
+    sections = _parse_sections(data, keywords, keyword_weights, source_weights)
+    keyword_match = str(data.get("keyword_match", "substring")).strip().lower()
+    if keyword_match not in ("substring", "word"):
+        raise ValueError("keyword_match must be 'substring' or 'word'")
     email = _parse_email(data.get("email") or {})
     output_dir = str(data.get("output_dir", "out")).strip() or "out"
+    fetch = _parse_fetch(data.get("fetch"))
+    history = _parse_history(data.get("history"))
+    dedupe = _parse_dedupe(data.get("dedupe"))
+    health = _parse_health(data.get("health"))
+    polling = _parse_polling(data.get("polling"))
+    archive = _parse_archive(data.get("archive"))
+    daemon = _parse_daemon(data.get("daemon"))
+    subscribers = _parse_subscribers(data.get("subscribers"), sections)
     return AppConfig(
-        world_feeds=world_feeds,
-        india_feeds=india_feeds,
+        sections=sections,
         source_weights=source_weights,
         keywords=keywords,
         email=email,
         output_dir=output_dir,
+        fetch=fetch,
+        history=history,
+        dedupe=dedupe,
+        health=health,
+        polling=polling,
+        archive=archive,
+        keyword_weights=keyword_weights,
+        keyword_whole_word=keyword_match == "word",
+        daemon=daemon,
+        subscribers=subscribers,
     )
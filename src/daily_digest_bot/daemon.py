@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import time
+from typing import List, Mapping, Optional, Sequence
+
+from zoneinfo import ZoneInfo
+
+from daily_digest_bot.config import AppConfig, load_config
+from daily_digest_bot.main import RunState, open_state, run
+from daily_digest_bot.schedule import CronSchedule
+
+
+def _next_fire(schedules: Sequence[CronSchedule], moment: datetime) -> datetime:
+    return min(schedule.next_after(moment) for schedule in schedules)
+
+
+def _schedules(config: AppConfig) -> List[CronSchedule]:
+    return [CronSchedule.parse(expression) for expression in config.daemon.schedules]
+
+
+def _config_mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def run_daemon(
+    config_path: str,
+    dry_run: bool,
+    limit_world: Optional[int] = None,
+    limit_india: Optional[int] = None,
+    workers: int | None = None,
+    pipeline: str = "topk",
+    limits: Optional[Mapping[str, int]] = None,
+    prometheus: bool = False,
+    record: bool = False,
+    deadline_seconds: Optional[float] = None,
+) -> int:
+    """Build digests on the configured cron schedules until interrupted.
+
+    One ``RunState`` is kept between runs so the HTTP session, feed cache and
+    seen-story store stay warm. ``config.yaml`` is re-read when its mtime
+    changes; an invalid edit, or one whose stores cannot be opened, is
+    reported and the previous config kept.
+    """
+    config_file = Path(config_path)
+    config = load_config(config_path)
+    mtime = _config_mtime(config_file)
+    state: RunState = open_state(config, workers, record=record)
+    tz = ZoneInfo(config.daemon.timezone)
+    schedules = _schedules(config)
+    next_run = _next_fire(schedules, datetime.now(tz))
+    print(f"[info] Daemon started; next run at {next_run.isoformat()}")
+    try:
+        while True:
+            now = datetime.now(tz)
+            if now >= next_run:
+                try:
+                    run(
+                        config_path=config_path,
+                        dry_run=dry_run,
+                        limit_world=limit_world,
+                        limit_india=limit_india,
+                        pipeline=pipeline,
+                        state=state,
+                        output_stamp="%Y-%m-%d-%H%M",
+                        limits=limits,
+                        prometheus=prometheus,
+                        deadline_seconds=deadline_seconds,
+                    )
+                except Exception as exc:
+                    print(f"[error] Scheduled run failed: {exc}")
+                next_run = _next_fire(schedules, datetime.now(tz))
+                print(f"[info] Next run at {next_run.isoformat()}")
+                continue
+
+            current_mtime = _config_mtime(config_file)
+            if current_mtime is not None and current_mtime != mtime:
+                mtime = current_mtime
+                try:
+                    new_config = load_config(config_path)
+                    new_schedules = _schedules(new_config)
+                    new_tz = ZoneInfo(new_config.daemon.timezone)
+                except Exception as exc:
+                    print(f"[warn] Keeping previous config; reload failed: {exc}")
+                else:
+                    # The stores hold files the new state reopens, so the old
+                    # state is closed first and reopened if the new one fails.
+                    state.close()
+                    try:
+                        state = open_state(new_config, workers, record=record)
+                    except Exception as exc:
+                        print(f"[warn] Keeping previous config; opening its stores failed: {exc}")
+                        state = open_state(config, workers, record=record)
+                        continue
+                    config = new_config
+                    tz, schedules = new_tz, new_schedules
+                    next_run = _next_fire(schedules, datetime.now(tz))
+                    print(f"[info] Config reloaded; next run at {next_run.isoformat()}")
+                continue
+
+            wait = (next_run - now).total_seconds()
+            time.sleep(max(min(wait, config.daemon.poll_seconds), 0.0))
+    except KeyboardInterrupt:
+        print("[info] Daemon stopped.")
+        return 0
+    finally:
+        state.close()
@@ -1,10 +1,90 @@
 from __future__ import annotations
 
+from bisect import insort
 import difflib
+import heapq
 import re
-from typing import List
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from daily_digest_bot.feeds import NewsItem
+from daily_digest_bot.ranker import ranking_key
+
+DEDUPE_ENGINES = ("indexed", "pairwise")
+
+# Query parameters that identify a campaign or referrer, not the article.
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+        "ocid", "cmpid", "smid", "ref", "ref_src", "at_medium", "at_campaign", "amp",
+    }
+)
+_HOST_PREFIXES = ("www.", "amp.", "m.")
+_AMP_CACHE_SUFFIX = ".cdn.ampproject.org"
+
+
+def canonical_url(link: str) -> str:
+    """Normalize ``link`` so variants of one article compare equal.
+
+    Drops the scheme, ``www.``/``amp.``/``m.`` host prefixes, default ports,
+    fragments, trailing slashes, tracking parameters (``utm_*`` and
+    friends) and AMP markers (``/amp`` path segments, ``.amp`` suffixes,
+    Google AMP cache URLs); the remaining query parameters are sorted.
+    Returns ``""`` for an empty link.
+    """
+    link = link.strip()
+    if not link:
+        return ""
+    parts = urlsplit(link if "//" in link else f"//{link}")
+    host = (parts.hostname or "").lower()
+    path = parts.path
+    if host.endswith(_AMP_CACHE_SUFFIX):
+        # https://example-com.cdn.ampproject.org/c/s/example.com/story
+        segments = path.split("/")
+        if len(segments) > 3 and segments[1] in ("c", "v"):
+            rest = segments[3:] if segments[2] == "s" else segments[2:]
+            host, path = rest[0].lower(), "/" + "/".join(rest[1:])
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix) :]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    segments = [segment for segment in path.split("/") if segment and segment != "amp"]
+    if segments:
+        last = segments[-1]
+        if last.endswith(".amp"):
+            segments[-1] = last[: -len(".amp")]
+        elif ".amp." in last:
+            segments[-1] = last.replace(".amp.", ".", 1)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+        and key.lower() not in TRACKING_PARAMS
+        and not (key.lower() == "outputtype" and value.lower() == "amp")
+    )
+    canonical = host + "/" + "/".join(segments)
+    return f"{canonical}?{urlencode(query)}" if query else canonical
+
+
+def title_key(title: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of ``title``."""
+    return " ".join(re.findall(r"\w+", title.casefold()))
+
+
+def story_keys(item: NewsItem, urls: bool = True, titles: bool = True) -> Tuple[str, ...]:
+    """Exact-match keys for ``item``: its canonical link and normalized title."""
+    keys = []
+    if urls:
+        url = canonical_url(item.link)
+        if url:
+            keys.append("u:" + url)
+    if titles:
+        title = title_key(item.title)
+        if title:
+            keys.append("t:" + title)
+    return tuple(keys)
 
 
 def _tokenize(title: str) -> set[str]:
@@ -21,7 +101,130 @@ def _similarity(a: NewsItem, b: NewsItem) -> float:
     return difflib.SequenceMatcher(a=a.title.lower(), b=b.title.lower()).ratio()
 
 
-def dedupe_items(items: List[NewsItem], threshold: float = 0.6) -> List[NewsItem]:
+class _TitleIndex:
+    """Inverted token index over the titles of kept items.
+
+    ``find`` returns the lowest kept position whose title is at least
+    ``threshold`` similar, exactly as the pairwise scan would, but only
+    computes Jaccard scores for kept titles sharing a token with the query.
+    Titles without usable tokens still fall back to ``SequenceMatcher``.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self._tokens: List[FrozenSet[str]] = []
+        self._titles: List[str] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._tokenless: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _ratio(self, title: str, idx: int) -> float:
+        return difflib.SequenceMatcher(a=title, b=self._titles[idx]).ratio()
+
+    def find(self, tokens: FrozenSet[str], title: str) -> Optional[int]:
+        if not tokens:
+            for idx in range(len(self._titles)):
+                if self._ratio(title, idx) >= self.threshold:
+                    return idx
+            return None
+
+        shared: Dict[int, int] = {}
+        for token in tokens:
+            for idx in self._postings.get(token, ()):
+                shared[idx] = shared.get(idx, 0) + 1
+        best: Optional[int] = None
+        size = len(tokens)
+        for idx, count in shared.items():
+            if best is not None and idx > best:
+                continue
+            union = size + len(self._tokens[idx]) - count
+            if count / max(union, 1) >= self.threshold:
+                best = idx
+        for idx in self._tokenless:
+            if best is not None and idx >= best:
+                break
+            if self._ratio(title, idx) >= self.threshold:
+                return idx
+        return best
+
+    def _register(self, idx: int, tokens: FrozenSet[str]) -> None:
+        if tokens:
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(idx)
+        else:
+            insort(self._tokenless, idx)
+
+    def add(self, tokens: FrozenSet[str], title: str) -> int:
+        idx = len(self._titles)
+        self._tokens.append(tokens)
+        self._titles.append(title)
+        self._register(idx, tokens)
+        return idx
+
+    def replace(self, idx: int, tokens: FrozenSet[str], title: str) -> None:
+        old_tokens = self._tokens[idx]
+        if old_tokens:
+            for token in old_tokens:
+                self._postings[token].discard(idx)
+        else:
+            self._tokenless.remove(idx)
+        self._tokens[idx] = tokens
+        self._titles[idx] = title
+        self._register(idx, tokens)
+
+
+class _ExactIndex:
+    """Story keys of the items kept so far, for items visited in ranking order.
+
+    Visited best-first, an item is an exact duplicate when a better-ranked
+    kept item shares one of its keys. Only a kept item's own keys are
+    registered, so two stories are never merged through a third.
+    ``removed`` counts the duplicates dropped.
+    """
+
+    def __init__(self, urls: bool = True, titles: bool = True) -> None:
+        self.urls = urls
+        self.titles = titles
+        self.removed = 0
+        self._seen: Set[str] = set()
+
+    def keys(self, item: NewsItem) -> Tuple[str, ...]:
+        return story_keys(item, self.urls, self.titles)
+
+    def add(self, keys: Tuple[str, ...]) -> bool:
+        """Register ``keys`` unless a kept item already holds one of them."""
+        if any(key in self._seen for key in keys):
+            self.removed += 1
+            return False
+        self._seen.update(keys)
+        return True
+
+
+def collapse_duplicates(
+    items: Iterable[NewsItem], urls: bool = True, titles: bool = True
+) -> List[NewsItem]:
+    """Drop exact duplicates, keeping the best-ranked copy of each story.
+
+    Items match when their canonical links or normalized titles are equal
+    (see ``story_keys``). Items are visited in ranking order, which costs a
+    linear pass on the already sorted lists the pipeline passes in; the
+    survivors keep their input order. Run before ``dedupe_items`` so the
+    fuzzy title comparison sees fewer items.
+    """
+    items = list(items)
+    if not (urls or titles):
+        return items
+    index = _ExactIndex(urls, titles)
+    order = sorted(range(len(items)), key=lambda idx: ranking_key(items[idx]))
+    keep = [False] * len(items)
+    for idx in order:
+        keep[idx] = index.add(index.keys(items[idx]))
+    return [item for item, kept in zip(items, keep) if kept]
+
+
+def _dedupe_pairwise(items: List[NewsItem], threshold: float) -> List[NewsItem]:
     kept: List[NewsItem] = []
     for item in items:
         match_index = None
@@ -34,7 +237,151 @@ def dedupe_items(items: List[NewsItem], threshold: float = 0.6) -> List[NewsItem
         else:
             if item.score > kept[match_index].score:
                 kept[match_index] = item
-    kept.sort(
-        key=lambda i: (-i.score, -i.published_at.timestamp(), i.title.lower(), i.source.lower())
-    )
     return kept
+
+
+def _dedupe_indexed(items: List[NewsItem], threshold: float) -> List[NewsItem]:
+    kept: List[NewsItem] = []
+    index = _TitleIndex(threshold)
+    for item in items:
+        tokens = frozenset(_tokenize(item.title))
+        title = item.title.lower()
+        match_index = index.find(tokens, title)
+        if match_index is None:
+            index.add(tokens, title)
+            kept.append(item)
+        elif item.score > kept[match_index].score:
+            index.replace(match_index, tokens, title)
+            kept[match_index] = item
+    return kept
+
+
+def dedupe_items(
+    items: List[NewsItem], threshold: float = 0.6, engine: str = "indexed"
+) -> List[NewsItem]:
+    if engine not in DEDUPE_ENGINES:
+        raise ValueError(f"Unknown dedupe engine: {engine}")
+    # A non-positive threshold matches titles that share no tokens, which the
+    # token index cannot enumerate, so it always takes the pairwise path.
+    if engine == "pairwise" or threshold <= 0:
+        kept = _dedupe_pairwise(items, threshold)
+    else:
+        kept = _dedupe_indexed(items, threshold)
+    kept.sort(key=ranking_key)
+    return kept
+
+
+def select_top_k(
+    items: Iterable[NewsItem],
+    limit: int,
+    threshold: float = 0.6,
+    scores: Optional[Sequence[float]] = None,
+    urls: bool = True,
+    titles: bool = True,
+    keys: Optional[List[Optional[Tuple[str, ...]]]] = None,
+) -> List[NewsItem]:
+    """Return the best ``limit`` distinct stories from scored, unsorted items.
+
+    Equivalent to ``dedupe_items(collapse_duplicates(sorted(items,
+    key=ranking_key)))[:limit]``: items are popped from a heap in ranking
+    order, checked for exact duplicates and deduped incrementally, stopping
+    once ``limit`` distinct stories are kept. In ranking order a later
+    duplicate never outscores the story it matches, so no kept item is ever
+    replaced and the kept list is already sorted. ``urls`` and ``titles``
+    select the exact-duplicate keys, as for ``collapse_duplicates``.
+
+    ``scores``, parallel to ``items``, ranks by those values instead of
+    ``item.score``, so items shared between subscribers are never mutated.
+    ``keys``, also parallel to ``items``, caches each item's ``story_keys``
+    between calls over the same items; ``None`` entries are filled in as
+    items are popped.
+    """
+    if limit <= 0:
+        return []
+    if scores is None:
+        heap = [(ranking_key(item), idx, item) for idx, item in enumerate(items)]
+    else:
+        heap = [
+            ((-score, -item.published_ts, item.title.lower(), item.source.lower()), idx, item)
+            for idx, (item, score) in enumerate(zip(items, scores))
+        ]
+    heapq.heapify(heap)
+    exact = _ExactIndex(urls, titles) if urls or titles else None
+    if exact is not None and keys is None:
+        keys = [None] * len(heap)
+    return _pop_distinct(heap, limit, threshold, exact, keys)
+
+
+def _pop_distinct(
+    heap: List[tuple],
+    limit: int,
+    threshold: float,
+    exact: Optional[_ExactIndex] = None,
+    keys: Optional[List[Optional[Tuple[str, ...]]]] = None,
+) -> List[NewsItem]:
+    """Pop ``(key, idx, item)`` entries in order, keeping ``limit`` distinct items.
+
+    With ``exact``, entries sharing a story key with an earlier popped item
+    are skipped; ``keys[idx]`` holds (or receives) the keys of entry ``idx``.
+    """
+    if limit <= 0 or not heap:
+        return []
+    if threshold <= 0:
+        # Every title matches the first kept story at a non-positive threshold,
+        # and the best-ranked item is never an exact duplicate.
+        return [heap[0][2]]
+    kept: List[NewsItem] = []
+    index = _TitleIndex(threshold)
+    while heap and len(kept) < limit:
+        _, idx, item = heapq.heappop(heap)
+        if exact is not None:
+            item_keys = keys[idx]
+            if item_keys is None:
+                item_keys = keys[idx] = exact.keys(item)
+            if not exact.add(item_keys):
+                continue
+        tokens = frozenset(_tokenize(item.title))
+        title = item.title.lower()
+        if index.find(tokens, title) is None:
+            index.add(tokens, title)
+            kept.append(item)
+    return kept
+
+
+class TopKSelector:
+    """Incremental ``select_top_k`` for items that arrive in batches.
+
+    ``add`` computes story keys and pushes items onto a heap as each feed
+    completes, so the ordering work overlaps the remaining downloads;
+    ``select`` then only pops until ``limit`` distinct stories are found and
+    returns the same stories ``select_top_k`` would for all items added so
+    far. ``select`` works on a copy, so it can be called again after more
+    items arrive.
+    """
+
+    def __init__(self, threshold: float = 0.6, urls: bool = True, titles: bool = True) -> None:
+        self.threshold = threshold
+        self.urls = urls
+        self.titles = titles
+        self.duplicates = 0
+        self._heap: List[tuple] = []
+        self._keys: List[Optional[Tuple[str, ...]]] = []
+
+    def __len__(self) -> int:
+        """Items added so far."""
+        return len(self._heap)
+
+    def add(self, items: Iterable[NewsItem]) -> None:
+        exact = self.urls or self.titles
+        for item in items:
+            slot = len(self._keys)
+            self._keys.append(story_keys(item, self.urls, self.titles) if exact else None)
+            heapq.heappush(self._heap, (ranking_key(item), slot, item))
+
+    def select(self, limit: int) -> List[NewsItem]:
+        """Pick ``limit`` stories; ``duplicates`` then counts the exact
+        duplicates skipped on the way, not those among unvisited items."""
+        exact = _ExactIndex(self.urls, self.titles) if self.urls or self.titles else None
+        selected = _pop_distinct(list(self._heap), limit, self.threshold, exact, self._keys)
+        self.duplicates = exact.removed if exact is not None else 0
+        return selected
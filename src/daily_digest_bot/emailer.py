@@ -1,8 +1,30 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 import os
+import queue
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from daily_digest_bot.config import EmailConfig
+
+SmtpFactory = Callable[[str, int], smtplib.SMTP]
+
+AUTH_FAILED = (
+    "Gmail authentication failed. Use an App Password for the Gmail "
+    "account that matches from_email."
+)
+
+
+def _build_message(html: str, subject: str, from_email: str, to_email: str) -> MIMEText:
+    message = MIMEText(html, "html", "utf-8")
+    message["Subject"] = subject
+    message["From"] = from_email
+    message["To"] = to_email
+    return message
 
 
 def send_email(
@@ -17,17 +39,264 @@ def send_email(
     if not password:
         raise ValueError("GMAIL_APP_PASSWORD is not set")
 
-    message = MIMEText(html, "html", "utf-8")
-    message["Subject"] = subject
-    message["From"] = from_email
-    message["To"] = to_email
+    message = _build_message(html, subject, from_email, to_email)
 
     try:
         with smtplib.SMTP_SSL(smtp_host, smtp_port) as server:
             server.login(from_email, password)
             server.sendmail(from_email, [to_email], message.as_string())
     except smtplib.SMTPAuthenticationError as exc:
-        raise ValueError(
-            "Gmail authentication failed. Use an App Password for the Gmail "
-            "account that matches from_email."
-        ) from exc
+        raise ValueError(AUTH_FAILED) from exc
+
+
+@dataclass(frozen=True)
+class OutgoingMessage:
+    to_email: str
+    subject: str
+    html: str
+
+
+@dataclass
+class BatchReport:
+    index: int
+    sent: int
+    failed: int
+    seconds: float
+
+    @property
+    def messages_per_second(self) -> float:
+        return (self.sent + self.failed) / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class DeliveryReport:
+    sent: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    batches: List[BatchReport] = field(default_factory=list)
+    connections_opened: int = 0
+
+
+class _RateLimiter:
+    """Spaces calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(
+        self, rate: float, clock: Callable[[], float], sleep: Callable[[float], None]
+    ) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = clock()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class BulkSender:
+    """Deliver many messages over a few long-lived, authenticated connections.
+
+    Messages are split into batches of ``batch_size``; each of the
+    ``connections`` worker threads takes whole batches and sends them
+    back to back on its own connection, so the TLS handshake and login are
+    paid once per connection rather than once per message. Sends are spaced
+    to ``rate_per_second`` overall (0 disables the limit).
+
+    A dropped connection is reopened and the message retried; 4xx replies
+    are retried up to ``max_retries`` times with exponential backoff; 5xx
+    replies fail that recipient only. Authentication failures abort the run.
+
+    ``smtp_factory(host, port)`` returns a connected ``smtplib.SMTP``-like
+    object. It defaults to ``SMTP_SSL``; pass ``smtplib.SMTP`` to deliver to
+    a local stand-in such as ``aiosmtpd``. Login is skipped when
+    ``password`` is empty.
+    """
+
+    def __init__(
+        self,
+        from_email: str,
+        password: str = "",
+        smtp_host: str = "smtp.gmail.com",
+        smtp_port: int = 465,
+        connections: int = 1,
+        batch_size: int = 50,
+        rate_per_second: float = 0.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        smtp_factory: Optional[SmtpFactory] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if connections < 1 or batch_size < 1:
+            raise ValueError("connections and batch_size must be at least 1")
+        self.from_email = from_email
+        self.password = password
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.connections = connections
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._factory = smtp_factory or smtplib.SMTP_SSL
+        self._sleep = sleep
+        self._clock = clock
+        self._limiter = _RateLimiter(rate_per_second, clock, sleep)
+        self._open: List[Optional[smtplib.SMTP]] = [None] * connections
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls, email: EmailConfig, password: str, **kwargs: object
+    ) -> "BulkSender":
+        return cls(
+            from_email=email.from_email,
+            password=password,
+            smtp_host=email.smtp_host,
+            smtp_port=email.smtp_port,
+            connections=email.connections,
+            batch_size=email.batch_size,
+            rate_per_second=email.rate_per_second,
+            max_retries=email.max_retries,
+            **kwargs,
+        )
+
+    def __enter__(self) -> "BulkSender":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for slot in range(self.connections):
+            self._drop(slot, polite=True)
+
+    def _connect(self, slot: int, report: DeliveryReport) -> smtplib.SMTP:
+        server = self._open[slot]
+        if server is not None:
+            return server
+        server = self._factory(self.smtp_host, self.smtp_port)
+        try:
+            if self.password:
+                server.login(self.from_email, self.password)
+        except smtplib.SMTPAuthenticationError as exc:
+            server.close()
+            raise ValueError(AUTH_FAILED) from exc
+        self._open[slot] = server
+        with self._lock:
+            report.connections_opened += 1
+        return server
+
+    def _drop(self, slot: int, polite: bool = False) -> None:
+        server, self._open[slot] = self._open[slot], None
+        if server is None:
+            return
+        try:
+            if polite:
+                server.quit()
+            else:
+                server.close()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    def _deliver(
+        self, slot: int, message: OutgoingMessage, payload: str, report: DeliveryReport
+    ) -> Optional[str]:
+        """Send one message, returning an error description on failure."""
+        error = "not attempted"
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                server = self._connect(slot, report)
+                server.sendmail(self.from_email, [message.to_email], payload)
+                return None
+            except smtplib.SMTPRecipientsRefused as exc:
+                code, text = next(iter(exc.recipients.values()))
+            except smtplib.SMTPResponseException as exc:
+                code, text = exc.smtp_code, exc.smtp_error
+                if code == 421:
+                    # "Service closing": the server is about to hang up.
+                    self._drop(slot)
+            except (smtplib.SMTPServerDisconnected, OSError) as exc:
+                self._drop(slot)
+                error = f"connection error: {exc}"
+                continue
+            if isinstance(text, bytes):
+                text = text.decode("utf-8", "replace")
+            error = f"{code} {text}"
+            if not 400 <= code < 500:
+                return error
+        return error
+
+    def _run_batches(
+        self,
+        slot: int,
+        batches: "queue.Queue[Tuple[int, Sequence[OutgoingMessage]]]",
+        report: DeliveryReport,
+    ) -> None:
+        while True:
+            try:
+                index, batch = batches.get_nowait()
+            except queue.Empty:
+                return
+            start = self._clock()
+            sent: List[str] = []
+            failed: Dict[str, str] = {}
+            for message in batch:
+                payload = _build_message(
+                    message.html, message.subject, self.from_email, message.to_email
+                ).as_string()
+                self._limiter.wait()
+                error = self._deliver(slot, message, payload, report)
+                if error is None:
+                    sent.append(message.to_email)
+                else:
+                    failed[message.to_email] = error
+            batch_report = BatchReport(index, len(sent), len(failed), self._clock() - start)
+            print(
+                f"[info] Batch {index + 1}: {batch_report.sent} sent, {batch_report.failed} "
+                f"failed in {batch_report.seconds:.2f}s "
+                f"({batch_report.messages_per_second:.1f} msg/s)"
+            )
+            with self._lock:
+                report.sent.extend(sent)
+                report.failed.update(failed)
+                report.batches.append(batch_report)
+
+    def send(self, messages: Iterable[OutgoingMessage]) -> DeliveryReport:
+        """Deliver ``messages`` and report per-recipient and per-batch results."""
+        pending = list(messages)
+        batches: "queue.Queue[Tuple[int, Sequence[OutgoingMessage]]]" = queue.Queue()
+        for index, start in enumerate(range(0, len(pending), self.batch_size)):
+            batches.put((index, pending[start : start + self.batch_size]))
+        report = DeliveryReport()
+        workers = min(self.connections, batches.qsize())
+        if workers <= 1:
+            self._run_batches(0, batches, report)
+        else:
+            errors: List[BaseException] = []
+
+            def work(slot: int) -> None:
+                try:
+                    self._run_batches(slot, batches, report)
+                except BaseException as exc:  # surfaced on the calling thread
+                    errors.append(exc)
+
+            threads = [
+                threading.Thread(target=work, args=(slot,), daemon=True)
+                for slot in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+        report.batches.sort(key=lambda batch: batch.index)
+        return report
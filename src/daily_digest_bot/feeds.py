@@ -1,25 +1,145 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+import copy
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import multiprocessing
 import re
-from typing import Iterable, List, Optional
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
-import feedparser
 import requests
 
-from daily_digest_bot.config import FeedConfig
+from daily_digest_bot.config import FeedConfig, FetchConfig
+from daily_digest_bot.metrics import FeedMetrics, RunMetrics
+from daily_digest_bot.session import build_session
+from daily_digest_bot.streaming import StreamEntry, StreamParseError, iter_stream_entries
+
+if TYPE_CHECKING:
+    from daily_digest_bot.archive import FeedArchive
+    from daily_digest_bot.cache import FeedCache
+    from daily_digest_bot.health import FeedHealthStore
+    from daily_digest_bot.polling import PollPlanner
+
+DEFAULT_PER_HOST_LIMIT = 2
+FEED_PARSERS = ("feedparser", "stream")
+STREAM_CHUNK_SIZE = 16 * 1024
 
 
-@dataclass
 class NewsItem:
-    title: str
-    link: str
-    published_at: datetime
-    source: str
-    summary: str
-    date_missing: bool = False
-    score: float = field(default=0.0)
+    """A single story, stored compactly.
+
+    Items are slotted (no per-instance ``__dict__``), source names are
+    interned so items from one feed share a single string, and the
+    publication time is kept as epoch seconds in ``published_ts``;
+    ``published_at`` converts it to an aware UTC datetime on access.
+
+    An explicitly passed ``summary`` is returned as is. Otherwise the summary
+    is built from ``raw_summary`` on first access and memoized, so only
+    stories that are actually rendered pay for summarization. Ranking
+    matches keywords against the cleaned description instead, which is also
+    memoized and reused when the summary is built.
+    """
+
+    __slots__ = (
+        "title",
+        "link",
+        "published_ts",
+        "source",
+        "date_missing",
+        "score",
+        "raw_summary",
+        "_summary",
+        "_cleaned",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        published_at: datetime,
+        source: str,
+        summary: Optional[str] = None,
+        date_missing: bool = False,
+        score: float = 0.0,
+        raw_summary: str = "",
+    ) -> None:
+        self.title = title
+        self.link = link
+        self.published_ts = published_at.timestamp()
+        self.source = sys.intern(source)
+        self.date_missing = date_missing
+        self.score = score
+        self.raw_summary = raw_summary
+        self._summary = summary
+        self._cleaned: Optional[str] = None
+
+    @property
+    def published_at(self) -> datetime:
+        return datetime.fromtimestamp(self.published_ts, timezone.utc)
+
+    @published_at.setter
+    def published_at(self, value: datetime) -> None:
+        self.published_ts = value.timestamp()
+
+    @property
+    def summary(self) -> str:
+        if self._summary is None:
+            self._summary = _summarize_text(self._cleaned_text()) or self.title
+        return self._summary
+
+    @summary.setter
+    def summary(self, value: Optional[str]) -> None:
+        self._summary = value
+
+    def _cleaned_text(self) -> str:
+        if self._cleaned is None:
+            self._cleaned = _clean_text(self.raw_summary)
+        return self._cleaned
+
+    @property
+    def keyword_text(self) -> str:
+        """Title plus the cleaned description, for keyword matching.
+
+        Items without a ``raw_summary`` use their explicit summary instead.
+        """
+        if self.raw_summary:
+            return f"{self.title} {self._cleaned_text()}"
+        return f"{self.title} {self.summary}"
+
+    def _astuple(self) -> tuple:
+        return (
+            self.title,
+            self.link,
+            self.published_ts,
+            self.source,
+            self.date_missing,
+            self.score,
+            self.raw_summary,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NewsItem):
+            return NotImplemented
+        # Summaries are only built once everything else matches.
+        return self._astuple() == other._astuple() and self.summary == other.summary
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"NewsItem(title={self.title!r}, link={self.link!r}, "
+            f"published_at={self.published_at!r}, source={self.source!r}, "
+            f"summary={self.summary!r}, date_missing={self.date_missing!r}, "
+            f"score={self.score!r})"
+        )
 
 
 def _parse_entry_datetime(entry: dict) -> Optional[datetime]:
@@ -50,9 +170,12 @@ def _strip_html(text: str) -> str:
     return re.sub(r"<[^>]+>", "", text)
 
 
-def _summarize_text(text: str, max_chars: int = 320, max_sentences: int = 2) -> str:
-    cleaned = _strip_html(text)
-    cleaned = " ".join(cleaned.split())
+def _clean_text(text: str) -> str:
+    return " ".join(_strip_html(text).split())
+
+
+def _summarize_text(cleaned: str, max_chars: int = 320, max_sentences: int = 2) -> str:
+    """Cut ``cleaned`` (output of ``_clean_text``) to a short summary."""
     if not cleaned:
         return ""
     sentences = re.split(r"(?<=[.!?])\s+", cleaned)
@@ -64,49 +187,641 @@ def _summarize_text(text: str, max_chars: int = 320, max_sentences: int = 2) ->
     return summary
 
 
-def fetch_feeds(feeds: Iterable[FeedConfig], timeout: int = 12) -> List[NewsItem]:
+def _copy_item(item: NewsItem, source: str) -> NewsItem:
+    copied = copy.copy(item)
+    copied.source = sys.intern(source)
+    return copied
+
+
+def _host_key(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _make_item(
+    feed: FeedConfig,
+    title: str,
+    link: str,
+    raw_summary: str,
+    published_at: Optional[datetime],
+    now: datetime,
+) -> NewsItem:
+    date_missing = False
+    if published_at is None:
+        published_at = now
+        date_missing = True
+    return NewsItem(
+        title=title,
+        link=link,
+        published_at=published_at,
+        source=feed.name,
+        date_missing=date_missing,
+        raw_summary=raw_summary,
+    )
+
+
+def _entries_to_items(entries: Iterable[dict], feed: FeedConfig, now: datetime) -> Iterator[NewsItem]:
+    for entry in entries:
+        title = _coerce_text(entry.get("title"))
+        link = _coerce_text(entry.get("link"))
+        raw_summary = _coerce_text(entry.get("summary") or entry.get("description"))
+        if not raw_summary:
+            content = entry.get("content")
+            if isinstance(content, list) and content:
+                raw_summary = _coerce_text(content[0].get("value"))
+        yield _make_item(feed, title, link, raw_summary, _parse_entry_datetime(entry), now)
+
+
+def _stream_to_items(entries: Iterable[StreamEntry], feed: FeedConfig, now: datetime) -> Iterator[NewsItem]:
+    for entry in entries:
+        yield _make_item(feed, entry.title, entry.link, entry.summary, entry.published_at, now)
+
+
+def _limit_items(items: Iterable[NewsItem], feed: FeedConfig, now: datetime) -> Iterator[NewsItem]:
+    """Apply the feed's ``max_items`` cap and ``max_age_hours`` cutoff.
+
+    Feeds list newest entries first, so iteration stops at the first dated
+    entry older than the cutoff; with a streaming source this also stops the
+    download.
+    """
+    cutoff = None
+    if feed.max_age_hours is not None:
+        cutoff = (now - timedelta(hours=feed.max_age_hours)).timestamp()
+    for count, item in enumerate(items):
+        if feed.max_items is not None and count >= feed.max_items:
+            return
+        if cutoff is not None and not item.date_missing and item.published_ts < cutoff:
+            return
+        yield item
+
+
+ParsedRow = Tuple[str, str, Optional[float], str]
+
+
+def _parse_buffered(
+    content: bytes, feed: FeedConfig, now: datetime, record: Optional[FeedMetrics] = None
+) -> List[NewsItem]:
+    # feedparser is slow to import and unused by the stream parser.
+    import feedparser
+
+    parsed = feedparser.parse(content)
+    if parsed.bozo:
+        print(f"[warn] RSS parse issue for {feed.name}: {parsed.bozo_exception}")
+        if record is not None:
+            record.parse_error = str(parsed.bozo_exception)
+    return list(_limit_items(_entries_to_items(parsed.entries, feed, now), feed, now))
+
+
+def _parse_to_rows(
+    content: bytes, feed: FeedConfig, now: datetime
+) -> Tuple[List[ParsedRow], str]:
+    """Process-pool entry point: parse ``content`` into compact tuples.
+
+    Only plain ``(title, link, published_ts, raw_summary)`` tuples cross the
+    process boundary, never feedparser objects; ``published_ts`` is ``None``
+    for entries without a date. The parse error, if any, comes back with
+    the rows.
+    """
+    record = FeedMetrics(name=feed.name, url=feed.url)
+    rows = [
+        (
+            item.title,
+            item.link,
+            None if item.date_missing else item.published_ts,
+            item.raw_summary,
+        )
+        for item in _parse_buffered(content, feed, now, record)
+    ]
+    return rows, record.parse_error
+
+
+def _rows_to_items(rows: Iterable[ParsedRow], feed: FeedConfig, now: datetime) -> List[NewsItem]:
+    return [
+        _make_item(
+            feed,
+            title,
+            link,
+            raw_summary,
+            None if published_ts is None else datetime.fromtimestamp(published_ts, timezone.utc),
+            now,
+        )
+        for title, link, published_ts, raw_summary in rows
+    ]
+
+
+def open_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool for ``parse_workers``, reusable across fetches.
+
+    Workers come from a fork server (or are spawned where there is none)
+    instead of being forked from this process, whose download threads may
+    hold locks that a forked child would inherit already taken.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def parse_pool_broken(pool: ProcessPoolExecutor) -> bool:
+    """Whether a worker of ``pool`` died, leaving it unable to take work."""
+    return bool(getattr(pool, "_broken", False))
+
+
+def _count_bytes(chunks: Iterable[bytes], record: FeedMetrics) -> Iterator[bytes]:
+    for chunk in chunks:
+        record.bytes += len(chunk)
+        yield chunk
+
+
+def _tee(chunks: Iterable[bytes], sink: List[bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        sink.append(chunk)
+        yield chunk
+
+
+def _parse_streaming(
+    response: requests.Response,
+    feed: FeedConfig,
+    now: datetime,
+    record: Optional[FeedMetrics] = None,
+    sink: Optional[List[bytes]] = None,
+) -> List[NewsItem]:
+    """Parse ``response`` as it downloads; ``sink`` collects the raw chunks."""
     items: List[NewsItem] = []
-    now = datetime.now(timezone.utc)
-    headers = {
-        "User-Agent": "daily-digest-bot/0.1 (+https://example.com)",
-        "Accept": "application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5",
-    }
-    for feed in feeds:
+    chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+    if record is not None:
+        chunks = _count_bytes(chunks, record)
+    if sink is not None:
+        chunks = _tee(chunks, sink)
+    entries = iter_stream_entries(chunks)
+    try:
+        for item in _limit_items(_stream_to_items(entries, feed, now), feed, now):
+            items.append(item)
+    except StreamParseError as exc:
+        if exc.buffered is not None:
+            # Nothing was emitted yet; read the rest of the body and let
+            # feedparser cope with the malformed document.
+            return _parse_buffered(b"".join([exc.buffered, *chunks]), feed, now, record)
+        print(f"[warn] RSS parse issue for {feed.name}: {exc}")
+        if record is not None:
+            record.parse_error = str(exc)
+    return items
+
+
+@dataclass
+class _FetchContext:
+    """Per-call state shared by every feed fetched in one ``_fetch_all``."""
+
+    session: requests.Session
+    now: datetime
+    host_limits: Dict[str, threading.BoundedSemaphore]
+    cache: Optional[FeedCache] = None
+    parser: str = "feedparser"
+    parse_pool: Optional[ProcessPoolExecutor] = None
+    parse_workers: int = 0
+    # Whether cleanup shuts ``parse_pool`` down; always true once a broken
+    # caller-owned pool was replaced for the rest of the fetch.
+    owns_pool: bool = False
+    metrics: Optional[RunMetrics] = None
+    health: Optional[FeedHealthStore] = None
+    planner: Optional[PollPlanner] = None
+    archive: Optional[FeedArchive] = None
+    # Set when a deadline gives up on in-flight feeds; cleanup then does not
+    # wait for them, and they no longer touch the shared stores.
+    abandoned: bool = False
+    _state_lock: threading.Lock = field(default_factory=threading.Lock)
+    _pool_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @contextmanager
+    def state_writes(self) -> Iterator[bool]:
+        """Hold while updating metrics, cache, archive, health or planner.
+
+        Yields ``False`` once the fetch was abandoned, so late feeds leave
+        the stores alone while the caller saves them.
+        """
+        with self._state_lock:
+            yield not self.abandoned
+
+    def abandon(self) -> None:
+        """Stop in-flight feeds from writing; waits for writes under way."""
+        with self._state_lock:
+            self.abandoned = True
+
+    def replace_parse_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Swap in a fresh pool for ``broken``, once, for the feeds still to parse."""
+        with self._pool_lock:
+            if self.parse_pool is not broken or self.abandoned:
+                return
+            if self.owns_pool:
+                broken.shutdown(wait=False)
+            self.parse_pool = open_parse_pool(max(self.parse_workers, 1))
+            self.owns_pool = True
+
+    def close_parse_pool(self) -> None:
+        with self._pool_lock:
+            pool, self.parse_pool = self.parse_pool, None
+        if pool is not None and self.owns_pool:
+            pool.shutdown(wait=not self.abandoned, cancel_futures=self.abandoned)
+
+
+def _add_feed_metrics(ctx: _FetchContext, record: FeedMetrics) -> None:
+    if ctx.metrics is not None:
+        with ctx.state_writes() as allowed:
+            if allowed:
+                ctx.metrics.add_feed(record)
+
+
+def _fetch_feed(feed: FeedConfig, ctx: _FetchContext) -> List[NewsItem]:
+    record = FeedMetrics(name=feed.name, url=feed.url)
+    deferred = _deferred_items(feed, ctx)
+    if deferred is not None:
+        record.cached = record.deferred = True
+        record.entries = len(deferred)
+        _add_feed_metrics(ctx, record)
+        return deferred
+    health = ctx.health
+    if health is not None and not health.allow(feed.url, ctx.now):
+        record.skipped = True
+        record.error = "circuit open"
+        print(f"[info] Skipping {feed.name}: circuit open after repeated failures")
+        _add_feed_metrics(ctx, record)
+        return []
+    try:
+        items = _fetch_feed_items(feed, ctx, record)
+        record.entries = len(items)
+    finally:
+        _add_feed_metrics(ctx, record)
+    with ctx.state_writes() as allowed:
+        if not allowed:
+            return items
+        if health is not None:
+            health.record(record, ctx.now)
+        if ctx.planner is not None and not record.error:
+            ctx.planner.observe(
+                feed.url,
+                (None if item.date_missing else item.published_ts for item in items),
+                ctx.now,
+            )
+    return items
+
+
+def _deferred_items(feed: FeedConfig, ctx: _FetchContext) -> Optional[List[NewsItem]]:
+    """The cached entries of ``feed`` when the planner says not to request it."""
+    if ctx.planner is None or ctx.cache is None:
+        return None
+    if ctx.planner.should_fetch(feed.url, ctx.now):
+        return None
+    cached = ctx.cache.cached_items(feed.url, feed.name, ctx.now)
+    if cached is None:
+        return None
+    return list(_limit_items(cached, feed, ctx.now))
+
+
+def _get(
+    ctx: _FetchContext,
+    feed: FeedConfig,
+    timeout: Tuple[float, float],
+    headers: Dict[str, str],
+    streaming: bool,
+    record: FeedMetrics,
+) -> requests.Response:
+    response = ctx.session.get(
+        feed.url,
+        timeout=timeout,
+        headers=headers,
+        **({"stream": True} if streaming else {}),
+    )
+    record.status = response.status_code
+    response.raise_for_status()
+    return response
+
+
+def _fetch_feed_items(feed: FeedConfig, ctx: _FetchContext, record: FeedMetrics) -> List[NewsItem]:
+    now = ctx.now
+    cache = ctx.cache
+    headers = cache.validators(feed.url) if cache is not None else {}
+    streaming = ctx.parser == "stream"
+    if ctx.health is not None:
+        timeout = ctx.health.timeouts(feed)
+    else:
+        timeout = (feed.connect_timeout, feed.read_timeout)
+    with ctx.host_limits[_host_key(feed.url)]:
+        started = time.perf_counter()
         try:
-            response = requests.get(feed.url, timeout=timeout, headers=headers)
-            response.raise_for_status()
+            response = _get(ctx, feed, timeout, headers, streaming, record)
+            if response.status_code == 304:
+                cached = cache.cached_items(feed.url, feed.name, now) if cache else None
+                if cached is not None:
+                    record.latency_seconds = time.perf_counter() - started
+                    record.cached = True
+                    return list(_limit_items(cached, feed, now))
+                # Validators were sent but the entries they stood for are
+                # gone (cache file lost or pruned); ask for the full feed.
+                if streaming:
+                    response.close()
+                response = _get(ctx, feed, timeout, {}, streaming, record)
+                if response.status_code == 304:
+                    raise requests.HTTPError(
+                        "304 Not Modified without a cached copy", response=response
+                    )
         except requests.RequestException as exc:
-            print(f"[warn] Failed to fetch {feed.name}: {exc}")
-            continue
-
-        parsed = feedparser.parse(response.content)
-        if parsed.bozo:
-            print(f"[warn] RSS parse issue for {feed.name}: {parsed.bozo_exception}")
-
-        for entry in parsed.entries:
-            title = _coerce_text(entry.get("title"))
-            link = _coerce_text(entry.get("link"))
-            raw_summary = _coerce_text(entry.get("summary") or entry.get("description"))
-            if not raw_summary:
-                content = entry.get("content")
-                if isinstance(content, list) and content:
-                    raw_summary = _coerce_text(content[0].get("value"))
-            summary = _summarize_text(raw_summary)
-            if not summary and title:
-                summary = title
-            published_at = _parse_entry_datetime(entry)
-            date_missing = False
-            if published_at is None:
-                published_at = now
-                date_missing = True
-            items.append(
-                NewsItem(
-                    title=title,
-                    link=link,
-                    published_at=published_at,
-                    source=feed.name,
-                    summary=summary,
-                    date_missing=date_missing,
-                )
+            record.latency_seconds = time.perf_counter() - started
+            record.error = str(exc)
+            if not ctx.abandoned:
+                print(f"[warn] Failed to fetch {feed.name}: {exc}")
+            return []
+
+        if streaming:
+            body_chunks: Optional[List[bytes]] = [] if ctx.archive is not None else None
+            try:
+                items = _parse_streaming(response, feed, now, record, body_chunks)
+            except requests.RequestException as exc:
+                record.error = str(exc)
+                if not ctx.abandoned:
+                    print(f"[warn] Failed to fetch {feed.name}: {exc}")
+                return []
+            finally:
+                response.close()
+                record.latency_seconds = time.perf_counter() - started
+
+    if not streaming:
+        record.latency_seconds = time.perf_counter() - started
+        record.bytes = len(response.content)
+        parse_started = time.perf_counter()
+        pool = ctx.parse_pool
+        if pool is not None:
+            items = _parse_in_pool(ctx, pool, response.content, feed, record)
+        else:
+            items = _parse_buffered(response.content, feed, now, record)
+        record.parse_seconds = time.perf_counter() - parse_started
+    with ctx.state_writes() as allowed:
+        if allowed and ctx.archive is not None:
+            # The stream parser stops reading at max_items / max_age_hours,
+            # so it may archive a truncated body.
+            ctx.archive.record(
+                feed.url,
+                feed.name,
+                response.status_code,
+                response.headers,
+                b"".join(body_chunks) if streaming else response.content,
+                now,
+            )
+        if allowed and cache is not None:
+            cache.store(
+                feed.url,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                items=items,
             )
     return items
+
+
+def _parse_in_pool(
+    ctx: _FetchContext,
+    pool: ProcessPoolExecutor,
+    content: bytes,
+    feed: FeedConfig,
+    record: FeedMetrics,
+) -> List[NewsItem]:
+    try:
+        rows, record.parse_error = pool.submit(_parse_to_rows, content, feed, ctx.now).result()
+    except BrokenProcessPool:
+        # A worker died (OOM kill, crash in a C extension) and took every
+        # queued parse with it; this feed is parsed here instead.
+        print(f"[warn] Parse worker died; parsing {feed.name} in-process")
+        ctx.replace_parse_pool(pool)
+        return _parse_buffered(content, feed, ctx.now, record)
+    return _rows_to_items(rows, feed, ctx.now)
+
+
+@contextmanager
+def _fetch_context(
+    feeds: Sequence[FeedConfig],
+    max_workers: int,
+    per_host_limit: int,
+    cache: Optional[FeedCache],
+    session: Optional[requests.Session],
+    parser: str,
+    parse_workers: int,
+    metrics: Optional[RunMetrics],
+    health: Optional[FeedHealthStore] = None,
+    planner: Optional[PollPlanner] = None,
+    archive: Optional[FeedArchive] = None,
+    now: Optional[datetime] = None,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> Iterator[_FetchContext]:
+    host_limits = {
+        _host_key(feed.url): threading.BoundedSemaphore(max(per_host_limit, 1))
+        for feed in feeds
+    }
+    owns_session = session is None
+    if session is None:
+        session = build_session(FetchConfig(max_workers=max_workers))
+    owns_pool = parse_pool is None
+    if parser == "stream" or not feeds:
+        parse_pool = None
+    elif parse_pool is None and parse_workers > 0:
+        parse_pool = open_parse_pool(parse_workers)
+    ctx = _FetchContext(
+        session=session,
+        now=now or datetime.now(timezone.utc),
+        host_limits=host_limits,
+        cache=cache,
+        parser=parser,
+        parse_pool=parse_pool,
+        parse_workers=parse_workers,
+        owns_pool=owns_pool,
+        metrics=metrics,
+        health=health,
+        planner=planner,
+        archive=archive,
+    )
+    try:
+        yield ctx
+    finally:
+        ctx.close_parse_pool()
+        if owns_session:
+            session.close()
+
+
+def _fetch_all(
+    feeds: Sequence[FeedConfig],
+    max_workers: int,
+    per_host_limit: int,
+    cache: Optional[FeedCache] = None,
+    session: Optional[requests.Session] = None,
+    parser: str = "feedparser",
+    parse_workers: int = 0,
+    metrics: Optional[RunMetrics] = None,
+    health: Optional[FeedHealthStore] = None,
+    planner: Optional[PollPlanner] = None,
+    archive: Optional[FeedArchive] = None,
+    now: Optional[datetime] = None,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> List[List[NewsItem]]:
+    """Fetch every feed, returning one item list per feed in input order.
+
+    With ``parse_workers`` > 0, downloaded bodies are parsed in a process
+    pool while the download threads wait on the result, so parsing runs on
+    several cores without changing the output order. A ``parse_pool`` from
+    ``open_parse_pool`` is used instead of a pool started for this call,
+    and is left running.
+    """
+    with _fetch_context(
+        feeds, max_workers, per_host_limit, cache, session, parser, parse_workers,
+        metrics, health, planner, archive, now, parse_pool,
+    ) as ctx:
+        if max_workers <= 1 or len(feeds) <= 1:
+            return [_fetch_feed(feed, ctx) for feed in feeds]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds))) as pool:
+            futures = [pool.submit(_fetch_feed, feed, ctx) for feed in feeds]
+            return [future.result() for future in futures]
+
+
+def fetch_feeds(
+    feeds: Iterable[FeedConfig],
+    max_workers: int = 1,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: Optional[FeedCache] = None,
+    session: Optional[requests.Session] = None,
+    parser: str = "feedparser",
+    parse_workers: int = 0,
+    metrics: Optional[RunMetrics] = None,
+    health: Optional[FeedHealthStore] = None,
+    planner: Optional[PollPlanner] = None,
+    archive: Optional[FeedArchive] = None,
+    now: Optional[datetime] = None,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> List[NewsItem]:
+    results = _fetch_all(
+        list(feeds), max_workers, per_host_limit, cache, session, parser, parse_workers,
+        metrics, health, planner, archive, now, parse_pool,
+    )
+    return [item for feed_items in results for item in feed_items]
+
+
+def _plan_groups(
+    groups: Sequence[Iterable[FeedConfig]],
+) -> Tuple[List[List[FeedConfig]], Dict[str, int], List[FeedConfig]]:
+    """Materialize ``groups`` and list each distinct URL once, first use first."""
+    materialized = [list(group) for group in groups]
+    unique: Dict[str, int] = {}
+    to_fetch: List[FeedConfig] = []
+    for group in materialized:
+        for feed in group:
+            if feed.url not in unique:
+                unique[feed.url] = len(to_fetch)
+                to_fetch.append(feed)
+    return materialized, unique, to_fetch
+
+
+def fetch_feed_groups(
+    groups: Sequence[Iterable[FeedConfig]],
+    max_workers: int = 1,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: Optional[FeedCache] = None,
+    session: Optional[requests.Session] = None,
+    parser: str = "feedparser",
+    parse_workers: int = 0,
+    metrics: Optional[RunMetrics] = None,
+    health: Optional[FeedHealthStore] = None,
+    planner: Optional[PollPlanner] = None,
+    archive: Optional[FeedArchive] = None,
+    now: Optional[datetime] = None,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> List[List[NewsItem]]:
+    """Fetch several feed lists through one worker pool.
+
+    Returns one item list per group, each ordered exactly as ``fetch_feeds``
+    would order it, so callers can fetch all sections concurrently. A URL
+    listed in several groups is downloaded and parsed once; every use after
+    the first gets its own copies of the items (renamed to that entry's feed
+    name) so groups can be scored independently.
+    """
+    materialized, unique, to_fetch = _plan_groups(groups)
+    results = _fetch_all(
+        to_fetch, max_workers, per_host_limit, cache, session, parser, parse_workers,
+        metrics, health, planner, archive, now, parse_pool,
+    )
+    used: set[str] = set()
+    grouped: List[List[NewsItem]] = []
+    for group in materialized:
+        group_items: List[NewsItem] = []
+        for feed in group:
+            feed_items = results[unique[feed.url]]
+            if feed.url in used:
+                feed_items = [_copy_item(item, feed.name) for item in feed_items]
+            used.add(feed.url)
+            group_items.extend(feed_items)
+        grouped.append(group_items)
+    return grouped
+
+
+def iter_feed_groups(
+    groups: Sequence[Iterable[FeedConfig]],
+    max_workers: int = 1,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: Optional[FeedCache] = None,
+    session: Optional[requests.Session] = None,
+    parser: str = "feedparser",
+    parse_workers: int = 0,
+    metrics: Optional[RunMetrics] = None,
+    health: Optional[FeedHealthStore] = None,
+    planner: Optional[PollPlanner] = None,
+    archive: Optional[FeedArchive] = None,
+    now: Optional[datetime] = None,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+    deadline: Optional[float] = None,
+) -> Iterator[Tuple[int, List[NewsItem]]]:
+    """Yield ``(group index, items)`` for each feed as soon as it completes.
+
+    The streaming counterpart of ``fetch_feed_groups``: the caller can score
+    and select items while slower feeds are still downloading. A URL listed
+    in several groups is fetched once and yielded once per use, later uses
+    as renamed copies. ``deadline`` is a ``time.monotonic()`` value; feeds
+    still pending then are skipped with a warning: those not yet started are
+    cancelled, and those in flight finish in the background without
+    updating ``cache``, ``metrics``, ``health``, ``planner`` or ``archive``,
+    so the caller can save them as soon as iteration ends.
+
+    With ``max_workers`` <= 1 and no ``deadline``, feeds are fetched one by
+    one on the calling thread, where a profiler started by the caller can
+    see them.
+    """
+    materialized, _, to_fetch = _plan_groups(groups)
+    uses: Dict[str, List[Tuple[int, str]]] = {}
+    for group_idx, group in enumerate(materialized):
+        for feed in group:
+            uses.setdefault(feed.url, []).append((group_idx, feed.name))
+    if not to_fetch:
+        return
+    with _fetch_context(
+        to_fetch, max_workers, per_host_limit, cache, session, parser, parse_workers,
+        metrics, health, planner, archive, now, parse_pool,
+    ) as ctx:
+
+        def feed_uses(
+            feed: FeedConfig, feed_items: List[NewsItem]
+        ) -> Iterator[Tuple[int, List[NewsItem]]]:
+            for use, (group_idx, name) in enumerate(uses[feed.url]):
+                if use:
+                    yield group_idx, [_copy_item(item, name) for item in feed_items]
+                else:
+                    yield group_idx, feed_items
+
+        if max_workers <= 1 and deadline is None:
+            for feed in to_fetch:
+                yield from feed_uses(feed, _fetch_feed(feed, ctx))
+            return
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch))))
+        futures = {pool.submit(_fetch_feed, feed, ctx): feed for feed in to_fetch}
+        try:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            for future in as_completed(futures, timeout=timeout):
+                yield from feed_uses(futures[future], future.result())
+        except FuturesTimeout:
+            pending = [feed.name for future, feed in futures.items() if not future.done()]
+            print(
+                f"[warn] Fetch deadline reached; continuing without {len(pending)} "
+                f"feed(s): {', '.join(pending)}"
+            )
+            ctx.abandon()
+        finally:
+            pool.shutdown(wait=not ctx.abandoned, cancel_futures=True)
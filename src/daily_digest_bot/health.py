@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from daily_digest_bot.config import FeedConfig, HealthConfig
+from daily_digest_bot.metrics import FeedMetrics
+
+HEALTH_VERSION = 1
+# Latencies kept per feed for the percentiles.
+LATENCY_SAMPLES = 20
+# Samples needed before a feed's timeout is tightened.
+MIN_LATENCY_SAMPLES = 5
+
+
+def _percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(int(pct / 100 * len(ordered)), len(ordered) - 1)]
+
+
+@dataclass
+class FeedHealth:
+    """Running fetch statistics for one feed URL.
+
+    ``retry_at`` is the Unix time before which the feed is skipped; it is 0
+    while the circuit is closed.
+    """
+
+    name: str = ""
+    attempts: int = 0
+    successes: int = 0
+    consecutive_failures: int = 0
+    parse_errors: int = 0
+    skipped: int = 0
+    latencies: List[float] = field(default_factory=list)
+    last_error: str = ""
+    last_success: float = 0.0
+    retry_at: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 1.0
+
+    def latency(self, pct: float) -> Optional[float]:
+        return _percentile(self.latencies, pct)
+
+
+class FeedHealthStore:
+    """Per-feed health persisted between runs, with a circuit breaker.
+
+    After ``failure_threshold`` consecutive failures a feed's circuit opens
+    and the feed is skipped for ``backoff_minutes``. Once that passes, the
+    next run probes it: a success closes the circuit, a failure reopens it
+    for twice as long, up to ``max_backoff_hours``.
+
+    With ``adaptive_timeouts``, a feed that has been answering quickly gets
+    a read timeout derived from its recent p95 latency instead of the
+    configured ``read_timeout``, so a hang fails fast. The configured value
+    stays the ceiling, and a feed whose last attempt failed gets the full
+    timeout again.
+    """
+
+    def __init__(self, path: Path, config: HealthConfig = HealthConfig()) -> None:
+        self.path = path
+        self.config = config
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, FeedHealth] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"[warn] Ignoring unreadable feed health file {self.path}: {exc}")
+            return
+        if data.get("version") != HEALTH_VERSION:
+            return
+        fields = set(FeedHealth.__dataclass_fields__)
+        for url, raw in (data.get("feeds") or {}).items():
+            self._feeds[url] = FeedHealth(**{k: v for k, v in raw.items() if k in fields})
+
+    def get(self, url: str) -> Optional[FeedHealth]:
+        with self._lock:
+            return self._feeds.get(url)
+
+    def allow(self, url: str, now: datetime) -> bool:
+        """Whether ``url`` should be fetched; counts a skip when it should not."""
+        with self._lock:
+            entry = self._feeds.get(url)
+            if entry is None or entry.retry_at <= now.timestamp():
+                return True
+            entry.skipped += 1
+            return False
+
+    def timeouts(self, feed: FeedConfig) -> Tuple[float, float]:
+        """``(connect, read)`` timeouts for the next request to ``feed``."""
+        with self._lock:
+            entry = self._feeds.get(feed.url)
+            latencies = list(entry.latencies) if entry is not None else []
+            failing = entry is not None and entry.consecutive_failures > 0
+        if (
+            not self.config.adaptive_timeouts
+            or failing
+            or len(latencies) < MIN_LATENCY_SAMPLES
+        ):
+            return feed.connect_timeout, feed.read_timeout
+        p95 = _percentile(latencies, 95) or 0.0
+        read = max(self.config.min_read_timeout, p95 * self.config.timeout_multiplier)
+        return feed.connect_timeout, min(read, feed.read_timeout)
+
+    def record(self, record: FeedMetrics, now: datetime) -> None:
+        """Fold one fetch attempt into the feed's statistics.
+
+        A request error counts as a failure, and so does a parse error that
+        produced no entries. Parse errors are counted either way.
+        """
+        failed = bool(record.error) or bool(record.parse_error and not record.entries)
+        timestamp = now.timestamp()
+        with self._lock:
+            entry = self._feeds.setdefault(record.url, FeedHealth())
+            entry.name = record.name
+            entry.attempts += 1
+            if record.parse_error:
+                entry.parse_errors += 1
+            if not failed:
+                entry.successes += 1
+                entry.consecutive_failures = 0
+                entry.retry_at = 0.0
+                entry.last_success = timestamp
+                entry.latencies = (entry.latencies + [round(record.latency_seconds, 4)])[
+                    -LATENCY_SAMPLES:
+                ]
+                return
+            entry.consecutive_failures += 1
+            entry.last_error = record.error or record.parse_error
+            failures = entry.consecutive_failures
+            if failures < self.config.failure_threshold:
+                return
+            backoff = min(
+                self.config.backoff_minutes * 60 * 2 ** (failures - self.config.failure_threshold),
+                self.config.max_backoff_hours * 3600,
+            )
+            entry.retry_at = timestamp + backoff
+        print(
+            f"[warn] {record.name} failed {failures} times in a row; "
+            f"skipping it for {backoff / 60:.0f} min"
+        )
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {
+                "version": HEALTH_VERSION,
+                "feeds": {url: asdict(entry) for url, entry in self._feeds.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def report(self, limit: int = 10, now: Optional[datetime] = None) -> str:
+        """The slowest and the least reliable feeds as two text tables."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            entries = [FeedHealth(**asdict(entry)) for entry in self._feeds.values()]
+        if not entries:
+            return f"No feed health recorded yet in {self.path}"
+
+        def row(entry: FeedHealth) -> str:
+            p50, p95 = entry.latency(50), entry.latency(95)
+            latency = "-" if p50 is None else f"{p50:6.2f}s / {p95:6.2f}s"
+            state = "ok"
+            if entry.retry_at > now.timestamp():
+                minutes = (entry.retry_at - now.timestamp()) / 60
+                state = f"open, probe in {minutes:.0f} min"
+            elif entry.consecutive_failures:
+                state = f"{entry.consecutive_failures} failing"
+            return (
+                f"  {entry.name[:32]:<32} {entry.success_rate:6.0%} {entry.attempts:5d} "
+                f"{latency:>19} {entry.parse_errors:5d}  {state}"
+            )
+
+        header = f"  {'feed':<32} {'ok':>6} {'runs':>5} {'p50 / p95':>19} {'parse':>5}  state"
+        slowest = sorted(
+            (entry for entry in entries if entry.latencies),
+            key=lambda entry: entry.latency(95) or 0.0,
+            reverse=True,
+        )[:limit]
+        unreliable = sorted(
+            (entry for entry in entries if entry.successes < entry.attempts),
+            key=lambda entry: (entry.success_rate, -entry.consecutive_failures),
+        )[:limit]
+        lines = ["Slowest feeds (by p95 latency):", header]
+        lines += [row(entry) for entry in slowest] or ["  (none)"]
+        lines += ["", "Least reliable feeds:", header]
+        lines += [row(entry) for entry in unreliable] or ["  (none)"]
+        return "\n".join(lines)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import hashlib
+from pathlib import Path
+import re
+import sqlite3
+from typing import Dict, Iterable, List
+
+from daily_digest_bot.feeds import NewsItem
+from daily_digest_bot.ranker import ranking_key
+
+HISTORY_MODES = ("drop", "penalize")
+
+
+def story_fingerprint(item: NewsItem) -> str:
+    """Stable identifier for a story across runs.
+
+    Uses the link when present (scheme and trailing slash ignored), otherwise
+    the normalized title and source.
+    """
+    link = item.link.strip().lower()
+    if link:
+        key = re.sub(r"^https?://", "", link).rstrip("/")
+    else:
+        key = " ".join(item.title.lower().split()) + "|" + item.source.lower()
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class SeenStore:
+    """SQLite-backed record of stories already included in a sent digest.
+
+    Entries older than ``ttl`` are purged when the store is opened, and the
+    surviving fingerprints are held in memory so each lookup is O(1).
+    """
+
+    def __init__(self, path: Path, ttl: timedelta, now: datetime) -> None:
+        self.path = path
+        self.ttl = ttl
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "fingerprint TEXT PRIMARY KEY, first_seen REAL NOT NULL)"
+        )
+        self._seen: Dict[str, float] = {}
+        self.purge(now)
+
+    def purge(self, now: datetime) -> None:
+        """Forget stories first seen more than ``ttl`` before ``now``."""
+        cutoff = (now - self.ttl).timestamp()
+        with self._conn:
+            self._conn.execute("DELETE FROM seen WHERE first_seen < ?", (cutoff,))
+        self._seen = dict(self._conn.execute("SELECT fingerprint, first_seen FROM seen"))
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, item: NewsItem) -> bool:
+        return story_fingerprint(item) in self._seen
+
+    def filter_items(
+        self,
+        items: Iterable[NewsItem],
+        mode: str = "drop",
+        penalty: float = 0.3,
+        resort: bool = True,
+    ) -> List[NewsItem]:
+        """Drop already-sent items, or scale their score by ``penalty``.
+
+        Penalized output is re-sorted with ``ranking_key`` so it stays in the
+        order ``rank_items`` produces, unless ``resort`` is false.
+        """
+        if mode not in HISTORY_MODES:
+            raise ValueError(f"Unknown history mode: {mode}")
+        if mode == "drop":
+            return [item for item in items if story_fingerprint(item) not in self._seen]
+        result = list(items)
+        for item in result:
+            if story_fingerprint(item) in self._seen:
+                item.score *= penalty
+        if resort:
+            result.sort(key=ranking_key)
+        return result
+
+    def mark_sent(self, items: Iterable[NewsItem], now: datetime) -> None:
+        timestamp = now.timestamp()
+        rows = []
+        for item in items:
+            fingerprint = story_fingerprint(item)
+            if fingerprint not in self._seen:
+                self._seen[fingerprint] = timestamp
+                rows.append((fingerprint, timestamp))
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (fingerprint, first_seen) VALUES (?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Mapping, Optional, Sequence
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+class KeywordMatcher:
+    """Keyword list compiled into a single regex, scanned once per text.
+
+    ``weighted_hits`` returns the summed weight of the distinct keywords found
+    in a text (a keyword listed twice counts twice, as in a plain scan). In
+    the default substring mode a keyword matches anywhere, like ``kw in
+    text``; with ``whole_word`` it must not touch a word character on either
+    side. Matching is case-insensitive.
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        weights: Optional[Mapping[str, float]] = None,
+        whole_word: bool = False,
+    ) -> None:
+        lowered_weights = {k.lower(): float(v) for k, v in (weights or {}).items()}
+        self.whole_word = whole_word
+        self.weights: Dict[str, float] = {}
+        for keyword in keywords:
+            term = keyword.lower()
+            if not term:
+                continue
+            self.weights[term] = self.weights.get(term, 0.0) + lowered_weights.get(term, 1.0)
+
+        terms = sorted(self.weights, key=lambda t: (-len(t), t))
+        # The regex reports the longest keyword starting at each position;
+        # shorter keywords that are prefixes of it are credited through this
+        # precomputed closure so overlapping keywords are all counted.
+        self._closure: Dict[str, List[str]] = {
+            term: [
+                other
+                for other in terms
+                if term.startswith(other)
+                and (
+                    not whole_word
+                    or len(other) == len(term)
+                    or not _WORD_CHAR.match(term[len(other)])
+                )
+            ]
+            for term in terms
+        }
+        self._pattern: Optional[re.Pattern[str]] = None
+        if terms:
+            alternation = "|".join(re.escape(term) for term in terms)
+            if whole_word:
+                source = rf"(?<!\w)(?=({alternation})(?!\w))"
+            else:
+                source = rf"(?=({alternation}))"
+            self._pattern = re.compile(source)
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def matches(self, text: str) -> set[str]:
+        if self._pattern is None:
+            return set()
+        found: set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            term = match.group(1)
+            if term not in found:
+                found.update(self._closure[term])
+        return found
+
+    def weighted_hits(self, text: str) -> float:
+        return sum(self.weights[term] for term in self.matches(text))
@@ -2,18 +2,36 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 import sys
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
 
-from zoneinfo import ZoneInfo
+from daily_digest_bot.config import AppConfig, SectionConfig, SubscriberConfig, load_config
 
-from daily_digest_bot.config import AppConfig, load_config
-from daily_digest_bot.dedupe import dedupe_items
-from daily_digest_bot.emailer import send_email
-from daily_digest_bot.feeds import fetch_feeds
-from daily_digest_bot.ranker import rank_items
-from daily_digest_bot.render import render_email
+# Stage modules pull in requests, feedparser, smtplib and friends, so they are
+# imported where each stage runs; ``--help`` and ``--check-config`` stay fast.
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import requests
+
+    from daily_digest_bot.archive import FeedArchive
+    from daily_digest_bot.cache import FeedCache
+    from daily_digest_bot.feeds import NewsItem
+    from daily_digest_bot.health import FeedHealthStore
+    from daily_digest_bot.history import SeenStore
+    from daily_digest_bot.keywords import KeywordMatcher
+    from daily_digest_bot.metrics import RunMetrics
+    from daily_digest_bot.polling import PollPlanner
+    from daily_digest_bot.ranker import ScoringBase
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PROFILE_TOP_N = 25
+HEALTH_REPORT_TOP_N = 10
 
 
 def _resolve_output_dir(config: AppConfig, root: Path) -> Path:
@@ -24,6 +42,13 @@ def _resolve_output_dir(config: AppConfig, root: Path) -> Path:
     return output_dir
 
 
+def _resolve_path(path: str, root: Path) -> Path:
+    resolved = Path(path)
+    if not resolved.is_absolute():
+        resolved = root / resolved
+    return resolved
+
+
 def _apply_email_overrides(config: AppConfig) -> tuple[str, str]:
     from_email = os.getenv("DIGEST_FROM_EMAIL", "").strip() or config.email.from_email
     to_email = os.getenv("DIGEST_TO_EMAIL", "").strip() or config.email.to_email
@@ -36,55 +61,604 @@ def _print_summary(label: str, items) -> None:
         print(f"  - {item.title} ({item.source})")
 
 
+def _select_stories(
+    items: List[NewsItem],
+    limit: int,
+    config: AppConfig,
+    section: SectionConfig,
+    matcher: KeywordMatcher,
+    seen_store: Optional[SeenStore],
+    now_utc: datetime,
+    metrics: RunMetrics,
+) -> List[NewsItem]:
+    """The ``full`` pipeline: sort everything, dedupe everything, then cut."""
+    from daily_digest_bot.dedupe import collapse_duplicates, dedupe_items
+    from daily_digest_bot.ranker import rank_items
+
+    with metrics.stage("rank", section.name, items_in=len(items)) as stage:
+        scored = rank_items(items, section.source_weights, matcher, now=now_utc, engine="batch")
+        stage.items_out = len(scored)
+    if seen_store is not None:
+        with metrics.stage("history", section.name, items_in=len(scored)) as stage:
+            scored = seen_store.filter_items(scored, config.history.mode, config.history.penalty)
+            stage.items_out = len(scored)
+    with metrics.stage("canonical", section.name, items_in=len(scored)) as stage:
+        scored = collapse_duplicates(
+            scored, urls=config.dedupe.canonical_urls, titles=config.dedupe.exact_titles
+        )
+        stage.items_out = len(scored)
+    with metrics.stage("dedupe", section.name, items_in=len(scored)) as stage:
+        selected = dedupe_items(scored)[:limit]
+        stage.items_out = len(selected)
+    return selected
+
+
+class _SectionStream:
+    """The ``topk`` pipeline for one section, fed one feed at a time.
+
+    Each completed feed is scored against the run's shared ``now_utc``,
+    filtered against the history and pushed into a ``TopKSelector`` while
+    the other feeds are still downloading, so only the final pops remain
+    once the last response lands. Exact duplicates are dropped during those
+    pops, so the ``canonical`` stage only counts the ones met before
+    ``limit`` stories were found.
+    """
+
+    def __init__(
+        self,
+        section: SectionConfig,
+        matcher: KeywordMatcher,
+        config: AppConfig,
+        seen_store: Optional[SeenStore],
+        now_utc: datetime,
+    ) -> None:
+        from daily_digest_bot.dedupe import TopKSelector
+        from daily_digest_bot.metrics import StageMetrics
+
+        self.section = section
+        self.matcher = matcher
+        self.config = config
+        self.seen_store = seen_store
+        self.now_utc = now_utc
+        self.items: List[NewsItem] = []
+        self.selector = TopKSelector(
+            urls=config.dedupe.canonical_urls, titles=config.dedupe.exact_titles
+        )
+        self.rank = StageMetrics("rank", section.name, items_in=0, items_out=0)
+        self.history = StageMetrics("history", section.name, items_in=0, items_out=0)
+        self.canonical = StageMetrics("canonical", section.name, items_in=0, items_out=0)
+
+    def add(self, items: List[NewsItem]) -> None:
+        from daily_digest_bot.ranker import score_items
+
+        self.items.extend(items)
+        start = time.perf_counter()
+        scored = score_items(
+            items, self.section.source_weights, self.matcher, now=self.now_utc, engine="batch"
+        )
+        self.rank.seconds += time.perf_counter() - start
+        self.rank.items_in += len(items)
+        self.rank.items_out += len(scored)
+        if self.seen_store is not None:
+            start = time.perf_counter()
+            self.history.items_in += len(scored)
+            scored = self.seen_store.filter_items(
+                scored, self.config.history.mode, self.config.history.penalty, resort=False
+            )
+            self.history.items_out += len(scored)
+            self.history.seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        self.canonical.items_in += len(scored)
+        self.selector.add(scored)
+        self.canonical.seconds += time.perf_counter() - start
+
+    def select(self, limit: int, metrics: RunMetrics) -> List[NewsItem]:
+        metrics.add_stage(self.rank)
+        if self.seen_store is not None:
+            metrics.add_stage(self.history)
+        with metrics.stage("dedupe", self.section.name) as stage:
+            selected = self.selector.select(limit)
+            self.canonical.items_out = self.canonical.items_in - self.selector.duplicates
+            # Added here so it is listed before the dedupe stage.
+            metrics.add_stage(self.canonical)
+            stage.items_in = self.canonical.items_out
+            stage.items_out = len(selected)
+        return selected
+
+
+@dataclass
+class RunState:
+    """Resources reused across runs.
+
+    ``run`` opens and closes one per invocation; daemon mode keeps a single
+    instance alive so the HTTP session, feed cache and seen-story store stay
+    warm between digests; the same goes for the ``fetch.parse_workers``
+    process pool. Feed health and the poll planner are kept in memory
+    the same way, so a daemon's circuit breakers and publish-rate estimates
+    carry over between runs. ``replay_now`` is set when ``session`` answers
+    from the response archive instead of the network.
+    """
+
+    config: AppConfig
+    session: requests.Session
+    matchers: Dict[str, KeywordMatcher]
+    max_workers: int
+    feed_cache: Optional[FeedCache] = None
+    seen_store: Optional[SeenStore] = None
+    health: Optional[FeedHealthStore] = None
+    planner: Optional[PollPlanner] = None
+    archive: Optional[FeedArchive] = None
+    replay_now: Optional[datetime] = None
+    parse_pool: Optional[ProcessPoolExecutor] = None
+    # Subscriber keyword matchers, shared by every profile with the same list.
+    profile_matchers: Dict[tuple, KeywordMatcher] = field(default_factory=dict)
+
+    def matcher_for(self, subscriber: SubscriberConfig, section: SectionConfig) -> KeywordMatcher:
+        if subscriber.keywords is None:
+            return self.matchers[section.name]
+        key = (tuple(subscriber.keywords), tuple(sorted(subscriber.keyword_weights.items())))
+        matcher = self.profile_matchers.get(key)
+        if matcher is None:
+            from daily_digest_bot.keywords import KeywordMatcher
+
+            matcher = KeywordMatcher(
+                subscriber.keywords,
+                subscriber.keyword_weights,
+                whole_word=self.config.keyword_whole_word,
+            )
+            self.profile_matchers[key] = matcher
+        return matcher
+
+    def parse_pool_for_run(self) -> Optional[ProcessPoolExecutor]:
+        """The parse pool, restarted if a worker died during an earlier run."""
+        from daily_digest_bot.feeds import parse_pool_broken
+
+        if self.parse_pool is not None and parse_pool_broken(self.parse_pool):
+            print("[info] Restarting the parse pool after a worker died")
+            self.parse_pool.shutdown(wait=False)
+            self.parse_pool = _open_parse_pool(self.config)
+        return self.parse_pool
+
+    def close(self) -> None:
+        self.session.close()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=False, cancel_futures=True)
+        if self.feed_cache is not None:
+            self.feed_cache.save()
+        if self.seen_store is not None:
+            self.seen_store.close()
+        if self.health is not None:
+            self.health.save()
+        if self.planner is not None:
+            self.planner.save()
+
+
+def open_state(
+    config: AppConfig,
+    workers: int | None = None,
+    record: bool = False,
+    replay: Optional[str] = None,
+) -> RunState:
+    """Open the stores ``config`` enables.
+
+    ``record`` archives every response; the feed cache and poll planner are
+    left off so each feed returns a full body to record. ``replay`` (a date
+    or ISO time) serves responses from the archive instead, and leaves off
+    every store so a replay neither reads nor changes live state.
+    """
+    if replay is not None:
+        return _open_replay_state(config, workers, replay)
+    from daily_digest_bot.cache import FeedCache
+    from daily_digest_bot.health import FeedHealthStore
+    from daily_digest_bot.history import SeenStore
+    from daily_digest_bot.keywords import KeywordMatcher
+    from daily_digest_bot.polling import PollPlanner
+    from daily_digest_bot.session import build_session
+
+    max_workers = workers or config.fetch.max_workers
+    archive = None
+    if record or config.archive.record:
+        from daily_digest_bot.archive import FeedArchive
+
+        archive = FeedArchive(_resolve_path(config.archive.path, PROJECT_ROOT))
+    feed_cache = None
+    if config.fetch.http_cache and archive is None:
+        feed_cache = FeedCache(_resolve_path(config.fetch.cache_dir, PROJECT_ROOT) / "feeds.json")
+    seen_store = None
+    if config.history.enabled:
+        seen_store = SeenStore(
+            _resolve_path(config.history.path, PROJECT_ROOT),
+            ttl=timedelta(hours=config.history.ttl_hours),
+            now=datetime.now(timezone.utc),
+        )
+    health = None
+    if config.health.enabled:
+        health = FeedHealthStore(_resolve_path(config.health.path, PROJECT_ROOT), config.health)
+    planner = None
+    # Deferred feeds are served from the feed cache, so planning needs it.
+    if config.polling.enabled and feed_cache is not None:
+        planner = PollPlanner(_resolve_path(config.polling.path, PROJECT_ROOT), config.polling)
+    return RunState(
+        config=config,
+        session=build_session(replace(config.fetch, max_workers=max_workers)),
+        matchers={
+            section.name: KeywordMatcher(
+                section.keywords,
+                section.keyword_weights,
+                whole_word=config.keyword_whole_word,
+            )
+            for section in config.sections
+        },
+        max_workers=max_workers,
+        feed_cache=feed_cache,
+        seen_store=seen_store,
+        health=health,
+        planner=planner,
+        archive=archive,
+        parse_pool=_open_parse_pool(config),
+    )
+
+
+def _open_parse_pool(config: AppConfig) -> Optional[ProcessPoolExecutor]:
+    if config.fetch.parse_workers <= 0 or config.fetch.parser == "stream":
+        return None
+    from daily_digest_bot.feeds import open_parse_pool
+
+    return open_parse_pool(config.fetch.parse_workers)
+
+
+def _open_replay_state(config: AppConfig, workers: int | None, replay: str) -> RunState:
+    from daily_digest_bot.archive import ArchiveReader, ArchiveSession
+    from daily_digest_bot.keywords import KeywordMatcher
+
+    reader = ArchiveReader(_resolve_path(config.archive.path, PROJECT_ROOT), replay)
+    print(
+        f"[info] Replaying {len(reader.urls())} archived feeds as of {reader.now.isoformat()}"
+    )
+    return RunState(
+        config=config,
+        session=ArchiveSession(reader),
+        matchers={
+            section.name: KeywordMatcher(
+                section.keywords,
+                section.keyword_weights,
+                whole_word=config.keyword_whole_word,
+            )
+            for section in config.sections
+        },
+        max_workers=workers or config.fetch.max_workers,
+        replay_now=reader.now,
+        parse_pool=_open_parse_pool(config),
+    )
+
+
+def _section_limits(
+    config: AppConfig,
+    limit_world: Optional[int],
+    limit_india: Optional[int],
+    limits: Optional[Mapping[str, int]],
+) -> Dict[str, int]:
+    resolved = {section.name: section.limit for section in config.sections}
+    overrides = dict(limits or {})
+    if limit_world is not None:
+        overrides.setdefault("world", limit_world)
+    if limit_india is not None:
+        overrides.setdefault("india", limit_india)
+    for name, limit in overrides.items():
+        if name not in resolved:
+            raise ValueError(f"Unknown section in limit override: {name}")
+        resolved[name] = limit
+    return resolved
+
+
+def _scoring_bases(
+    state: RunState, section_items: List[List[NewsItem]], now_utc: datetime
+) -> Dict[str, ScoringBase]:
+    """Score the profile-independent parts once per section for all subscribers."""
+    from daily_digest_bot.ranker import ScoringBase
+
+    config = state.config
+    seen_store = state.seen_store
+    bases: Dict[str, ScoringBase] = {}
+    for section, items in zip(config.sections, section_items):
+        seen = [seen_store is not None and item in seen_store for item in items]
+        if config.history.mode == "drop":
+            items = [item for item, was_seen in zip(items, seen) if not was_seen]
+            seen = [False] * len(items)
+        base = ScoringBase(items, now=now_utc)
+        base.base = [
+            score * config.history.penalty if was_seen else score
+            for score, was_seen in zip(base.base, seen)
+        ]
+        bases[section.name] = base
+    return bases
+
+
+def _subscriber_digests(
+    state: RunState, section_items: List[List[NewsItem]], now_utc: datetime
+) -> List[Tuple[SubscriberConfig, str]]:
+    """Render one personalized digest per subscriber.
+
+    Fetching, parsing, recency and completeness are shared; each profile
+    only reapplies its source weights and keyword boost before selection.
+    """
+    from daily_digest_bot.dedupe import select_top_k
+    from daily_digest_bot.render import render_email
+
+    config = state.config
+    bases = _scoring_bases(state, section_items, now_utc)
+    # Story keys (canonical links, title keys) are the same for every
+    # subscriber, so each item's are computed at most once per section.
+    story_keys: Dict[str, list] = {name: [None] * len(base) for name, base in bases.items()}
+    digests: List[Tuple[SubscriberConfig, str]] = []
+    for subscriber in config.subscribers:
+        chosen = []
+        for section in config.sections:
+            if subscriber.sections and section.name not in subscriber.sections:
+                continue
+            base = bases[section.name]
+            weights = section.source_weights
+            if subscriber.source_weights:
+                weights = {**weights, **subscriber.source_weights}
+            scores = base.scores(weights, state.matcher_for(subscriber, section))
+            limit = subscriber.limits.get(section.name, section.limit)
+            stories = select_top_k(
+                base.items,
+                limit,
+                scores=scores,
+                urls=config.dedupe.canonical_urls,
+                titles=config.dedupe.exact_titles,
+                keys=story_keys[section.name],
+            )
+            chosen.append((section.title, stories))
+        digests.append((subscriber, render_email(chosen, now_utc)))
+    return digests
+
+
+def _subscriber_filename(email: str) -> str:
+    return re.sub(r"[^A-Za-z0-9@._-]", "_", email) + ".html"
+
+
 def run(
     config_path: str,
     dry_run: bool,
-    limit_world: int,
-    limit_india: int,
+    limit_world: Optional[int] = None,
+    limit_india: Optional[int] = None,
+    workers: int | None = None,
+    pipeline: str = "topk",
+    state: Optional[RunState] = None,
+    output_stamp: str = "%Y-%m-%d",
+    limits: Optional[Mapping[str, int]] = None,
+    prometheus: bool = False,
+    deadline_seconds: Optional[float] = None,
+    record: bool = False,
+    replay: Optional[str] = None,
 ) -> int:
-    config = load_config(config_path)
-    root = Path(__file__).resolve().parents[2]
-    now_utc = datetime.now(timezone.utc)
-    output_dir = _resolve_output_dir(config, root)
+    owns_state = state is None
+    if state is None:
+        state = open_state(load_config(config_path), workers, record=record, replay=replay)
+    try:
+        section_limits = _section_limits(state.config, limit_world, limit_india, limits)
+        return _run_with_state(
+            state, dry_run, section_limits, pipeline, output_stamp, prometheus, deadline_seconds
+        )
+    finally:
+        if owns_state:
+            state.close()
 
-    world_items = fetch_feeds(config.world_feeds)
-    india_items = fetch_feeds(config.india_feeds)
 
-    world_ranked = rank_items(
-        world_items, config.source_weights, config.keywords, now=now_utc
-    )
-    india_ranked = rank_items(
-        india_items, config.source_weights, config.keywords, now=now_utc
-    )
+def _run_with_state(
+    state: RunState,
+    dry_run: bool,
+    section_limits: Mapping[str, int],
+    pipeline: str,
+    output_stamp: str,
+    prometheus: bool = False,
+    deadline_seconds: Optional[float] = None,
+) -> int:
+    from zoneinfo import ZoneInfo
+
+    from daily_digest_bot.feeds import fetch_feed_groups, iter_feed_groups
+    from daily_digest_bot.metrics import RunMetrics
+    from daily_digest_bot.render import render_email
 
-    world_deduped = dedupe_items(world_ranked)[:limit_world]
-    india_deduped = dedupe_items(india_ranked)[:limit_india]
+    config = state.config
+    now_utc = state.replay_now or datetime.now(timezone.utc)
+    if state.replay_now is not None:
+        # A replay rebuilds a past digest; it never sends or overwrites one.
+        dry_run = True
+        output_stamp += "-replay"
+    metrics = RunMetrics(started_at=now_utc)
+    run_started = time.perf_counter()
+    output_dir = _resolve_output_dir(config, PROJECT_ROOT)
+    feed_cache = state.feed_cache
+    seen_store = state.seen_store
+    if feed_cache is not None:
+        feed_cache.reset_counters()
+    if seen_store is not None:
+        seen_store.purge(now_utc)
 
-    html = render_email(world_deduped, india_deduped, now_utc)
+    feed_groups = [section.feeds for section in config.sections]
+    fetch_options = dict(
+        max_workers=state.max_workers,
+        per_host_limit=config.fetch.per_host_limit,
+        cache=feed_cache,
+        session=state.session,
+        parser=config.fetch.parser,
+        parse_workers=config.fetch.parse_workers,
+        metrics=metrics,
+        health=state.health,
+        planner=state.planner,
+        archive=state.archive,
+        now=now_utc,
+        parse_pool=state.parse_pool_for_run(),
+    )
+    if deadline_seconds is None:
+        deadline_seconds = config.fetch.deadline_seconds
+    arrived = 0
+    if pipeline == "full":
+        if deadline_seconds:
+            print("[warn] The fetch deadline only applies to the topk pipeline; ignoring it.")
+        with metrics.stage("fetch") as stage:
+            section_items = fetch_feed_groups(feed_groups, **fetch_options)
+            stage.items_out = sum(len(items) for items in section_items)
+        # Ranking and dedupe are pure Python and hold the GIL, so threads
+        # would only interleave the sections; they run one after another.
+        selected = [
+            _select_stories(
+                items,
+                section_limits[section.name],
+                config,
+                section,
+                state.matchers[section.name],
+                seen_store,
+                now_utc,
+                metrics,
+            )
+            for section, items in zip(config.sections, section_items)
+        ]
+    else:
+        streams = [
+            _SectionStream(section, state.matchers[section.name], config, seen_store, now_utc)
+            for section in config.sections
+        ]
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        with metrics.stage("fetch") as stage:
+            # Feeds still in flight at the deadline stop writing to the
+            # cache, health and planner before this loop ends, so the saves
+            # below do not race them.
+            for group_idx, items in iter_feed_groups(
+                feed_groups, deadline=deadline, **fetch_options
+            ):
+                arrived += 1
+                streams[group_idx].add(items)
+            stage.items_out = sum(len(stream.items) for stream in streams)
+        section_items = [stream.items for stream in streams]
+        selected = [
+            stream.select(section_limits[stream.section.name], metrics) for stream in streams
+        ]
+    if feed_cache is not None:
+        feed_cache.save()
+    if state.health is not None:
+        state.health.save()
+    if state.planner is not None:
+        state.planner.save()
+    if pipeline != "full" and not arrived and any(feed_groups):
+        # Rendering nothing would overwrite the day's digest with an empty one.
+        print("[warn] No feed arrived before the deadline; skipping the digest.")
+        return 1
+
+    with metrics.stage("render", items_in=sum(len(stories) for stories in selected)):
+        html = render_email(
+            [(section.title, stories) for section, stories in zip(config.sections, selected)],
+            now_utc,
+        )
 
-    local_date = now_utc.astimezone(ZoneInfo("Asia/Kolkata")).strftime("%Y-%m-%d")
-    output_path = output_dir / f"{local_date}.html"
+    local_now = now_utc.astimezone(ZoneInfo("Asia/Kolkata"))
+    local_date = local_now.strftime("%Y-%m-%d")
+    output_path = output_dir / f"{local_now.strftime(output_stamp)}.html"
     output_path.write_text(html, encoding="utf-8")
 
-    _print_summary("World", world_deduped)
-    _print_summary("India", india_deduped)
+    for section, stories in zip(config.sections, selected):
+        _print_summary(section.title, stories)
+    if feed_cache is not None:
+        print(
+            f"[info] Feed cache: {feed_cache.hits} hits, {feed_cache.misses} misses"
+        )
+    deferred = sum(record.deferred for record in metrics.feeds)
+    if deferred:
+        print(f"[info] Poll planner: {deferred} feeds served from the cache without a request")
+    if state.archive is not None:
+        print(f"[info] Archive: {state.archive.recorded} responses recorded")
     print(f"[info] HTML written to {output_path}")
 
-    if dry_run:
-        print("[info] Dry run enabled; skipping email send.")
+    subscriber_digests: List[Tuple[SubscriberConfig, str]] = []
+    if config.subscribers:
+        with metrics.stage("personalize", items_in=len(config.subscribers)) as stage:
+            subscriber_digests = _subscriber_digests(state, section_items, now_utc)
+            stage.items_out = len(subscriber_digests)
+        subscriber_dir = output_dir / f"{local_now.strftime(output_stamp)}-subscribers"
+        subscriber_dir.mkdir(parents=True, exist_ok=True)
+        for subscriber, subscriber_html in subscriber_digests:
+            (subscriber_dir / _subscriber_filename(subscriber.email)).write_text(
+                subscriber_html, encoding="utf-8"
+            )
+        print(f"[info] {len(subscriber_digests)} subscriber digests written to {subscriber_dir}")
+
+    try:
+        if dry_run:
+            print("[info] Dry run enabled; skipping email send.")
+            return 0
+
+        from_email, to_email = _apply_email_overrides(config)
+        subject = f"{config.email.subject_prefix} {local_date}"
+        from daily_digest_bot.emailer import send_email
+
+        with metrics.stage("send"):
+            send_email(
+                html=html,
+                subject=subject,
+                from_email=from_email,
+                to_email=to_email,
+                smtp_host=config.email.smtp_host,
+                smtp_port=config.email.smtp_port,
+            )
+        print("[info] Email sent.")
+        if subscriber_digests:
+            from daily_digest_bot.emailer import BulkSender, OutgoingMessage
+
+            password = os.getenv("GMAIL_APP_PASSWORD", "").strip()
+            with metrics.stage("send_subscribers", items_in=len(subscriber_digests)) as stage:
+                with BulkSender.from_config(
+                    replace(config.email, from_email=from_email), password
+                ) as sender:
+                    report = sender.send(
+                        OutgoingMessage(subscriber.email, subject, subscriber_html)
+                        for subscriber, subscriber_html in subscriber_digests
+                    )
+                stage.items_out = len(report.sent)
+            print(
+                f"[info] Subscriber digests: {len(report.sent)} sent, "
+                f"{len(report.failed)} failed"
+            )
+            for email, error in report.failed.items():
+                print(f"[warn] Could not deliver to {email}: {error}")
+        if seen_store is not None:
+            seen_store.mark_sent([item for stories in selected for item in stories], now_utc)
         return 0
+    finally:
+        # Written even when sending fails, so a failed run can be diagnosed.
+        metrics.seconds = time.perf_counter() - run_started
+        print(f"[info] Timings: {metrics.summary()}")
+        removals = metrics.removal_summary()
+        if removals:
+            print(f"[info] Items removed: {removals}")
+        for path in metrics.write(output_path.with_suffix(""), prometheus=prometheus):
+            print(f"[info] Run metrics written to {path}")
+
+
+def check_config(config_path: str) -> int:
+    """Validate ``config_path`` without loading the fetch or send stages."""
+    try:
+        config = load_config(config_path)
+    except Exception as exc:
+        print(f"[error] {exc}")
+        return 1
+    feed_urls = {feed.url for section in config.sections for feed in section.feeds}
+    print(
+        f"[info] {config_path} OK: {len(config.sections)} sections, "
+        f"{len(feed_urls)} feeds, {len(config.daemon.schedules)} daemon schedules"
+    )
+    return 0
+
+
+def health_report(config_path: str, limit: int = HEALTH_REPORT_TOP_N) -> int:
+    """Print the slowest and least reliable feeds from the health file."""
+    from daily_digest_bot.health import FeedHealthStore
 
-    from_email, to_email = _apply_email_overrides(config)
-    subject = f"{config.email.subject_prefix} {local_date}"
-    send_email(
-        html=html,
-        subject=subject,
-        from_email=from_email,
-        to_email=to_email,
-        smtp_host=config.email.smtp_host,
-        smtp_port=config.email.smtp_port,
-    )
-    print("[info] Email sent.")
+    config = load_config(config_path)
+    store = FeedHealthStore(_resolve_path(config.health.path, PROJECT_ROOT), config.health)
+    print(store.report(limit))
     return 0
 
 
@@ -99,19 +673,149 @@ def main() -> int:
     )
     parser.add_argument("--dry-run", action="store_true", help="Skip sending email")
     parser.add_argument(
-        "--limit-world", type=int, default=5, help="Number of world stories"
+        "--limit-world", type=int, default=None, help="Number of world stories"
+    )
+    parser.add_argument(
+        "--limit-india", type=int, default=None, help="Number of India stories"
+    )
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="SECTION=N",
+        help="Number of stories for a named section (repeatable)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Concurrent feed downloads (overrides fetch.max_workers)",
     )
     parser.add_argument(
-        "--limit-india", type=int, default=5, help="Number of India stories"
+        "--pipeline",
+        choices=("topk", "full"),
+        default="topk",
+        help=(
+            "Score and select stories as each feed arrives (default) "
+            "or sort and dedupe everything after fetching"
+        ),
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Render with the feeds fetched so far after this long (overrides fetch.deadline_seconds)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay running and build digests on the daemon.schedules in config",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Store every fetched response in the archive (archive.path in config)",
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="DATE",
+        help="Rebuild the digest from the responses archived on DATE (or up to an ISO time) without network access",
+    )
+    parser.add_argument(
+        "--check-config",
+        action="store_true",
+        help="Validate the config file and exit without fetching or sending",
+    )
+    parser.add_argument(
+        "--health-report",
+        action="store_true",
+        help="Print the slowest and least reliable feeds recorded so far and exit",
+    )
+    parser.add_argument(
+        "--prometheus",
+        action="store_true",
+        help="Also write run metrics in Prometheus text format next to the HTML",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile and print the hottest functions",
     )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.deadline is not None and args.deadline < 0:
+        parser.error("--deadline must not be negative")
+    if args.replay is not None and (args.record or args.daemon):
+        parser.error("--replay cannot be combined with --record or --daemon")
+    limits: Dict[str, int] = {}
+    for spec in args.limit:
+        name, sep, value = spec.partition("=")
+        if not sep or not name.strip() or not value.strip().isdigit():
+            parser.error(f"--limit expects SECTION=N, got {spec!r}")
+        limits[name.strip()] = int(value)
+    if args.check_config:
+        return check_config(args.config)
+    if args.health_report:
+        try:
+            return health_report(args.config)
+        except Exception as exc:
+            print(f"[error] {exc}")
+            return 1
+
+    if args.profile:
+        # cProfile only sees the thread that enabled it, so fetch on this one.
+        print("[info] Profiling: feeds are fetched one at a time on the main thread.")
+        args.workers = 1
+        if args.deadline:
+            print("[warn] The fetch deadline is ignored while profiling.")
+        args.deadline = 0
+        import cProfile
+        import pstats
 
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return _dispatch(args, limits)
+        finally:
+            profiler.disable()
+            stats = pstats.Stats(profiler, stream=sys.stdout)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_N)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_TOP_N)
+    return _dispatch(args, limits)
+
+
+def _dispatch(args: argparse.Namespace, limits: Dict[str, int]) -> int:
     try:
+        if args.daemon:
+            from daily_digest_bot.daemon import run_daemon
+
+            return run_daemon(
+                config_path=args.config,
+                dry_run=args.dry_run,
+                limit_world=args.limit_world,
+                limit_india=args.limit_india,
+                workers=args.workers,
+                pipeline=args.pipeline,
+                limits=limits,
+                prometheus=args.prometheus,
+                record=args.record,
+                deadline_seconds=args.deadline,
+            )
         return run(
             config_path=args.config,
             dry_run=args.dry_run,
             limit_world=args.limit_world,
             limit_india=args.limit_india,
+            workers=args.workers,
+            pipeline=args.pipeline,
+            limits=limits,
+            prometheus=args.prometheus,
+            deadline_seconds=args.deadline,
+            record=args.record,
+            replay=args.replay,
         )
     except Exception as exc:
         print(f"[error] {exc}")
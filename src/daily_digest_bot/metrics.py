@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+# Stages that drop items; the run summary reports how many each removed.
+FILTER_STAGES = ("history", "canonical", "dedupe")
+
+
+@dataclass
+class FeedMetrics:
+    """Fetch statistics for one feed URL.
+
+    ``latency_seconds`` covers the request and body download. With the
+    ``stream`` parser download and parsing overlap, so parsing is included
+    there and ``parse_seconds`` stays 0. ``parse_error`` holds the parser's
+    complaint about a malformed document even when entries were recovered;
+    ``skipped`` marks a feed not requested because its circuit is open, and
+    ``deferred`` one served from the feed cache by the poll planner.
+    """
+
+    name: str
+    url: str
+    status: Optional[int] = None
+    latency_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    bytes: int = 0
+    entries: int = 0
+    cached: bool = False
+    error: str = ""
+    parse_error: str = ""
+    skipped: bool = False
+    deferred: bool = False
+
+
+@dataclass
+class StageMetrics:
+    """Duration and item counts of one pipeline stage."""
+
+    stage: str
+    section: str = ""
+    seconds: float = 0.0
+    items_in: Optional[int] = None
+    items_out: Optional[int] = None
+
+    @property
+    def removed(self) -> Optional[int]:
+        if self.items_in is None or self.items_out is None:
+            return None
+        return self.items_in - self.items_out
+
+
+@dataclass
+class RunMetrics:
+    """Everything measured during one digest run.
+
+    Feeds and sections are processed on worker threads, so records are
+    appended under a lock.
+    """
+
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    seconds: float = 0.0
+    feeds: List[FeedMetrics] = field(default_factory=list)
+    stages: List[StageMetrics] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add_feed(self, record: FeedMetrics) -> None:
+        with self._lock:
+            self.feeds.append(record)
+
+    @contextmanager
+    def stage(
+        self, name: str, section: str = "", items_in: Optional[int] = None
+    ) -> Iterator[StageMetrics]:
+        """Time the ``with`` block; set ``items_out`` on the yielded record."""
+        record = StageMetrics(stage=name, section=section, items_in=items_in)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            with self._lock:
+                self.stages.append(record)
+
+    def add_stage(self, record: StageMetrics) -> None:
+        """Append a stage timed by the caller, e.g. summed over many batches."""
+        with self._lock:
+            self.stages.append(record)
+
+    def summary(self) -> str:
+        """One line of total seconds per stage, in first-seen order."""
+        totals: Dict[str, float] = {}
+        for record in self.stages:
+            totals[record.stage] = totals.get(record.stage, 0.0) + record.seconds
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in totals.items()]
+        return ", ".join([f"total {self.seconds:.2f}s", *parts])
+
+    def removal_summary(self) -> str:
+        """Items dropped per filtering stage, summed over sections.
+
+        ``dedupe`` includes the cut to each section's story limit.
+        """
+        totals: Dict[str, int] = {}
+        for record in self.stages:
+            if record.stage in FILTER_STAGES and record.removed is not None:
+                totals[record.stage] = totals.get(record.stage, 0) + record.removed
+        return ", ".join(f"{name} {count}" for name, count in totals.items())
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "seconds": round(self.seconds, 6),
+            "feeds": [asdict(record) for record in self.feeds],
+            "stages": [
+                {**asdict(record), "removed": record.removed} for record in self.stages
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the run in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def metric(name: str, help_text: str, samples: List[tuple]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+                lines.append(f"{name}{{{rendered}}} {value}" if rendered else f"{name} {value}")
+
+        metric("digest_run_seconds", "Wall time of the whole run.", [((), self.seconds)])
+        metric(
+            "digest_run_timestamp_seconds",
+            "Unix time the run started.",
+            [((), self.started_at.timestamp())],
+        )
+        feed_fields = (
+            ("latency_seconds", "digest_feed_fetch_seconds", "Request and download time per feed."),
+            ("parse_seconds", "digest_feed_parse_seconds", "Parse time per feed."),
+            ("bytes", "digest_feed_bytes", "Response body size per feed."),
+            ("entries", "digest_feed_entries", "Items produced per feed."),
+            ("status", "digest_feed_status", "HTTP status per feed (0 on failure)."),
+        )
+        for attr, name, help_text in feed_fields:
+            metric(
+                name,
+                help_text,
+                [
+                    ((("feed", record.name),), getattr(record, attr) or 0)
+                    for record in self.feeds
+                ],
+            )
+        stage_fields = (
+            ("seconds", "digest_stage_seconds", "Duration per stage."),
+            ("items_in", "digest_stage_items_in", "Items entering each stage."),
+            ("items_out", "digest_stage_items_out", "Items leaving each stage."),
+            ("removed", "digest_stage_items_removed", "Items dropped by each stage."),
+        )
+        for attr, name, help_text in stage_fields:
+            metric(
+                name,
+                help_text,
+                [
+                    ((("stage", record.stage), ("section", record.section)), getattr(record, attr))
+                    for record in self.stages
+                    if getattr(record, attr) is not None
+                ],
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, base: Path, prometheus: bool = False) -> List[Path]:
+        """Write ``<base>.metrics.json`` (and ``.prom``); return the paths."""
+        json_path = base.with_name(f"{base.name}.metrics.json")
+        json_path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        paths = [json_path]
+        if prometheus:
+            prom_path = base.with_name(f"{base.name}.prom")
+            prom_path.write_text(self.to_prometheus(), encoding="utf-8")
+            paths.append(prom_path)
+        return paths
+
+
+def _escape_label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import json
+import math
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from daily_digest_bot.config import PollingConfig
+
+PLAN_VERSION = 1
+# Distinct publish times kept per feed to estimate its rate.
+PUBLISH_SAMPLES = 30
+
+
+@dataclass
+class FeedCadence:
+    """Recent publish times of one feed and when it was last requested."""
+
+    published: List[float] = field(default_factory=list)
+    last_fetch: float = 0.0
+
+    def rate(self) -> Optional[float]:
+        """Entries per second, if there is enough history to tell.
+
+        The window runs to the last fetch rather than the newest entry, so a
+        feed that has gone quiet is rated down.
+        """
+        if len(self.published) < 2:
+            return None
+        span = max(self.last_fetch, self.published[-1]) - self.published[0]
+        if span <= 0:
+            return None
+        return (len(self.published) - 1) / span
+
+
+class PollPlanner:
+    """Decide per run which feeds are worth requesting.
+
+    Each fetch records the ``published_at`` times of the feed's entries.
+    From these the planner estimates the feed's publish rate and, treating
+    posts as a Poisson process, the chance that at least one entry appeared
+    since the feed was last requested. Feeds below ``fetch_probability``
+    are served from the feed cache instead. A feed with too little history,
+    or last requested more than ``max_staleness_hours`` ago, is always
+    fetched.
+    """
+
+    def __init__(self, path: Path, config: PollingConfig = PollingConfig()) -> None:
+        self.path = path
+        self.config = config
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, FeedCadence] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"[warn] Ignoring unreadable poll plan {self.path}: {exc}")
+            return
+        if data.get("version") != PLAN_VERSION:
+            return
+        for url, raw in (data.get("feeds") or {}).items():
+            self._feeds[url] = FeedCadence(
+                published=[float(ts) for ts in raw.get("published") or []],
+                last_fetch=float(raw.get("last_fetch", 0.0)),
+            )
+
+    def get(self, url: str) -> Optional[FeedCadence]:
+        with self._lock:
+            return self._feeds.get(url)
+
+    def new_entry_probability(self, url: str, now: datetime) -> float:
+        """Chance that ``url`` published something since it was last fetched."""
+        with self._lock:
+            cadence = self._feeds.get(url)
+            if cadence is None or not cadence.last_fetch:
+                return 1.0
+            rate = cadence.rate()
+            elapsed = now.timestamp() - cadence.last_fetch
+        if rate is None or elapsed >= self.config.max_staleness_hours * 3600:
+            return 1.0
+        return 1.0 - math.exp(-rate * max(elapsed, 0.0))
+
+    def should_fetch(self, url: str, now: datetime) -> bool:
+        return self.new_entry_probability(url, now) >= self.config.fetch_probability
+
+    def observe(self, url: str, published: Iterable[Optional[float]], now: datetime) -> None:
+        """Record a completed request and the publish times it returned.
+
+        ``None`` stands for an entry without a date; those say nothing about
+        the cadence and are ignored.
+        """
+        stamps = {ts for ts in published if ts is not None}
+        with self._lock:
+            cadence = self._feeds.setdefault(url, FeedCadence())
+            merged = sorted(stamps.union(cadence.published))
+            cadence.published = merged[-PUBLISH_SAMPLES:]
+            cadence.last_fetch = now.timestamp()
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {
+                "version": PLAN_VERSION,
+                "feeds": {url: asdict(cadence) for url, cadence in self._feeds.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -1,29 +1,50 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import heapq
 from math import exp, log
-from typing import Iterable, List, Mapping, Sequence
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 from daily_digest_bot.feeds import NewsItem
+from daily_digest_bot.keywords import KeywordMatcher
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is not installed
+    np = None
 
 HALF_LIFE_HOURS = 18.0
 KEYWORD_BOOST_PER = 0.12
 KEYWORD_BOOST_CAP = 0.5
+SCORING_ENGINES = ("scalar", "batch")
+
+
+def ranking_key(item: NewsItem) -> tuple:
+    """Sort key for ranked output: score, then recency, title and source."""
+    return (
+        -item.score,
+        -item.published_ts,
+        item.title.lower(),
+        item.source.lower(),
+    )
 
 
-def _recency_score(published_at: datetime, now: datetime, half_life_hours: float) -> float:
-    age_seconds = max((now - published_at).total_seconds(), 0.0)
+def _recency_score(published_ts: float, now_ts: float, half_life_hours: float) -> float:
+    age_seconds = max(now_ts - published_ts, 0.0)
     age_hours = age_seconds / 3600.0
     if half_life_hours <= 0:
         return 1.0
     return exp(-log(2) * (age_hours / half_life_hours))
 
 
-def _keyword_boost(text: str, keywords: Sequence[str]) -> float:
+def _keyword_boost(text: str, keywords: Union[Sequence[str], KeywordMatcher]) -> float:
     if not keywords:
         return 1.0
-    lowered = text.lower()
-    hits = sum(1 for kw in keywords if kw and kw.lower() in lowered)
+    if isinstance(keywords, KeywordMatcher):
+        hits = keywords.weighted_hits(text)
+    else:
+        lowered = text.lower()
+        hits = sum(1 for kw in keywords if kw and kw.lower() in lowered)
     boost = min(hits * KEYWORD_BOOST_PER, KEYWORD_BOOST_CAP)
     return 1.0 + boost
 
@@ -42,42 +63,173 @@ def _completeness_factor(item: NewsItem) -> float:
 def score_item(
     item: NewsItem,
     source_weights: Mapping[str, float],
-    keywords: Sequence[str],
+    keywords: Union[Sequence[str], KeywordMatcher],
     now: datetime | None = None,
     half_life_hours: float = HALF_LIFE_HOURS,
 ) -> float:
     current = now or datetime.now(timezone.utc)
     source_weight = source_weights.get(item.source, 1.0)
-    recency = _recency_score(item.published_at, current, half_life_hours)
-    keyword_boost = _keyword_boost(f"{item.title} {item.summary}", keywords)
+    recency = _recency_score(item.published_ts, current.timestamp(), half_life_hours)
+    keyword_boost = _keyword_boost(item.keyword_text, keywords) if keywords else 1.0
     completeness = _completeness_factor(item)
     return source_weight * recency * keyword_boost * completeness
 
 
-def rank_items(
+def _batch_scores(
+    items: Sequence[NewsItem],
+    source_weights: Mapping[str, float],
+    matcher: KeywordMatcher,
+    now: datetime,
+    half_life_hours: float,
+) -> List[float]:
+    """Score ``items`` column-wise; matches ``score_item`` within float tolerance.
+
+    Per-item inputs are gathered into flat columns once and recency decay is
+    applied to the whole timestamp column, with NumPy when it is installed.
+    """
+    timestamps = [item.published_ts for item in items]
+    factors = [
+        source_weights.get(item.source, 1.0) * _completeness_factor(item) for item in items
+    ]
+    if matcher:
+        factors = [
+            factor * _keyword_boost(item.keyword_text, matcher)
+            for factor, item in zip(factors, items)
+        ]
+    now_ts = now.timestamp()
+    if half_life_hours <= 0:
+        return factors
+    rate = -log(2) / (half_life_hours * 3600.0)
+    if np is not None:
+        ages = np.maximum(now_ts - np.asarray(timestamps, dtype=np.float64), 0.0)
+        return (np.exp(ages * rate) * np.asarray(factors, dtype=np.float64)).tolist()
+    return [
+        exp(max(now_ts - ts, 0.0) * rate) * factor
+        for ts, factor in zip(timestamps, factors)
+    ]
+
+
+class ScoringBase:
+    """The profile-independent part of ``score_item`` for a fixed item list.
+
+    Recency and completeness depend only on the item and the run's clock, so
+    they are computed once. ``scores`` then applies one profile's source
+    weights and keyword boost, which is all that differs between
+    subscribers; the result matches ``score_item`` within float tolerance.
+    Keyword boosts are memoized per matcher, so profiles sharing a keyword
+    list share one scan of the item texts.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[NewsItem],
+        now: datetime | None = None,
+        half_life_hours: float = HALF_LIFE_HOURS,
+    ) -> None:
+        self.items: List[NewsItem] = list(items)
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        self.base: List[float] = [
+            _recency_score(item.published_ts, now_ts, half_life_hours)
+            * _completeness_factor(item)
+            for item in self.items
+        ]
+        source_ids: Dict[str, int] = {}
+        self._source_index = [
+            source_ids.setdefault(item.source, len(source_ids)) for item in self.items
+        ]
+        self.sources: List[str] = list(source_ids)
+        self._texts: Optional[List[str]] = None
+        self._boosts: Dict[KeywordMatcher, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def keyword_boosts(self, matcher: KeywordMatcher) -> List[float]:
+        boosts = self._boosts.get(matcher)
+        if boosts is None:
+            if not matcher:
+                boosts = [1.0] * len(self.items)
+            else:
+                if self._texts is None:
+                    self._texts = [item.keyword_text for item in self.items]
+                boosts = [_keyword_boost(text, matcher) for text in self._texts]
+            self._boosts[matcher] = boosts
+        return boosts
+
+    def scores(
+        self, source_weights: Mapping[str, float], matcher: KeywordMatcher
+    ) -> List[float]:
+        """Per-item scores for one profile, in ``items`` order."""
+        weights = [source_weights.get(source, 1.0) for source in self.sources]
+        boosts = self.keyword_boosts(matcher)
+        if np is not None and self.items:
+            return (
+                np.asarray(self.base, dtype=np.float64)
+                * np.asarray(weights, dtype=np.float64)[self._source_index]
+                * np.asarray(boosts, dtype=np.float64)
+            ).tolist()
+        return [
+            base * weights[source] * boost
+            for base, source, boost in zip(self.base, self._source_index, boosts)
+        ]
+
+
+def score_items(
     items: Iterable[NewsItem],
     source_weights: Mapping[str, float],
-    keywords: Sequence[str],
+    keywords: Union[Sequence[str], KeywordMatcher],
     now: datetime | None = None,
     half_life_hours: float = HALF_LIFE_HOURS,
+    engine: str = "scalar",
 ) -> List[NewsItem]:
+    """Score ``items`` in place and return them in input order.
+
+    ``engine="batch"`` scores all items in one vectorized pass.
+    """
+    if engine not in SCORING_ENGINES:
+        raise ValueError(f"Unknown scoring engine: {engine}")
     current = now or datetime.now(timezone.utc)
-    ranked: List[NewsItem] = []
-    for item in items:
-        item.score = score_item(
-            item,
-            source_weights=source_weights,
-            keywords=keywords,
-            now=current,
-            half_life_hours=half_life_hours,
-        )
-        ranked.append(item)
-    ranked.sort(
-        key=lambda i: (
-            -i.score,
-            -i.published_at.timestamp(),
-            i.title.lower(),
-            i.source.lower(),
-        )
+    matcher = keywords if isinstance(keywords, KeywordMatcher) else KeywordMatcher(keywords)
+    scored: List[NewsItem] = list(items)
+    if engine == "batch":
+        scores = _batch_scores(scored, source_weights, matcher, current, half_life_hours)
+        for item, score in zip(scored, scores):
+            item.score = score
+    else:
+        for item in scored:
+            item.score = score_item(
+                item,
+                source_weights=source_weights,
+                keywords=matcher,
+                now=current,
+                half_life_hours=half_life_hours,
+            )
+    return scored
+
+
+def rank_items(
+    items: Iterable[NewsItem],
+    source_weights: Mapping[str, float],
+    keywords: Union[Sequence[str], KeywordMatcher],
+    now: datetime | None = None,
+    half_life_hours: float = HALF_LIFE_HOURS,
+    engine: str = "scalar",
+    limit: Optional[int] = None,
+) -> List[NewsItem]:
+    """Score ``items`` in place and return them best first.
+
+    With ``limit`` only the best ``limit`` items are returned, selected with a
+    partial sort instead of sorting the full list.
+    """
+    ranked = score_items(
+        items,
+        source_weights,
+        keywords,
+        now=now,
+        half_life_hours=half_life_hours,
+        engine=engine,
     )
+    if limit is not None and limit < len(ranked):
+        return heapq.nsmallest(max(limit, 0), ranked, key=ranking_key)
+    ranked.sort(key=ranking_key)
     return ranked
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from html import escape
-from typing import Iterable
+from typing import Iterable, Sequence, Tuple
 
 from zoneinfo import ZoneInfo
 
@@ -55,15 +55,16 @@ def _render_section(title: str, items: Iterable[NewsItem]) -> str:
 
 
 def render_email(
-    world_items: Iterable[NewsItem],
-    india_items: Iterable[NewsItem],
+    sections: Sequence[Tuple[str, Iterable[NewsItem]]],
     generated_at: datetime,
 ) -> str:
+    """Render ``(section title, items)`` pairs, in order, as one HTML digest."""
     local_date = generated_at.astimezone(ZoneInfo("Asia/Kolkata")).strftime(
         "%Y-%m-%d"
     )
-    world_section = _render_section("World Top Stories", world_items)
-    india_section = _render_section("India Top Stories", india_items)
+    sections_html = "\n      ".join(
+        _render_section(title, items) for title, items in sections
+    )
 
     return f"""<!doctype html>
 <html lang="en">
@@ -150,8 +151,7 @@ def render_email(
         <h1>Daily Digest</h1>
         <div class="meta">Local date: {local_date} · Generated at {_format_time(generated_at)}</div>
       </div>
-      {world_section}
-      {india_section}
+      {sections_html}
     </div>
   </body>
 </html>
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from daily_digest_bot.config import FetchConfig
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "daily-digest-bot/0.1 (+https://example.com)",
+    "Accept": "application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+class CappedRetry(Retry):
+    """``Retry`` that waits at most ``max_retry_after`` seconds on ``Retry-After``.
+
+    urllib3 sleeps for whatever the server asks, so ``Retry-After: 3600``
+    would stall a fetch worker, and the run with it, for an hour.
+    """
+
+    def __init__(self, *args, max_retry_after: float = FetchConfig.max_retry_after, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs) -> CappedRetry:
+        kwargs.setdefault("max_retry_after", self.max_retry_after)
+        return super().new(**kwargs)
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+def _build_retry(fetch: FetchConfig) -> Retry:
+    options = dict(
+        total=fetch.retries,
+        connect=fetch.retries,
+        read=fetch.retries,
+        status=fetch.retries,
+        backoff_factor=fetch.backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        max_retry_after=fetch.max_retry_after,
+    )
+    try:
+        return CappedRetry(**options, backoff_jitter=fetch.backoff_jitter)
+    except TypeError:
+        # urllib3 < 2.0 has no jitter support; fall back to plain exponential backoff.
+        return CappedRetry(**options)
+
+
+def build_session(fetch: FetchConfig | None = None) -> requests.Session:
+    """Build a keep-alive session with a pooled, retrying adapter.
+
+    The pool is sized for ``fetch.max_workers`` concurrent requests so the
+    worker threads in ``fetch_feeds`` can reuse connections (and TLS sessions)
+    to hosts that serve several feeds.
+    """
+    fetch = fetch or FetchConfig()
+    adapter = HTTPAdapter(
+        pool_connections=max(fetch.max_workers, 1),
+        pool_maxsize=max(fetch.max_workers, 1),
+        max_retries=_build_retry(fetch),
+    )
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+ENTRY_TAGS = {"item", "entry"}
+SUMMARY_TAGS = ("description", "summary")
+CONTENT_TAGS = ("encoded", "content")
+DATE_TAGS = ("pubDate", "published", "date", "updated")
+
+# Raw bytes are kept only until the first entry is emitted, so a feed that is
+# not well-formed XML can still be handed to feedparser from the start.
+FALLBACK_BUFFER_LIMIT = 2 * 1024 * 1024
+
+
+class StreamParseError(Exception):
+    """Raised when a feed cannot be parsed incrementally.
+
+    ``buffered`` holds every byte received so far when no entry had been
+    emitted yet, so the caller can retry with a tolerant parser; otherwise it
+    is ``None``.
+    """
+
+    def __init__(self, message: str, buffered: Optional[bytes]) -> None:
+        super().__init__(message)
+        self.buffered = buffered
+
+
+@dataclass
+class StreamEntry:
+    title: str
+    link: str
+    summary: str
+    published_at: Optional[datetime]
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(elem: Element) -> str:
+    return "".join(elem.itertext()).strip()
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        parsed = None
+    if parsed is None:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _entry_from_element(elem: Element) -> StreamEntry:
+    fields = {}
+    link = ""
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or _text(child)
+            elif child.get("rel", "alternate") == "alternate" and not link:
+                link = href.strip()
+            continue
+        fields.setdefault(name, _text(child))
+    summary = next((fields[t] for t in SUMMARY_TAGS if fields.get(t)), "")
+    if not summary:
+        summary = next((fields[t] for t in CONTENT_TAGS if fields.get(t)), "")
+    published_at = None
+    for tag in DATE_TAGS:
+        if fields.get(tag):
+            published_at = _parse_date(fields[tag])
+            if published_at is not None:
+                break
+    return StreamEntry(
+        title=fields.get("title", ""),
+        link=link,
+        summary=summary,
+        published_at=published_at,
+    )
+
+
+def iter_stream_entries(chunks: Iterable[bytes]) -> Iterator[StreamEntry]:
+    """Yield RSS/Atom entries as soon as their closing tag has been received.
+
+    Each entry element is detached from the tree once it has been converted,
+    so memory stays bounded by the largest single entry rather than by the
+    size of the document. Consumers may stop iterating at any point.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    stack: List[Element] = []
+    buffered: Optional[List[bytes]] = []
+    buffered_size = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if buffered is not None:
+            buffered.append(chunk)
+            buffered_size += len(chunk)
+            if buffered_size > FALLBACK_BUFFER_LIMIT:
+                buffered = None
+        try:
+            parser.feed(chunk)
+            events = list(parser.read_events())
+        except ParseError as exc:
+            raise StreamParseError(
+                str(exc), b"".join(buffered) if buffered is not None else None
+            ) from exc
+        for event, elem in events:
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) not in ENTRY_TAGS:
+                continue
+            entry = _entry_from_element(elem)
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+            buffered = None
+            yield entry
+    try:
+        parser.close()
+    except ParseError as exc:
+        raise StreamParseError(
+            str(exc), b"".join(buffered) if buffered is not None else None
+        ) from exc
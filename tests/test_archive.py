@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+from daily_digest_bot import feeds
+from daily_digest_bot.archive import ArchiveReader, ArchiveSession, FeedArchive
+from daily_digest_bot.config import FeedConfig
+
+NOW = datetime(2024, 3, 5, 6, tzinfo=timezone.utc)
+
+
+def _rss(title: str) -> bytes:
+    return (
+        "<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>t</title>"
+        f"<item><title>{title}</title><link>https://example.com/{title}</link>"
+        "<pubDate>Tue, 05 Mar 2024 05:00:00 GMT</pubDate></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+
+
+def test_reader_serves_latest_response_up_to_cutoff(tmp_path) -> None:
+    archive = FeedArchive(tmp_path)
+    archive.record("https://a.example/rss", "A", 200, {"ETag": "v1"}, _rss("first"), NOW)
+    later = NOW + timedelta(hours=2)
+    archive.record("https://a.example/rss", "A", 200, {"ETag": "v2"}, _rss("second"), later)
+    assert archive.recorded == 2
+
+    reader = ArchiveReader(tmp_path, "2024-03-05")
+    response = reader.response("https://a.example/rss")
+    assert response.body == _rss("second") and response.headers == {"ETag": "v2"}
+    assert reader.now == later and reader.response("https://b.example/rss") is None
+    reader.close()
+
+    early = ArchiveReader(tmp_path, (NOW + timedelta(hours=1)).isoformat())
+    assert early.response("https://a.example/rss").body == _rss("first")
+    early.close()
+
+
+def test_reader_recovers_records_missing_from_the_index(tmp_path) -> None:
+    archive = FeedArchive(tmp_path)
+    archive.record("https://a.example/rss", "A", 200, {}, _rss("a"), NOW)
+    archive.record("https://b.example/rss", "B", 200, {}, _rss("b"), NOW)
+    index = tmp_path / "2024-03-05.idx"
+    first, second = index.read_text().splitlines()
+    # The writer died halfway through the second index line.
+    index.write_text(first + "\n" + second[: len(second) // 2])
+
+    reader = ArchiveReader(tmp_path, "2024-03-05")
+    assert reader.urls() == ["https://a.example/rss", "https://b.example/rss"]
+    assert reader.response("https://b.example/rss").body == _rss("b")
+    reader.close()
+
+
+def test_replay_runs_fetch_from_the_archive(tmp_path) -> None:
+    archive = FeedArchive(tmp_path)
+    archive.record("https://a.example/rss", "A", 200, {}, _rss("story"), NOW)
+    reader = ArchiveReader(tmp_path, "2024-03-05")
+    session = ArchiveSession(reader)
+    config = [
+        FeedConfig(name="A", url="https://a.example/rss"),
+        FeedConfig(name="Missing", url="https://missing.example/rss"),
+    ]
+
+    for parser in ("feedparser", "stream"):
+        items = feeds.fetch_feeds(config, session=session, parser=parser, now=reader.now)
+        assert [item.link for item in items] == ["https://example.com/story"]
+    session.close()
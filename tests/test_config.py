@@ -0,0 +1,124 @@
+import json
+import os
+
+import pytest
+
+from daily_digest_bot import config as config_module
+from daily_digest_bot.config import load_config
+
+EMAIL = """
+email:
+  from_email: a@example.com
+  to_email: b@example.com
+"""
+
+
+def test_legacy_feed_lists_become_world_and_india_sections(tmp_path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        """
+world_feeds:
+  - name: W
+    url: https://w.example.com/rss
+india_feeds:
+  - name: I
+    url: https://i.example.com/rss
+keywords: [election]
+source_weights:
+  W: 1.2
+"""
+        + EMAIL,
+        encoding="utf-8",
+    )
+    config = load_config(str(path))
+    assert [s.name for s in config.sections] == ["world", "india"]
+    assert [s.title for s in config.sections] == ["World Top Stories", "India Top Stories"]
+    assert config.sections[0].feeds[0].name == "W"
+    assert config.sections[1].keywords == ["election"]
+    assert config.sections[1].source_weights == {"W": 1.2}
+
+
+def test_named_sections_override_keywords_and_weights(tmp_path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        """
+keywords: [election]
+source_weights:
+  A: 1.0
+  B: 0.9
+sections:
+  - name: tech
+    title: Technology
+    limit: 3
+    keywords: [chip]
+    source_weights:
+      B: 1.5
+    feeds:
+      - name: A
+        url: https://a.example.com/rss
+  - name: markets
+    feeds:
+      - name: B
+        url: https://b.example.com/rss
+"""
+        + EMAIL,
+        encoding="utf-8",
+    )
+    tech, markets = load_config(str(path)).sections
+    assert (tech.title, tech.limit, tech.keywords) == ("Technology", 3, ["chip"])
+    assert tech.source_weights == {"A": 1.0, "B": 1.5}
+    assert (markets.title, markets.limit, markets.keywords) == (
+        "Markets Top Stories",
+        5,
+        ["election"],
+    )
+
+
+def test_parsed_config_is_cached_until_the_file_changes(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("keywords: [election]\n" + EMAIL, encoding="utf-8")
+    first = config_module.load_config(str(path))
+    cache_file = tmp_path / ".cache" / "config.yaml.json"
+    assert json.loads(cache_file.read_text())["data"]["keywords"] == ["election"]
+
+    def fail(raw):
+        raise AssertionError("config was re-parsed")
+
+    monkeypatch.setattr(config_module, "_parse_config", fail)
+    assert config_module.load_config(str(path)) == first
+
+    path.write_text("keywords: [budget]\n" + EMAIL, encoding="utf-8")
+    monkeypatch.undo()
+    assert config_module.load_config(str(path)).keywords == ["budget"]
+
+    # A same-size edit with the mtime preserved (cp -p, rsync -t) is seen.
+    stat = path.stat()
+    path.write_text("keywords: [sports]\n" + EMAIL, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert config_module.load_config(str(path)).keywords == ["sports"]
+
+
+def test_subscribers_parse_and_validate_sections(tmp_path) -> None:
+    path = tmp_path / "config.yaml"
+    body = """
+sections:
+  - name: world
+    feeds: []
+subscribers:
+  - email: a@example.com
+    keywords: [election, {term: budget, weight: 2}]
+    source_weights: {BBC: 1.5}
+    limits: {world: 3}
+  - email: b@example.com
+"""
+    path.write_text(body + EMAIL, encoding="utf-8")
+    first, second = load_config(str(path), use_cache=False).subscribers
+    assert first.keywords == ["election", "budget"]
+    assert first.keyword_weights == {"budget": 2.0}
+    assert first.limits == {"world": 3}
+    assert second.keywords is None and second.sections == []
+
+    path.write_text(body.replace("{world: 3}", "{india: 3}") + EMAIL, encoding="utf-8")
+    with pytest.raises(ValueError, match="unknown section 'india'"):
+        load_config(str(path), use_cache=False)
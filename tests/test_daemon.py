@@ -0,0 +1,45 @@
+from daily_digest_bot import daemon
+
+CONFIG = "keywords: [{}]\nemail:\n  from_email: a@example.com\n  to_email: b@example.com\n"
+
+
+class _State:
+    def __init__(self, config) -> None:
+        self.config = config
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_reload_keeps_previous_config_when_new_stores_fail(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG.format("election"), encoding="utf-8")
+    opened = []
+
+    def open_state(config, workers, record=False):
+        if config.keywords == ["budget"]:
+            raise OSError("history store is locked")
+        opened.append(_State(config))
+        return opened[-1]
+
+    mtimes = []
+
+    def config_mtime(config_file):
+        # The file is edited between the daemon's start and its first poll.
+        if len(mtimes) == 1:
+            path.write_text(CONFIG.format("budget"), encoding="utf-8")
+        mtimes.append(float(min(len(mtimes), 1)))
+        return mtimes[-1]
+
+    def sleep(seconds):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(daemon, "open_state", open_state)
+    monkeypatch.setattr(daemon, "_config_mtime", config_mtime)
+    monkeypatch.setattr(daemon.time, "sleep", sleep)
+
+    assert daemon.run_daemon(str(path), dry_run=True) == 0
+    assert "opening its stores failed: history store is locked" in capsys.readouterr().out
+    assert [state.config.keywords for state in opened] == [["election"], ["election"]]
+    assert all(state.closed for state in opened)
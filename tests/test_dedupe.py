@@ -1,7 +1,15 @@
+import random
 from datetime import datetime, timezone
 
-from daily_digest_bot.dedupe import dedupe_items
+from daily_digest_bot.dedupe import (
+    TopKSelector,
+    canonical_url,
+    collapse_duplicates,
+    dedupe_items,
+    select_top_k,
+)
 from daily_digest_bot.feeds import NewsItem
+from daily_digest_bot.ranker import ranking_key
 
 
 def test_dedupe_keeps_highest_score() -> None:
@@ -47,3 +55,161 @@ def test_dedupe_preserves_distinct_items() -> None:
     )
     deduped = dedupe_items([item_a, item_b])
     assert len(deduped) == 2
+
+
+def test_indexed_engine_matches_pairwise() -> None:
+    rng = random.Random(7)
+    vocabulary = [
+        "india", "election", "results", "markets", "rally", "monsoon", "forecast",
+        "court", "ruling", "trade", "talks", "summit", "war", "ceasefire", "budget",
+    ]
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for idx in range(300):
+        words = rng.sample(vocabulary, rng.randint(0, 5))
+        title = " ".join(words) if words else rng.choice(["", "AI", "Q&A", "UN"])
+        items.append(
+            NewsItem(
+                title=title,
+                link=f"https://example.com/{idx}",
+                published_at=now,
+                source=f"S{idx % 4}",
+                summary="",
+                score=rng.random(),
+            )
+        )
+    for threshold in (0.3, 0.6, 0.9):
+        pairwise = dedupe_items(items, threshold=threshold, engine="pairwise")
+        indexed = dedupe_items(items, threshold=threshold, engine="indexed")
+        assert [i.link for i in indexed] == [i.link for i in pairwise]
+
+
+def test_select_top_k_matches_full_sort_and_dedupe() -> None:
+    rng = random.Random(11)
+    vocabulary = ["india", "election", "markets", "rally", "monsoon", "court", "trade", "war"]
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = [
+        NewsItem(
+            title=" ".join(rng.sample(vocabulary, rng.randint(1, 4))),
+            link=f"https://example.com/{idx}",
+            published_at=now,
+            source=f"S{idx % 3}",
+            summary="",
+            score=round(rng.random(), 2),
+        )
+        for idx in range(200)
+    ]
+    expected = dedupe_items(sorted(items, key=ranking_key))
+    for limit in (1, 5, 20, len(expected) + 5):
+        top = select_top_k(items, limit)
+        assert [i.link for i in top] == [i.link for i in expected[:limit]]
+
+
+def test_select_top_k_with_explicit_scores_leaves_items_untouched() -> None:
+    rng = random.Random(3)
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    words = ["court", "rally", "budget", "storm", "vote", "talks"]
+    items = [
+        NewsItem(
+            title=" ".join(rng.sample(words, 3)),
+            link=f"https://example.com/{n}",
+            published_at=now,
+            source="S",
+            score=0.0,
+        )
+        for n in range(60)
+    ]
+    scores = [rng.random() for _ in items]
+    picked = select_top_k(items, 5, scores=scores)
+    assert all(item.score == 0.0 for item in items)
+
+    for item, score in zip(items, scores):
+        item.score = score
+    assert picked == select_top_k(items, 5)
+
+
+def test_top_k_selector_matches_select_top_k_across_batches() -> None:
+    rng = random.Random(11)
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    words = ["court", "rally", "budget", "storm", "vote", "talks", "monsoon"]
+    items = [
+        NewsItem(
+            title=" ".join(rng.sample(words, 3)),
+            link=f"https://example.com/{n}",
+            published_at=now,
+            source="S",
+            score=rng.random(),
+        )
+        for n in range(80)
+    ]
+    selector = TopKSelector()
+    for start in range(0, len(items), 13):
+        selector.add(items[start : start + 13])
+    assert selector.select(6) == select_top_k(items, 6)
+    assert selector.select(6) == select_top_k(items, 6)  # select does not consume
+
+
+def test_canonical_url_collapses_tracking_amp_and_scheme_variants() -> None:
+    variants = [
+        "https://www.example.com/world/story-1",
+        "http://example.com/world/story-1/",
+        "https://example.com/world/story-1?utm_source=rss&utm_medium=feed#top",
+        "https://amp.example.com/world/story-1/amp",
+        "https://example.com/world/story-1.amp",
+        "https://example-com.cdn.ampproject.org/c/s/example.com/world/story-1",
+    ]
+    assert {canonical_url(link) for link in variants} == {"example.com/world/story-1"}
+    assert canonical_url("https://example.com/a?id=2&page=1") == "example.com/a?id=2&page=1"
+    assert canonical_url("https://example.com/a?page=1&id=2") == "example.com/a?id=2&page=1"
+    assert canonical_url("https://example.com/a?id=3") != canonical_url("https://example.com/a?id=2")
+
+
+def test_collapse_duplicates_keeps_best_copy_and_selector_counts_removals() -> None:
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    def item(title: str, link: str, source: str, score: float) -> NewsItem:
+        return NewsItem(title=title, link=link, published_at=now, source=source, score=score)
+
+    items = [
+        item("Monsoon arrives early", "https://a.example.com/monsoon?utm_source=x", "A", 0.4),
+        item("Monsoon arrives early!", "https://b.example.com/wire/123", "B", 0.9),
+        item("Rains hit the coast", "http://www.a.example.com/monsoon/", "A", 0.5),
+        item("Court rules on tariffs", "https://c.example.com/court", "C", 0.7),
+    ]
+    # The first item loses to the second by title. The third shares only
+    # the first item's link, which nothing kept holds, so it stays.
+    collapsed = collapse_duplicates(items)
+    assert [i.source for i in collapsed] == ["B", "A", "C"]
+    assert collapsed[1].title == "Rains hit the coast"
+    assert [i.link for i in collapse_duplicates(items, urls=False, titles=False)] == [
+        i.link for i in items
+    ]
+
+    selector = TopKSelector()
+    selector.add(items[:1])
+    selector.add(items[1:])
+    assert selector.select(5) == select_top_k(items, 5)
+    assert [i.source for i in selector.select(5)] == ["B", "C", "A"]
+    assert selector.duplicates == 1
+
+
+def test_exact_collapse_does_not_depend_on_arrival_order() -> None:
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    def item(title: str, link: str, score: float) -> NewsItem:
+        return NewsItem(title=title, link=link, published_at=now, source="S", score=score)
+
+    # A and C share a title, A and B a link; B outranks A, so A is dropped
+    # and C, sharing nothing with B, must survive in any arrival order.
+    a = item("election", "https://example.com/0", 0.0)
+    b = item("monsoon", "https://example.com/0", 0.3)
+    c = item("election", "https://example.com/1", 0.0)
+    ranked = dedupe_items(collapse_duplicates(sorted([a, b, c], key=ranking_key)))
+    assert [i.title for i in ranked] == ["monsoon", "election"]
+    for order in ([a, b, c], [c, b, a], [b, a, c]):
+        assert collapse_duplicates(order) == [i for i in order if i is not a]
+        assert select_top_k(order, 5) == ranked
+        selector = TopKSelector()
+        for one in order:
+            selector.add([one])
+        assert selector.select(5) == ranked
@@ -0,0 +1,90 @@
+import smtplib
+
+from daily_digest_bot.emailer import BulkSender, OutgoingMessage
+
+
+class _FakeSMTP:
+    """Records deliveries; ``script`` maps a recipient to errors to raise in turn."""
+
+    def __init__(self, server: "_FakeServer") -> None:
+        self.server = server
+        self.closed = False
+
+    def login(self, user, password) -> None:
+        self.server.logins += 1
+
+    def sendmail(self, from_email, to_emails, payload) -> None:
+        (recipient,) = to_emails
+        errors = self.server.script.get(recipient)
+        if errors:
+            raise errors.pop(0)
+        self.server.delivered.append(recipient)
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeServer:
+    def __init__(self, script=None) -> None:
+        self.script = script or {}
+        self.delivered = []
+        self.logins = 0
+        self.connections = []
+
+    def __call__(self, host, port) -> _FakeSMTP:
+        connection = _FakeSMTP(self)
+        self.connections.append(connection)
+        return connection
+
+
+def _messages(count: int):
+    return [OutgoingMessage(f"user{n}@example.com", "Digest", "<p>hi</p>") for n in range(count)]
+
+
+def test_bulk_sender_reuses_one_connection_across_batches() -> None:
+    server = _FakeServer()
+    with BulkSender("bot@example.com", "secret", batch_size=4, smtp_factory=server) as sender:
+        report = sender.send(_messages(10))
+    assert len(server.connections) == 1 and server.logins == 1
+    assert server.connections[0].closed
+    assert len(report.sent) == 10 and not report.failed
+    assert [(b.index, b.sent) for b in report.batches] == [(0, 4), (1, 4), (2, 2)]
+
+
+def test_bulk_sender_retries_transient_and_reconnects() -> None:
+    server = _FakeServer(
+        {
+            "user1@example.com": [smtplib.SMTPDataError(451, b"try again later")],
+            "user2@example.com": [smtplib.SMTPServerDisconnected("dropped")],
+            "user3@example.com": [smtplib.SMTPDataError(550, b"no such user")],
+        }
+    )
+    sleeps = []
+    sender = BulkSender("bot@example.com", smtp_factory=server, sleep=sleeps.append)
+    report = sender.send(_messages(5))
+    sender.close()
+
+    assert set(report.sent) == {f"user{n}@example.com" for n in (0, 1, 2, 4)}
+    assert report.failed == {"user3@example.com": "550 no such user"}
+    assert len(server.connections) == 2  # reopened after the drop
+    assert sleeps == [1.0, 1.0]  # one backoff each for the 451 and the drop
+
+
+def test_bulk_sender_rate_limits_sends() -> None:
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    sender = BulkSender(
+        "bot@example.com",
+        rate_per_second=10,
+        smtp_factory=_FakeServer(),
+        sleep=sleep,
+        clock=lambda: now[0],
+    )
+    sender.send(_messages(5))
+    assert round(now[0], 6) == 0.4
@@ -0,0 +1,300 @@
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+import os
+import threading
+import time
+
+import pytest
+
+from daily_digest_bot import feeds
+from daily_digest_bot.cache import FeedCache
+from daily_digest_bot.config import FeedConfig, FetchConfig
+from daily_digest_bot.metrics import RunMetrics
+from daily_digest_bot.session import build_session
+
+
+def _rss(title: str) -> bytes:
+    return (
+        "<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>t</title>"
+        f"<item><title>{title}</title><link>https://example.com/{title}</link>"
+        "<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+
+
+class _FakeSession:
+    def __init__(self, handler) -> None:
+        self.handler = handler
+
+    def get(self, url, timeout, headers):
+        return self.handler(url, timeout, headers)
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200, headers=None) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_concurrent_fetch_preserves_feed_order() -> None:
+    delays = {"a": 0.05, "b": 0.0, "c": 0.02}
+
+    def handler(url, timeout, headers):
+        key = url.rsplit("/", 1)[-1]
+        time.sleep(delays[key])
+        return _FakeResponse(_rss(key))
+
+    configs = [
+        FeedConfig(name=name, url=f"https://{name}.example.com/{name}")
+        for name in ("a", "b", "c")
+    ]
+    sequential = feeds.fetch_feeds(configs, max_workers=1, session=_FakeSession(handler))
+    concurrent = feeds.fetch_feeds(configs, max_workers=3, session=_FakeSession(handler))
+    assert [i.title for i in concurrent] == ["a", "b", "c"]
+    assert [i.title for i in concurrent] == [i.title for i in sequential]
+
+
+def test_per_host_limit_caps_in_flight_requests() -> None:
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(url, timeout, headers):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return _FakeResponse(_rss("x"))
+
+    configs = [
+        FeedConfig(name=f"feed{i}", url=f"https://same.example.com/{i}") for i in range(6)
+    ]
+    groups = feeds.fetch_feed_groups(
+        [configs[:3], configs[3:]],
+        max_workers=6,
+        per_host_limit=2,
+        session=_FakeSession(handler),
+    )
+    assert [len(group) for group in groups] == [3, 3]
+    assert state["peak"] <= 2
+
+
+def test_http_cache_reuses_entries_on_not_modified(tmp_path) -> None:
+    seen_headers = []
+
+    def handler(url, timeout, headers):
+        seen_headers.append(dict(headers))
+        if headers.get("If-None-Match") == "\"v1\"":
+            return _FakeResponse(b"", status_code=304)
+        return _FakeResponse(_rss("cached"), headers={"ETag": "\"v1\""})
+
+    config = [FeedConfig(name="Feed", url="https://example.com/rss")]
+
+    first_cache = FeedCache(tmp_path / "feeds.json")
+    first = feeds.fetch_feeds(config, cache=first_cache, session=_FakeSession(handler))
+    first_cache.save()
+
+    second_cache = FeedCache(tmp_path / "feeds.json")
+    second = feeds.fetch_feeds(config, cache=second_cache, session=_FakeSession(handler))
+
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == "\"v1\""
+    assert (first_cache.hits, first_cache.misses) == (0, 1)
+    assert (second_cache.hits, second_cache.misses) == (1, 0)
+    assert [(i.title, i.published_at) for i in second] == [
+        (i.title, i.published_at) for i in first
+    ]
+
+    # A 304 for entries the cache no longer holds triggers a full request.
+    lost_cache = FeedCache(tmp_path / "feeds.json")
+    lost_cache.cached_items = lambda url, source, now: None
+    refetched = feeds.fetch_feeds(config, cache=lost_cache, session=_FakeSession(handler))
+    assert seen_headers[-2]["If-None-Match"] == "\"v1\"" and seen_headers[-1] == {}
+    assert [i.title for i in refetched] == ["cached"]
+
+
+def test_feed_timeouts_are_passed_per_feed() -> None:
+    seen = []
+
+    def handler(url, timeout, headers):
+        seen.append(timeout)
+        return _FakeResponse(_rss("t"))
+
+    config = [
+        FeedConfig(
+            name="Feed", url="https://example.com/rss", connect_timeout=2.0, read_timeout=7.5
+        )
+    ]
+    feeds.fetch_feeds(config, session=_FakeSession(handler))
+    assert seen == [(2.0, 7.5)]
+
+
+def test_build_session_retries_throttled_and_server_errors() -> None:
+    fetch = FetchConfig(max_workers=4, retries=3, backoff_factor=0.25)
+    with build_session(fetch) as session:
+        adapter = session.get_adapter("https://example.com/rss")
+        retry = adapter.max_retries
+        assert retry.total == 3
+        assert retry.backoff_factor == 0.25
+        assert 429 in retry.status_forcelist and 503 in retry.status_forcelist
+        assert retry.respect_retry_after_header
+        assert adapter._pool_maxsize == 4
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_retry_after_is_capped() -> None:
+    from urllib3.response import HTTPResponse
+
+    fetch = FetchConfig(retries=2, max_retry_after=3.0)
+    with build_session(fetch) as session:
+        retry = session.get_adapter("https://example.com/rss").max_retries
+    throttled = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+    assert retry.get_retry_after(throttled) == 3.0
+    # The cap survives the copies urllib3 makes on every attempt.
+    retry = retry.increment("GET", "/rss", response=throttled)
+    assert retry.get_retry_after(throttled) == 3.0
+    assert retry.get_retry_after(HTTPResponse(status=429, headers={"Retry-After": "1"})) == 1.0
+
+
+def test_summary_is_computed_lazily_and_memoized(monkeypatch) -> None:
+    calls = []
+    original = feeds._summarize_text
+
+    def counting(text, *args, **kwargs):
+        calls.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(feeds, "_summarize_text", counting)
+    item = feeds.NewsItem(
+        title="Budget vote",
+        link="https://example.com/budget",
+        published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        source="Test",
+        raw_summary="<p>Parliament  passed the budget. Debate ran late. More detail.</p>",
+    )
+    assert item.keyword_text == "Budget vote Parliament passed the budget. Debate ran late. More detail."
+    assert calls == []
+    assert item.summary == "Parliament passed the budget. Debate ran late."
+    assert item.summary == "Parliament passed the budget. Debate ran late."
+    assert len(calls) == 1
+
+    explicit = feeds.NewsItem(
+        title="t", link="", published_at=item.published_at, source="Test", summary="given"
+    )
+    assert explicit.summary == "given"
+
+
+def test_news_item_is_compact() -> None:
+    published = datetime(2024, 1, 1, 6, 30, tzinfo=timezone.utc)
+    a = feeds.NewsItem(
+        title="a", link="", published_at=published, source="".join(["Src", "A"])
+    )
+    b = feeds.NewsItem(
+        title="b", link="", published_at=published, source="".join(["Src", "A"])
+    )
+    assert not hasattr(a, "__dict__")
+    assert a.source is b.source
+    assert a.published_at == published
+    assert a.published_ts == published.timestamp()
+
+
+def test_feed_shared_between_groups_is_fetched_once() -> None:
+    calls = []
+
+    def handler(url, timeout, headers):
+        calls.append(url)
+        return _FakeResponse(_rss(url.rsplit("/", 1)[-1]))
+
+    shared = FeedConfig(name="Shared", url="https://example.com/shared")
+    renamed = FeedConfig(name="Shared Again", url="https://example.com/shared")
+    only = FeedConfig(name="Only", url="https://example.com/only")
+    first, second = feeds.fetch_feed_groups(
+        [[shared, only], [renamed]], session=_FakeSession(handler)
+    )
+    assert sorted(calls) == ["https://example.com/only", "https://example.com/shared"]
+    assert [i.title for i in first] == ["shared", "only"]
+    assert [(i.title, i.source) for i in second] == [("shared", "Shared Again")]
+    assert second[0] is not first[0]
+
+
+def test_process_pool_parsing_matches_in_process() -> None:
+    def handler(url, timeout, headers):
+        return _FakeResponse(_rss(url.rsplit("/", 1)[-1]))
+
+    configs = [
+        FeedConfig(name=f"Feed {n}", url=f"https://example.com/f{n}") for n in range(4)
+    ]
+    inline = feeds.fetch_feeds(configs, max_workers=2, session=_FakeSession(handler))
+    pooled = feeds.fetch_feeds(
+        configs, max_workers=2, session=_FakeSession(handler), parse_workers=2
+    )
+    assert [(i.title, i.source, i.published_at) for i in pooled] == [
+        (i.title, i.source, i.published_at) for i in inline
+    ]
+
+    # A caller-owned pool is reused and left running for the next fetch.
+    with feeds.open_parse_pool(1) as pool:
+        for _ in range(2):
+            shared = feeds.fetch_feeds(
+                configs, max_workers=2, session=_FakeSession(handler), parse_pool=pool
+            )
+            assert [i.title for i in shared] == [i.title for i in inline]
+
+
+def test_dead_parse_worker_falls_back_to_in_process_parsing(capsys) -> None:
+    def handler(url, timeout, headers):
+        return _FakeResponse(_rss(url.rsplit("/", 1)[-1]))
+
+    configs = [
+        FeedConfig(name=f"Feed {n}", url=f"https://example.com/f{n}") for n in range(4)
+    ]
+    with feeds.open_parse_pool(1) as pool:
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result()
+        items = feeds.fetch_feeds(
+            configs, max_workers=2, session=_FakeSession(handler), parse_pool=pool
+        )
+        assert [item.title for item in items] == ["f0", "f1", "f2", "f3"]
+        # Only the feeds already handed to the dead pool parse in-process;
+        # the rest go to a replacement pool.
+        assert 1 <= capsys.readouterr().out.count("Parse worker died") <= 2
+        assert feeds.parse_pool_broken(pool)
+
+
+def test_iter_feed_groups_yields_in_completion_order_and_honours_deadline(tmp_path) -> None:
+    delays = {"slow": 0.5, "fast": 0.0, "mid": 0.05}
+
+    def handler(url, timeout, headers):
+        key = url.rsplit("/", 1)[-1]
+        time.sleep(delays[key])
+        return _FakeResponse(_rss(key))
+
+    feed = {name: FeedConfig(name=name, url=f"https://{name}.example.com/{name}") for name in delays}
+    groups = [[feed["slow"], feed["mid"]], [feed["fast"], feed["mid"]]]
+    cache = FeedCache(tmp_path / "feeds.json")
+    metrics = RunMetrics()
+    arrived = [
+        (group, [item.title for item in items])
+        for group, items in feeds.iter_feed_groups(
+            groups,
+            max_workers=3,
+            session=_FakeSession(handler),
+            cache=cache,
+            metrics=metrics,
+            deadline=time.monotonic() + 0.3,
+        )
+    ]
+    assert arrived[0] == (1, ["fast"])
+    assert sorted(arrived[1:]) == [(0, ["mid"]), (1, ["mid"])]
+
+    # The abandoned feed finishes later but leaves the shared stores alone.
+    time.sleep(0.4)
+    now = datetime.now(timezone.utc)
+    assert cache.cached_items(feed["slow"].url, "slow", now) is None
+    assert cache.cached_items(feed["fast"].url, "fast", now) is not None
+    assert sorted(record.name for record in metrics.feeds) == ["fast", "mid"]
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from daily_digest_bot import feeds
+from daily_digest_bot.config import FeedConfig, HealthConfig
+from daily_digest_bot.health import FeedHealthStore
+from daily_digest_bot.metrics import FeedMetrics, RunMetrics
+
+NOW = datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+
+
+class _FailingSession:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get(self, url, timeout, headers):
+        self.calls += 1
+        raise requests.ConnectTimeout("timed out")
+
+
+def test_circuit_opens_after_repeated_failures_and_probes_after_backoff(tmp_path) -> None:
+    path = tmp_path / "health.json"
+    config = HealthConfig(failure_threshold=2, backoff_minutes=10)
+    health = FeedHealthStore(path, config)
+    session = _FailingSession()
+    feed = FeedConfig(name="Down", url="https://down.example.com/rss")
+
+    for _ in range(3):
+        feeds.fetch_feeds([feed], session=session, health=health)
+    assert session.calls == 2
+    entry = health.get(feed.url)
+    assert entry.consecutive_failures == 2 and entry.skipped == 1
+
+    metrics = RunMetrics()
+    feeds.fetch_feeds([feed], session=session, health=health, metrics=metrics)
+    assert metrics.feeds[0].skipped and session.calls == 2
+
+    # Once the backoff has passed the next run probes the feed; another
+    # failure doubles the skip period.
+    health.save()
+    later = FeedHealthStore(path, config)
+    probe_time = datetime.fromtimestamp(entry.retry_at, timezone.utc)
+    assert later.allow(feed.url, probe_time)
+    later.record(FeedMetrics(name="Down", url=feed.url, error="timed out"), probe_time)
+    assert later.get(feed.url).retry_at == (probe_time + timedelta(minutes=20)).timestamp()
+    later.record(FeedMetrics(name="Down", url=feed.url, latency_seconds=0.3), probe_time)
+    assert later.allow(feed.url, probe_time)
+    assert "Down" in later.report()
+
+
+def test_read_timeout_adapts_to_observed_latency(tmp_path) -> None:
+    health = FeedHealthStore(tmp_path / "health.json", HealthConfig(min_read_timeout=1.0))
+    feed = FeedConfig(name="Fast", url="https://fast.example.com/rss", read_timeout=12)
+    assert health.timeouts(feed) == (feed.connect_timeout, 12)
+
+    for latency in (0.2, 0.3, 0.4, 0.5, 0.6):
+        health.record(FeedMetrics(name="Fast", url=feed.url, latency_seconds=latency), NOW)
+    assert health.timeouts(feed) == (feed.connect_timeout, 0.6 * 3)
+
+    # A failure restores the configured timeout for the next attempt.
+    health.record(FeedMetrics(name="Fast", url=feed.url, error="read timed out"), NOW)
+    assert health.timeouts(feed) == (feed.connect_timeout, 12)
+
+    health.record(FeedMetrics(name="Fast", url=feed.url, parse_error="bad xml"), NOW)
+    assert health.get(feed.url).parse_errors == 1
+    assert health.get(feed.url).consecutive_failures == 2
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+from daily_digest_bot.feeds import NewsItem
+from daily_digest_bot.history import SeenStore
+
+
+def _item(title: str, link: str, score: float) -> NewsItem:
+    return NewsItem(
+        title=title,
+        link=link,
+        published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        source="Test",
+        summary="",
+        score=score,
+    )
+
+
+def test_seen_store_drops_sent_items_across_runs(tmp_path) -> None:
+    path = tmp_path / "seen.sqlite3"
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    store = SeenStore(path, ttl=timedelta(hours=48), now=now)
+    store.mark_sent([_item("Sent story", "https://example.com/a/", 0.5)], now)
+    store.close()
+
+    reopened = SeenStore(path, ttl=timedelta(hours=48), now=now + timedelta(hours=1))
+    items = [
+        _item("Sent story", "http://example.com/a", 0.9),
+        _item("Fresh story", "https://example.com/b", 0.4),
+    ]
+    assert [i.title for i in reopened.filter_items(items)] == ["Fresh story"]
+    reopened.close()
+
+
+def test_seen_store_penalizes_and_expires(tmp_path) -> None:
+    path = tmp_path / "seen.sqlite3"
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    store = SeenStore(path, ttl=timedelta(hours=24), now=now)
+    store.mark_sent([_item("Sent story", "https://example.com/a", 0.5)], now)
+    items = [
+        _item("Sent story", "https://example.com/a", 0.9),
+        _item("Fresh story", "https://example.com/b", 0.4),
+    ]
+    penalized = store.filter_items(items, mode="penalize", penalty=0.3)
+    assert [i.title for i in penalized] == ["Fresh story", "Sent story"]
+    store.close()
+
+    expired = SeenStore(path, ttl=timedelta(hours=24), now=now + timedelta(hours=25))
+    assert len(expired) == 0
+    expired.close()
@@ -0,0 +1,21 @@
+from daily_digest_bot.keywords import KeywordMatcher
+
+
+def test_substring_matcher_counts_like_plain_scan() -> None:
+    keywords = ["elect", "election", "Policy", "tion", "policy"]
+    text = "Election Commission announces new policy"
+    lowered = text.lower()
+    expected = sum(1 for kw in keywords if kw.lower() in lowered)
+    assert KeywordMatcher(keywords).weighted_hits(text) == expected
+
+
+def test_whole_word_matching() -> None:
+    matcher = KeywordMatcher(["war", "war crimes", "cease"], whole_word=True)
+    assert matcher.matches("War crimes tribunal opens") == {"war", "war crimes"}
+    assert matcher.matches("Software ceasefire") == set()
+
+
+def test_keyword_weights() -> None:
+    matcher = KeywordMatcher(["economy", "budget"], weights={"budget": 2.5})
+    assert matcher.weighted_hits("Budget boosts the economy") == 3.5
+    assert not KeywordMatcher([])
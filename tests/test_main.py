@@ -0,0 +1,141 @@
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+import os
+import time
+
+import pytest
+
+from daily_digest_bot import main
+from daily_digest_bot.archive import FeedArchive
+from daily_digest_bot.config import load_config
+
+FEEDS = ("alpha", "beta", "gamma")
+TOPICS = ("election", "monsoon", "court", "tariff")
+
+
+def _rss(name: str) -> bytes:
+    items = "".join(
+        f"<item><title>{name} {TOPICS[n]} update</title>"
+        f"<link>https://{name}.example.com/{n}</link>"
+        f"<description>Story {n} from {name}.</description>"
+        f"<pubDate>Tue, 05 Mar 2024 0{n}:00:00 GMT</pubDate></item>"
+        for n in range(4)
+    )
+    return (
+        f"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>{name}</title>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+class _Response:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _Session:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    def get(self, url, timeout, headers):
+        time.sleep(self.delay)
+        return _Response(_rss(url.split("//")[1].split(".")[0]))
+
+    def close(self) -> None:
+        return None
+
+
+def _config(tmp_path) -> str:
+    feeds = "".join(
+        f"  - name: {name}\n    url: https://{name}.example.com/rss\n" for name in FEEDS
+    )
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        f"""
+world_feeds:
+{feeds}
+keywords: [election]
+output_dir: {tmp_path / "out"}
+fetch:
+  http_cache: false
+history:
+  enabled: false
+health:
+  enabled: false
+archive:
+  path: {tmp_path / "archive"}
+email:
+  from_email: a@example.com
+  to_email: b@example.com
+""",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def _run(config_path: str, session: _Session, **kwargs) -> int:
+    state = main.open_state(load_config(config_path, use_cache=False), workers=2)
+    state.session = session
+    try:
+        return main.run(config_path, dry_run=True, state=state, **kwargs)
+    finally:
+        state.close()
+
+
+def _stories(output: str) -> list:
+    return [line for line in output.splitlines() if line.startswith("  - ")]
+
+
+def test_topk_and_full_pipelines_pick_the_same_stories(tmp_path, capsys) -> None:
+    config_path = _config(tmp_path)
+    assert _run(config_path, _Session(), pipeline="topk") == 0
+    topk = _stories(capsys.readouterr().out)
+    assert _run(config_path, _Session(), pipeline="full") == 0
+    full = _stories(capsys.readouterr().out)
+    assert len(topk) == 5 and topk == full
+
+
+def test_deadline_with_nothing_fetched_skips_the_digest(tmp_path, capsys) -> None:
+    config_path = _config(tmp_path)
+    assert _run(config_path, _Session(delay=0.5), deadline_seconds=0.05) == 1
+    assert "No feed arrived" in capsys.readouterr().out
+    assert not list((tmp_path / "out").glob("*.html"))
+
+
+def test_replay_never_sends(tmp_path, capsys, monkeypatch) -> None:
+    config_path = _config(tmp_path)
+    fetched_at = datetime(2024, 3, 5, 6, tzinfo=timezone.utc)
+    archive = FeedArchive(tmp_path / "archive")
+    for name in FEEDS:
+        archive.record(f"https://{name}.example.com/rss", name, 200, {}, _rss(name), fetched_at)
+
+    def fail(**kwargs):
+        raise AssertionError("replay sent email")
+
+    monkeypatch.setattr("daily_digest_bot.emailer.send_email", fail)
+    assert main.run(config_path, dry_run=False, replay="2024-03-05") == 0
+    output = capsys.readouterr().out
+    assert "Dry run enabled" in output and len(_stories(output)) == 5
+    assert (tmp_path / "out" / "2024-03-05-replay.html").exists()
+
+
+def test_broken_parse_pool_is_restarted_between_runs(tmp_path) -> None:
+    path = tmp_path / "config.yaml"
+    config_path = _config(tmp_path)
+    path.write_text(
+        path.read_text().replace("http_cache: false", "http_cache: false\n  parse_workers: 1")
+    )
+    state = main.open_state(load_config(config_path, use_cache=False))
+    try:
+        broken = state.parse_pool
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+        restarted = state.parse_pool_for_run()
+        assert restarted is not broken and restarted.submit(len, "abc").result() == 3
+    finally:
+        state.close()
@@ -0,0 +1,45 @@
+import json
+
+import requests
+
+from daily_digest_bot import feeds
+from daily_digest_bot.config import FeedConfig
+from daily_digest_bot.metrics import RunMetrics
+
+from test_feeds import _FakeResponse, _FakeSession, _rss
+
+
+def test_fetch_records_per_feed_metrics() -> None:
+    def handler(url, timeout, headers):
+        if url.endswith("/down"):
+            raise requests.ConnectionError("refused")
+        return _FakeResponse(_rss("story"))
+
+    configs = [
+        FeedConfig(name="up", url="https://a.example.com/up"),
+        FeedConfig(name="down", url="https://b.example.com/down"),
+    ]
+    metrics = RunMetrics()
+    feeds.fetch_feeds(configs, max_workers=2, session=_FakeSession(handler), metrics=metrics)
+
+    by_name = {record.name: record for record in metrics.feeds}
+    assert by_name["up"].status == 200
+    assert by_name["up"].entries == 1
+    assert by_name["up"].bytes == len(_rss("story"))
+    assert by_name["down"].status is None
+    assert by_name["down"].entries == 0
+    assert "refused" in by_name["down"].error
+
+
+def test_run_report_json_and_prometheus(tmp_path) -> None:
+    metrics = RunMetrics()
+    with metrics.stage("dedupe", 'sec"tion', items_in=10) as stage:
+        stage.items_out = 4
+    paths = metrics.write(tmp_path / "2024-01-01", prometheus=True)
+
+    assert [path.name for path in paths] == ["2024-01-01.metrics.json", "2024-01-01.prom"]
+    report = json.loads(paths[0].read_text(encoding="utf-8"))
+    assert report["stages"][0]["items_out"] == 4
+    prom = paths[1].read_text(encoding="utf-8")
+    assert 'digest_stage_items_in{stage="dedupe",section="sec\\"tion"} 10' in prom
+    assert "# TYPE digest_run_seconds gauge" in prom
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+from daily_digest_bot import feeds
+from daily_digest_bot.cache import FeedCache
+from daily_digest_bot.config import FeedConfig, PollingConfig
+from daily_digest_bot.metrics import RunMetrics
+from daily_digest_bot.polling import PollPlanner
+
+NOW = datetime(2024, 1, 8, 12, tzinfo=timezone.utc)
+HOUR = 3600.0
+
+
+def test_planner_fetches_frequent_feeds_and_defers_slow_ones(tmp_path) -> None:
+    planner = PollPlanner(tmp_path / "plan.json", PollingConfig(max_staleness_hours=6))
+    start = NOW - timedelta(days=7)
+    planner.observe(
+        "hourly", [start.timestamp() + i * HOUR for i in range(24 * 7)], NOW - timedelta(hours=1)
+    )
+    planner.observe(
+        "weekly", [start.timestamp(), start.timestamp() + 84 * HOUR], NOW - timedelta(hours=1)
+    )
+    planner.observe("undated", [None, None], NOW - timedelta(hours=1))
+
+    assert planner.should_fetch("hourly", NOW)
+    assert not planner.should_fetch("weekly", NOW)
+    assert planner.should_fetch("undated", NOW)
+    assert planner.should_fetch("never-seen", NOW)
+    # Past the staleness limit even a slow feed is refreshed.
+    assert planner.should_fetch("weekly", NOW + timedelta(hours=6))
+
+    planner.save()
+    reloaded = PollPlanner(tmp_path / "plan.json")
+    assert reloaded.get("weekly") == planner.get("weekly")
+
+
+class _CountingSession:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.calls = 0
+
+    def get(self, url, timeout, headers):
+        self.calls += 1
+        return _Response(self.body)
+
+
+class _Response:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_deferred_feed_is_served_from_cache_without_a_request(tmp_path) -> None:
+    body = (
+        "<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>t</title>"
+        "<item><title>Old</title><link>https://example.com/old</link>"
+        "<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+        "<item><title>Older</title><link>https://example.com/older</link>"
+        "<pubDate>Mon, 25 Dec 2023 00:00:00 GMT</pubDate></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+    session = _CountingSession(body)
+    cache = FeedCache(tmp_path / "feeds.json")
+    planner = PollPlanner(tmp_path / "plan.json")
+    config = [FeedConfig(name="Weekly", url="https://example.com/rss")]
+
+    first = feeds.fetch_feeds(config, cache=cache, session=session, planner=planner)
+    metrics = RunMetrics()
+    second = feeds.fetch_feeds(
+        config, cache=cache, session=session, planner=planner, metrics=metrics
+    )
+
+    assert session.calls == 1
+    assert [item.link for item in second] == [item.link for item in first]
+    assert metrics.feeds[0].deferred and metrics.feeds[0].entries == 2
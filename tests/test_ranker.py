@@ -1,7 +1,9 @@
+import math
 from datetime import datetime, timedelta, timezone
 
 from daily_digest_bot.feeds import NewsItem
-from daily_digest_bot.ranker import rank_items
+from daily_digest_bot.keywords import KeywordMatcher
+from daily_digest_bot.ranker import ScoringBase, rank_items, score_item
 
 
 def _item(title: str, hours_ago: int) -> NewsItem:
@@ -29,3 +31,76 @@ def test_ranker_deterministic_ordering() -> None:
     item_b = _item("Beta headline", 5)
     ranked = rank_items([item_b, item_a], {"Test": 1.0}, [], now=now)
     assert [item.title for item in ranked] == ["Alpha headline", "Beta headline"]
+
+
+def test_batch_scores_match_scalar_scores() -> None:
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    weights = {"Test": 1.2}
+    keywords = ["story", "headline"]
+    scalar_items = [_item(f"Story {n}", n) for n in range(40)]
+    batch_items = [_item(f"Story {n}", n) for n in range(40)]
+    batch_items[3].date_missing = scalar_items[3].date_missing = True
+    scalar = rank_items(scalar_items, weights, keywords, now=now)
+    batch = rank_items(batch_items, weights, keywords, now=now, engine="batch")
+    assert [i.title for i in batch] == [i.title for i in scalar]
+    for a, b in zip(scalar, batch):
+        assert math.isclose(a.score, b.score, rel_tol=1e-9)
+
+
+def test_rank_limit_returns_top_k_in_order() -> None:
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    items = [_item(f"Story {n}", n % 7) for n in range(30)]
+    full = rank_items(items, {"Test": 1.0}, [], now=now)
+    top = rank_items(items, {"Test": 1.0}, [], now=now, engine="batch", limit=5)
+    assert [i.title for i in top] == [i.title for i in full[:5]]
+
+
+def test_scoring_base_matches_score_item_per_profile() -> None:
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    items = [_item(f"Election story {n}" if n % 3 else f"Budget story {n}", n) for n in range(30)]
+    for n, item in enumerate(items):
+        item.source = ("A", "B", "C")[n % 3]
+        item.date_missing = n % 7 == 0
+    base = ScoringBase(items, now=now)
+    profiles = [
+        ({"A": 1.5}, KeywordMatcher(["election"])),
+        ({"B": 0.5, "C": 2.0}, KeywordMatcher(["budget", "story"], {"budget": 2.0})),
+        ({}, KeywordMatcher([])),
+    ]
+    for weights, matcher in profiles:
+        expected = [score_item(item, weights, matcher, now=now) for item in items]
+        assert all(
+            math.isclose(a, b, rel_tol=1e-12) for a, b in zip(base.scores(weights, matcher), expected)
+        )
+
+
+def test_ranking_does_not_summarize_items(monkeypatch) -> None:
+    from daily_digest_bot import feeds
+
+    calls = []
+    original = feeds._summarize_text
+
+    def counting(text, *args, **kwargs):
+        calls.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(feeds, "_summarize_text", counting)
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    items = [
+        NewsItem(
+            title=f"Story {n}",
+            link=f"https://example.com/{n}",
+            published_at=now,
+            source="Test",
+            raw_summary="<p>Markets were calm. Traders waited. Later the budget vote passed.</p>",
+        )
+        for n in range(50)
+    ]
+    for engine in ("batch", "scalar"):
+        plain = rank_items(items, {}, [], now=now, engine=engine)[0].score
+        boosted = rank_items(items, {}, KeywordMatcher(["budget"]), now=now, engine=engine)
+        # The keyword only appears past the summary's two sentences.
+        assert boosted[0].score > plain
+    assert calls == []
+    assert boosted[0].summary == "Markets were calm. Traders waited."
+    assert len(calls) == 1
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import pytest
+from zoneinfo import ZoneInfo
+
+from daily_digest_bot.schedule import CronSchedule
+
+IST = ZoneInfo("Asia/Kolkata")
+
+
+def test_next_after_daily_schedule() -> None:
+    schedule = CronSchedule.parse("30 8 * * *")
+    assert schedule.next_after(datetime(2024, 1, 1, 7, 0, tzinfo=IST)) == datetime(
+        2024, 1, 1, 8, 30, tzinfo=IST
+    )
+    assert schedule.next_after(datetime(2024, 1, 1, 8, 30, tzinfo=IST)) == datetime(
+        2024, 1, 2, 8, 30, tzinfo=IST
+    )
+
+
+def test_next_after_steps_ranges_and_weekdays() -> None:
+    every_quarter = CronSchedule.parse("*/15 9-17 * * 1-5")
+    # Saturday 2024-01-06 rolls over to Monday 09:00.
+    assert every_quarter.next_after(datetime(2024, 1, 5, 17, 50, tzinfo=IST)) == datetime(
+        2024, 1, 8, 9, 0, tzinfo=IST
+    )
+    sunday = CronSchedule.parse("0 6 * * 7")
+    assert sunday.next_after(datetime(2024, 1, 1, tzinfo=IST)).weekday() == 6
+
+
+def test_day_of_month_or_weekday() -> None:
+    schedule = CronSchedule.parse("0 0 13 * 5")
+    # 2024-01-05 is a Friday, before the 13th.
+    assert schedule.next_after(datetime(2024, 1, 1, tzinfo=IST)).day == 5
+
+
+def test_invalid_expressions_are_rejected() -> None:
+    for expression in ("* * * *", "61 * * * *", "*/0 * * * *", "a * * * *"):
+        with pytest.raises(ValueError):
+            CronSchedule.parse(expression)
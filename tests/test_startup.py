@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+from typing import List, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules only the fetch, parse and send stages should load.
+STAGE_MODULES = {"requests", "feedparser", "smtplib", "email.mime", "urllib3"}
+
+
+def _imported_modules(*args: str) -> Set[str]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "daily_digest_bot", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: List[str] = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.append(line.rsplit("|", 1)[1].strip())
+    return set(modules)
+
+
+def _loaded(modules: Set[str], names: Set[str]) -> Set[str]:
+    return {m for m in modules if m in names or m.split(".")[0] in names}
+
+
+def test_help_skips_stage_and_config_imports() -> None:
+    modules = _imported_modules("--help")
+    assert "daily_digest_bot.main" in modules
+    assert not _loaded(modules, STAGE_MODULES | {"yaml", "zoneinfo"})
+
+
+def test_check_config_skips_network_imports(tmp_path) -> None:
+    # A copy keeps the config cache out of the repository.
+    config_path = tmp_path / "config.yaml"
+    shutil.copyfile(ROOT / "config.yaml", config_path)
+    modules = _imported_modules("--check-config", "--config", str(config_path))
+    assert not _loaded(modules, STAGE_MODULES)
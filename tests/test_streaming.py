@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+from daily_digest_bot import feeds
+from daily_digest_bot.config import FeedConfig
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>t</title>
+<item><title>Newest story</title><link>https://example.com/1</link>
+<description>&lt;p&gt;First sentence. Second sentence. Third.&lt;/p&gt;</description>
+<pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate></item>
+<item><title>Middle story</title><link>https://example.com/2</link>
+<content:encoded><![CDATA[<b>Only</b> content here.]]></content:encoded>
+<pubDate>Tue, 02 Jan 2024 06:30:00 +0530</pubDate></item>
+<item><title>Old story</title><link>https://example.com/3</link>
+<pubDate>Sat, 30 Dec 2023 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+<entry><title>Atom story</title>
+<link rel="alternate" href="https://example.com/a"/>
+<summary>Atom summary.</summary><updated>2024-01-02T08:00:00Z</updated></entry>
+</feed>"""
+
+NOW = datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+
+
+class _StreamResponse:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.served = 0
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), 7):
+            self.served += 1
+            yield self.body[start : start + 7]
+
+
+def _snapshot(items):
+    return [(i.title, i.link, i.published_at, i.summary, i.date_missing) for i in items]
+
+
+def test_stream_parser_matches_feedparser() -> None:
+    feed = FeedConfig(name="Feed", url="https://example.com/rss")
+    for body in (RSS, ATOM):
+        buffered = feeds._parse_buffered(body, feed, NOW)
+        streamed = feeds._parse_streaming(_StreamResponse(body), feed, NOW)
+        assert _snapshot(streamed) == _snapshot(buffered)
+
+
+def test_stream_parser_stops_at_cap_and_age_cutoff() -> None:
+    capped = FeedConfig(name="Feed", url="https://example.com/rss", max_items=1)
+    response = _StreamResponse(RSS)
+    items = feeds._parse_streaming(response, capped, NOW)
+    assert [i.title for i in items] == ["Newest story"]
+    assert response.served < len(RSS) // 7
+
+    recent = FeedConfig(name="Feed", url="https://example.com/rss", max_age_hours=24)
+    items = feeds._parse_streaming(_StreamResponse(RSS), recent, NOW)
+    assert [i.title for i in items] == ["Newest story", "Middle story"]
+
+
+def test_stream_parser_falls_back_on_malformed_xml() -> None:
+    body = RSS.replace(b"Newest story", b"Newest&nbsp;story")
+    feed = FeedConfig(name="Feed", url="https://example.com/rss")
+    items = feeds._parse_streaming(_StreamResponse(body), feed, NOW)
+    assert len(items) == 3